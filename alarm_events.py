@@ -0,0 +1,298 @@
+"""Debounced alarm open/close events derived from the per-camera results stream.
+
+Each refresh re-classifies every camera, so a score hovering at a threshold would flip its
+level on every publish. The pipeline turns the stream into discrete incidents instead:
+
+- hysteresis: a camera drops below a level only once its score is `hysteresis` under the
+  level's threshold (levels set by an override or suppression rule apply as they are);
+- dwell: a level change takes effect only after it has persisted for `min_dwell` seconds;
+- cooldown: an incident opening within `cooldown` seconds of the camera's last notified
+  incident is tracked but emits no events.
+
+Events go to a bounded queue (`events`), so consumers see one open and one close per
+incident however often the cameras are refreshed. `IncidentFeed` is that consumer: it
+appends every event to a JSON-lines log and hands them on to the live streams.
+"""
+
+import json
+import math
+import os
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from config import (
+    ALARM_COOLDOWN_SECONDS,
+    ALARM_EVENT_LOG_PATH,
+    ALARM_EVENT_QUEUE_SIZE,
+    ALARM_HYSTERESIS,
+    ALARM_MIN_DWELL_SECONDS,
+    ALARM_OPEN_LEVEL,
+)
+from metrics import ALARM_EVENTS, get_registry
+from results import AlarmLevel, level_from_score
+from rules import get_rules_engine
+from scoring_worker import CameraSnapshot, ResultStore
+
+
+@dataclass(frozen=True)
+class AlarmEvent:
+    # "open" or "close".
+    kind: str
+    camera_id: str
+    level: AlarmLevel
+    score: int
+    timestamp: float
+    opened_at: float
+    # Highest score seen during the incident (so far, for "open").
+    peak_score: int
+
+
+@dataclass
+class _Incident:
+    opened_at: float
+    peak_score: int
+    notified: bool
+
+
+@dataclass
+class _CameraState:
+    level: AlarmLevel = AlarmLevel.LOW
+    candidate: AlarmLevel | None = None
+    candidate_since: float = 0.0
+    incident: _Incident | None = None
+    last_notified: float = -math.inf
+
+
+class AlarmEventPipeline:
+    def __init__(
+        self,
+        thresholds: Callable[[str], tuple[int, int]],
+        open_level: AlarmLevel = AlarmLevel.from_label(ALARM_OPEN_LEVEL),
+        hysteresis: int = ALARM_HYSTERESIS,
+        min_dwell: float = ALARM_MIN_DWELL_SECONDS,
+        cooldown: float = ALARM_COOLDOWN_SECONDS,
+        queue_size: int = ALARM_EVENT_QUEUE_SIZE,
+    ) -> None:
+        self.thresholds = thresholds
+        self.open_level = open_level
+        self.hysteresis = hysteresis
+        self.min_dwell = min_dwell
+        self.cooldown = cooldown
+        self.events: queue.Queue[AlarmEvent] = queue.Queue(maxsize=queue_size)
+        self._states: dict[str, _CameraState] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, store: ResultStore) -> "AlarmEventPipeline":
+        """Observe the cameras each publish of `store` updates, from its publishing thread."""
+
+        def observe(version: int) -> None:
+            # A chunk publish leaves the other cameras' snapshots as they were; observing them
+            # again would count their old result as fresh time spent at its level.
+            snapshots = store.snapshot()
+            self.observe_snapshots({cid: s for cid, s in snapshots.items() if s.version == version})
+
+        store.subscribe(observe)
+        return self
+
+    def observe_snapshots(self, snapshots: dict[str, CameraSnapshot], now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            for camera_id, snapshot in snapshots.items():
+                self._observe(camera_id, snapshot.result.level, snapshot.result.risk_score, now)
+
+    def observe(self, camera_id: str, level: AlarmLevel, score: int, now: float | None = None) -> None:
+        with self._lock:
+            self._observe(camera_id, level, score, time.time() if now is None else now)
+
+    def open_incidents(self) -> dict[str, float]:
+        """Opening time of every camera's open incident."""
+        with self._lock:
+            return {
+                camera_id: state.incident.opened_at
+                for camera_id, state in self._states.items()
+                if state.incident is not None
+            }
+
+    def drain(self) -> list[AlarmEvent]:
+        """Every queued event, without blocking."""
+        drained = []
+        while True:
+            try:
+                drained.append(self.events.get_nowait())
+            except queue.Empty:
+                return drained
+
+    def _observe(self, camera_id: str, level: AlarmLevel, score: int, now: float) -> None:
+        state = self._states.get(camera_id)
+        if state is None:
+            # New cameras start clear, so a camera already alarming opens after the dwell too.
+            state = self._states[camera_id] = _CameraState()
+        target = self._with_hysteresis(camera_id, state.level, level, score)
+        if target == state.level:
+            state.candidate = None
+        else:
+            if state.candidate != target:
+                state.candidate, state.candidate_since = target, now
+            if now - state.candidate_since >= self.min_dwell:
+                state.level, state.candidate = target, None
+        self._update_incident(camera_id, state, score, now)
+
+    def _with_hysteresis(self, camera_id: str, current: AlarmLevel, level: AlarmLevel, score: int) -> AlarmLevel:
+        if level >= current:
+            return level
+        thresholds = self.thresholds(camera_id)
+        if level != level_from_score(score, thresholds):
+            return level  # fixed by a rule, not by the score
+        return max(level, min(current, level_from_score(score + self.hysteresis, thresholds)))
+
+    def _update_incident(self, camera_id: str, state: _CameraState, score: int, now: float) -> None:
+        incident = state.incident
+        if state.level >= self.open_level:
+            if incident is None:
+                notified = now - state.last_notified >= self.cooldown
+                incident = state.incident = _Incident(now, score, notified)
+                if notified:
+                    state.last_notified = now
+                    self._emit(AlarmEvent("open", camera_id, state.level, score, now, now, score))
+                else:
+                    ALARM_EVENTS.inc(kind="cooldown")
+            incident.peak_score = max(incident.peak_score, score)
+        elif incident is not None:
+            state.incident = None
+            if incident.notified:
+                self._emit(
+                    AlarmEvent("close", camera_id, state.level, score, now, incident.opened_at, incident.peak_score)
+                )
+
+    def _emit(self, event: AlarmEvent) -> None:
+        ALARM_EVENTS.inc(kind=event.kind)
+        while True:
+            try:
+                self.events.put_nowait(event)
+                return
+            except queue.Full:
+                # Slow consumers lose the oldest events rather than stall the scoring thread.
+                try:
+                    self.events.get_nowait()
+                    ALARM_EVENTS.inc(kind="dropped")
+                except queue.Empty:
+                    pass
+
+
+def event_payload(event: AlarmEvent) -> dict[str, str | int | float]:
+    return {
+        "kind": event.kind,
+        "camera_id": event.camera_id,
+        "level": event.level.label,
+        "score": event.score,
+        "ts": event.timestamp,
+        "opened_at": event.opened_at,
+        "peak_score": event.peak_score,
+    }
+
+
+class IncidentFeed:
+    """Consumer of a pipeline's `events`: a daemon thread drains the queue, appends each event
+    to a JSON-lines log (when `log_path` is set), and keeps the latest `keep` numbered so every
+    live stream can send the ones it has not sent yet.
+    """
+
+    def __init__(
+        self, pipeline: AlarmEventPipeline, log_path: str | None = None, keep: int = ALARM_EVENT_QUEUE_SIZE
+    ) -> None:
+        self.pipeline = pipeline
+        self.log_path = log_path
+        # Number of events recorded so far; the last one recorded is `sequence`.
+        self.sequence = 0
+        self._recent: deque[AlarmEvent] = deque(maxlen=keep)
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[int], None]] = []
+        self._thread: threading.Thread | None = None
+
+    def subscribe(self, listener: Callable[[int], None]) -> None:
+        """Call `listener(sequence)` from the feed's thread after every batch of events."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[int], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def since(self, sequence: int) -> tuple[list[AlarmEvent], int]:
+        """The kept events recorded after `sequence`, and the current sequence."""
+        with self._lock:
+            count = min(self.sequence - sequence, len(self._recent))
+            return list(self._recent)[len(self._recent) - count :], self.sequence
+
+    def record(self, events: list[AlarmEvent]) -> None:
+        if not events:
+            return
+        if self.log_path is not None:
+            self._append_log(events)
+        with self._lock:
+            self._recent.extend(events)
+            self.sequence += len(events)
+            sequence = self.sequence
+        for listener in list(self._listeners):
+            listener(sequence)
+
+    def _append_log(self, events: list[AlarmEvent]) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(event_payload(event)) + "\n" for event in events)
+        except OSError:
+            # The streams still get the events; a full or read-only disk must not stop the feed.
+            ALARM_EVENTS.inc(len(events), kind="unlogged")
+
+    def start(self) -> "IncidentFeed":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="incident-feed", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while True:
+            # Block for the next event, then take whatever else has queued up with it.
+            self.record([self.pipeline.events.get(), *self.pipeline.drain()])
+
+
+_alarm_pipeline: AlarmEventPipeline | None = None
+_alarm_pipeline_lock = threading.Lock()
+
+
+def get_alarm_pipeline() -> AlarmEventPipeline:
+    global _alarm_pipeline
+    if _alarm_pipeline is None:
+        with _alarm_pipeline_lock:
+            if _alarm_pipeline is None:
+                # Per-camera bands follow rules.json as it is reloaded.
+                _alarm_pipeline = AlarmEventPipeline(
+                    lambda camera_id: get_rules_engine().current().thresholds(camera_id)
+                )
+                get_registry().gauge(
+                    "vlm_alarm_event_queue_depth",
+                    "Alarm events waiting for consumers.",
+                    callback=lambda: {(): float(_alarm_pipeline.events.qsize())},
+                )
+    return _alarm_pipeline
+
+
+_incident_feed: IncidentFeed | None = None
+_incident_feed_lock = threading.Lock()
+
+
+def get_incident_feed() -> IncidentFeed:
+    """The process's single consumer of `get_alarm_pipeline().events`, started on first use."""
+    global _incident_feed
+    if _incident_feed is None:
+        with _incident_feed_lock:
+            if _incident_feed is None:
+                log_path = None
+                if ALARM_EVENT_LOG_PATH is not None:
+                    log_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ALARM_EVENT_LOG_PATH)
+                _incident_feed = IncidentFeed(get_alarm_pipeline(), log_path).start()
+    return _incident_feed
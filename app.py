@@ -1,41 +1,54 @@
 import base64
-import hashlib
+import functools
+import json
 import os
-from dataclasses import dataclass
+import time
 
+import numpy as np
 import streamlit as st
-from PIL import Image
+import streamlit.components.v1 as components
+from streamlit.delta_generator import DeltaGenerator
 
+from alarm_events import get_alarm_pipeline, get_incident_feed
+from asset_registry import get_asset_registry
+from camera_registry import CameraRegistry, get_camera_registry
 from config import (
-    ALARM_CARD_TITLE,
-    ALARM_MAIN_FORMAT,
-    ALARM_SUB_FORMAT,
-    BRAND_SUBTITLE,
-    BRAND_TITLE,
-    CCTV2_OVERRIDE_DESCRIPTION,
-    CCTV2_OVERRIDE_LEVEL,
-    CCTV2_OVERRIDE_SCORE,
-    CCTV_VIEW_TITLE,
-    DEFAULT_CCTV_IMAGE_PATHS_REL,
-    DEFAULT_IMAGE_CANDIDATES_REL,
-    DEFAULT_REPORT_TEMPLATE,
-    DESCRIPTION_TITLE,
-    PAGE_TITLE,
+    DEFAULT_LOCALE,
+    HISTORY_CHART_MAX_POINTS,
+    HISTORY_CHART_WINDOW_SECONDS,
+    LEVEL_ICONS,
+    LIVE_ALARM_STRIP_HTML,
+    LIVE_EVENTS_ENABLED,
+    LIVE_EVENTS_HOST,
+    LIVE_EVENTS_PORT,
+    LIVE_EVENTS_URL,
+    LOCALE_QUERY_PARAM,
+    LOCALES,
+    METRICS_ENABLED,
+    METRICS_HOST,
+    METRICS_PORT,
     PIA_LOGO_DARK_REL_PATH,
-    REPORT_TITLE,
-    REPORT_TWO_COLUMNS_HTML,
-    RISK_LEVEL_DESCRIPTIONS,
-    VLM_DESCRIPTION_TITLE,
+    TILE_REFRESH_SECONDS,
+    WALL_DEFAULT_SORT,
+    WALL_GRID_COLUMNS,
+    WALL_PAGE_SIZE,
 )
+from history_store import get_history_store
+from live_events import STREAM_PATH, start_live_event_server
+from metrics import RENDER_SECONDS, start_metrics_server
+from pipeline import BASE_DIR, load_camera_frames, score_cameras
+from report_templates import (
+    OVERRIDE_DESCRIPTION_KEY,
+    REPORT_TEMPLATE_KEY,
+    render_report,
+    render_template,
+    resolve_description,
+)
+from results import AlarmLevel, MockResult, level_css_classes, level_labels
+from scoring_worker import CameraSnapshot, ResultStore, ScoringWorker
+from thumbnails import get_thumbnail_cache
 
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DEFAULT_IMAGE_CANDIDATES = [os.path.join(BASE_DIR, rel_path) for rel_path in DEFAULT_IMAGE_CANDIDATES_REL]
-DEFAULT_CCTV_IMAGE_PATHS = {
-    cctv_id: os.path.join(BASE_DIR, rel_path)
-    for cctv_id, rel_path in DEFAULT_CCTV_IMAGE_PATHS_REL.items()
-}
-
 SYNC_ITEM_HEIGHT = 320
 IMAGE_DISPLAY_HEIGHT = 240
 
@@ -55,69 +68,66 @@ ROBOT_SVG = """
 """
 
 
-@dataclass
-class MockResult:
-    alarm_level: str
-    risk_score: int
-    description: str
-    report_markdown: str
-
-
-def _first_existing_path(paths: list[str]) -> str | None:
-    for path in paths:
-        if os.path.exists(path):
-            return path
-    return None
-
-
-def _get_file_as_base64(path: str | None) -> str | None:
-    if not path or not os.path.exists(path):
-        return None
-    with open(path, "rb") as f:
-        return base64.b64encode(f.read()).decode()
-
-
 def _get_robot_as_base64() -> str:
-    return base64.b64encode(ROBOT_SVG.encode("utf-8")).decode()
+    return get_asset_registry().get("robot-svg", lambda: base64.b64encode(ROBOT_SVG.encode("utf-8")).decode())
 
 
-def _risk_from_image_name(image_name: str) -> tuple[str, int]:
-    digest = hashlib.sha256(image_name.encode("utf-8")).hexdigest()
-    score = 45 + (int(digest[:8], 16) % 51)
+def _get_locale() -> str:
+    if "locale" not in st.session_state:
+        requested = st.query_params.get(LOCALE_QUERY_PARAM, DEFAULT_LOCALE)
+        st.session_state.locale = requested if requested in LOCALES else DEFAULT_LOCALE
+    return st.session_state.locale
 
-    if score >= 75:
-        return "High", score
-    if score >= 60:
-        return "Medium", score
-    return "Low", score
 
+def _texts() -> dict:
+    return LOCALES[_get_locale()]
 
-def _build_mock_result(image_name: str) -> MockResult:
-    level, score = _risk_from_image_name(image_name)
 
-    report_markdown = DEFAULT_REPORT_TEMPLATE
-    return MockResult(
-        alarm_level=level,
-        risk_score=score,
-        description=RISK_LEVEL_DESCRIPTIONS[level],
-        report_markdown=report_markdown,
+@st.cache_resource
+def _get_scoring_worker() -> ScoringWorker:
+    # One worker per process: page reruns only read its latest snapshot. Results hold
+    # locale-neutral keys that each session resolves in its own language.
+    score = functools.partial(
+        score_cameras,
+        descriptions={level.label: level.label for level in AlarmLevel},
+        report_template=REPORT_TEMPLATE_KEY,
+        override_description=OVERRIDE_DESCRIPTION_KEY,
     )
-
-
-def _load_cctv_images() -> dict[str, tuple[Image.Image, str]] | None:
-    fallback_path = _first_existing_path(DEFAULT_IMAGE_CANDIDATES)
-    if fallback_path is None:
+    worker = ScoringWorker(load_camera_frames, score, camera_ids=lambda: get_camera_registry().ids())
+    history = get_history_store()
+    worker.store.subscribe(lambda version: history.record(worker.store.snapshot(), version))
+    get_alarm_pipeline().attach(worker.store)
+    # Drains the alarm events into the event log and the live strip.
+    get_incident_feed()
+    return worker.start()
+
+
+@st.cache_resource
+def _start_metrics_server() -> None:
+    # One scrape endpoint per process, shared by every session.
+    if METRICS_ENABLED:
+        start_metrics_server(METRICS_HOST, int(os.environ.get("VLM_METRICS_PORT") or METRICS_PORT))
+
+
+@st.cache_resource
+def _start_live_event_server() -> str | None:
+    # One stream per process, fed by the same store as the tiles, so the strip and the wall
+    # always agree; None (no strip) if disabled or the port is held by another process.
+    if not LIVE_EVENTS_ENABLED:
+        return None
+    port = int(os.environ.get("VLM_LIVE_EVENTS_PORT") or LIVE_EVENTS_PORT)
+    if start_live_event_server(_get_scoring_worker().store, LIVE_EVENTS_HOST, port, get_incident_feed()) is None:
         return None
+    return os.environ.get("VLM_LIVE_EVENTS_URL") or LIVE_EVENTS_URL or f"http://{LIVE_EVENTS_HOST}:{port}{STREAM_PATH}"
 
-    loaded: dict[str, tuple[Image.Image, str]] = {}
-    for cctv_id, image_path in DEFAULT_CCTV_IMAGE_PATHS.items():
-        selected_path = image_path if os.path.exists(image_path) else fallback_path
-        loaded[cctv_id] = (Image.open(selected_path).convert("RGB"), os.path.basename(selected_path))
-    return loaded
 
+def _format_updated(changed_at: float) -> str:
+    # An absolute time stays correct without redrawing the tile every tick.
+    return _texts()["updated_at_format"].format(time=time.strftime("%H:%M:%S", time.localtime(changed_at)))
 
-def _inject_css() -> None:
-    css = """
+
+def _build_css() -> str:
+    return """
 <style>
   [data-testid="stAppViewContainer"] {
     background: #0A0A1A;
@@ -194,6 +204,12 @@ def _inject_css() -> None:
     font-weight: 700;
     color: #FFFFFF;
   }
+  .cctv-updated {
+    margin-left: 6px;
+    font-size: 12px;
+    font-weight: 500;
+    color: rgba(255, 255, 255, 0.6);
+  }
   .section-sep {
     margin: 10px 0;
     border-top: 1px solid rgba(255, 255, 255, 0.22);
@@ -228,6 +244,12 @@ def _inject_css() -> None:
   .alarm-low {
     background: linear-gradient(135deg, #10b981 0%, #059669 100%);
   }
+  .alarm-offline {
+    background: linear-gradient(135deg, #4b5563 0%, #374151 100%);
+  }
+  .alarm-pending {
+    background: linear-gradient(135deg, #334155 0%, #1e293b 100%);
+  }
   .desc-box {
     border-radius: 12px;
     padding: 12px 14px;
@@ -305,135 +327,369 @@ def _inject_css() -> None:
   }
 </style>
     """.replace("__IMAGE_DISPLAY_HEIGHT__", str(IMAGE_DISPLAY_HEIGHT))
+
+
+@RENDER_SECONDS.time(function="css")
+def _inject_css() -> None:
     st.markdown(
-        css,
+        get_asset_registry().get("css", _build_css),
         unsafe_allow_html=True,
     )
 
 
-def _render_brand_header() -> None:
-    pia_logo = _get_file_as_base64(PIA_LOGO_DARK_PATH)
-
-    st.markdown(
-        f"""
+def _build_brand_header_html(locale: str) -> str:
+    pia_logo = get_asset_registry().file_base64(PIA_LOGO_DARK_PATH)
+    texts = LOCALES[locale]
+    return f"""
 <div class="brand-wrap">
   <div>
-    <h1 class="brand-title">{BRAND_TITLE}</h1>
-    <p class="brand-sub">{BRAND_SUBTITLE}</p>
+    <h1 class="brand-title">{texts["brand_title"]}</h1>
+    <p class="brand-sub">{texts["brand_subtitle"]}</p>
   </div>
   <div class="brand-logos">
     {f'<img src="data:image/png;base64,{pia_logo}" alt="PIA">' if pia_logo else ""}
   </div>
 </div>
-        """,
+        """
+
+
+@RENDER_SECONDS.time(function="brand_header")
+def _render_brand_header() -> None:
+    locale = _get_locale()
+    st.markdown(
+        get_asset_registry().get(
+            ("brand-header", locale), lambda: _build_brand_header_html(locale), PIA_LOGO_DARK_PATH
+        ),
         unsafe_allow_html=True,
     )
 
 
-def _render_alarm(level: str, score: int, show_title: bool = True) -> None:
-    if level == "High":
-        css_class = "alarm-box alarm-high"
-        icon = "🚨"
-    elif level == "Medium":
-        css_class = "alarm-box alarm-medium"
-        icon = "⚠️"
-    else:
-        css_class = "alarm-box alarm-low"
-        icon = "✅"
+def _render_locale_selector() -> None:
+    _get_locale()
+    st.radio(
+        "Language",
+        list(LOCALES),
+        format_func=lambda code: LOCALES[code]["name"],
+        key="locale",
+        horizontal=True,
+        label_visibility="collapsed",
+    )
+    st.query_params[LOCALE_QUERY_PARAM] = st.session_state.locale
 
-    title_html = f'<p class="card-title">{ALARM_CARD_TITLE}</p>' if show_title else ""
-    st.markdown(
-        f"""
+
+def _build_live_strip_html(events_url: str, locale: str) -> str:
+    texts = LOCALES[locale]
+    return (
+        LIVE_ALARM_STRIP_HTML.replace("__TITLE__", texts["live_alarm_title"])
+        .replace("__LEVEL_LABELS__", json.dumps(texts["level_labels"], ensure_ascii=False))
+        .replace("__OFFLINE_LABEL__", json.dumps(texts["offline_main"], ensure_ascii=False))
+        .replace("__EVENTS_URL__", events_url)
+    )
+
+
+def _render_live_alarm_strip() -> None:
+    # Alarm badges are pushed over SSE straight into the browser, without any script rerun.
+    stream_url = _start_live_event_server()
+    if not stream_url:
+        return
+    locale = _get_locale()
+    events_url = f"{stream_url}{'&' if '?' in stream_url else '?'}{LOCALE_QUERY_PARAM}={locale}"
+    components.html(
+        get_asset_registry().get(
+            ("live-strip", events_url, locale), lambda: _build_live_strip_html(events_url, locale)
+        ),
+        height=36,
+    )
+
+
+# Per locale: the store snapshot last classified, and its cameras' (label, CSS class).
+_level_displays: dict[str, tuple[dict[str, CameraSnapshot], dict[str, tuple[str, str]]]] = {}
+
+
+def _level_display(snapshots: dict[str, CameraSnapshot], locale: str) -> dict[str, tuple[str, str]]:
+    """Localized label and CSS class of every camera in `snapshots`, in one vectorized pass.
+
+    The store swaps in a new snapshot mapping on every publish, so each publish is classified
+    once per locale and every tile on every page just looks its camera up.
+    """
+    cached = _level_displays.get(locale)
+    if cached is None or cached[0] is not snapshots:
+        codes = np.fromiter((s.result.level for s in snapshots.values()), dtype=np.uint8, count=len(snapshots))
+        display = dict(zip(snapshots, zip(level_labels(codes, locale), level_css_classes(codes))))
+        cached = _level_displays[locale] = (snapshots, display)
+    return cached[1]
+
+
+@functools.lru_cache(maxsize=1024)
+def _alarm_html(
+    label: str, css_class: str, icon: str, score: int, locale: str, show_title: bool = True
+) -> str:
+    texts = LOCALES[locale]
+    title_html = f'<p class="card-title">{texts["alarm_card_title"]}</p>' if show_title else ""
+    return f"""
 {title_html}
-<div class="{css_class}">
-  <p class="alarm-main">{ALARM_MAIN_FORMAT.format(icon=icon, level=level)}</p>
-  <p class="alarm-sub">{ALARM_SUB_FORMAT.format(score=score)}</p>
+<div class="alarm-box {css_class}">
+  <p class="alarm-main">{texts["alarm_main_format"].format(icon=icon, level=label)}</p>
+  <p class="alarm-sub">{texts["alarm_sub_format"].format(score=score)}</p>
 </div>
-        """,
-        unsafe_allow_html=True,
-    )
+        """
 
 
-def _render_description(text: str) -> None:
+@functools.lru_cache(maxsize=16)
+def _status_html(status: str, locale: str) -> str:
+    # "offline" (no frame) or "pending" (queued for the worker, no result yet).
+    texts = LOCALES[locale]
+    return f"""
+<div class="alarm-box alarm-{status}">
+  <p class="alarm-main">{texts[f"{status}_main"]}</p>
+  <p class="alarm-sub">{texts[f"{status}_sub"]}</p>
+</div>
+        """
+
+
+@RENDER_SECONDS.time(function="alarm")
+def _render_alarm(cctv_id: str, snapshots: dict[str, CameraSnapshot], show_title: bool = True) -> None:
+    locale = _get_locale()
+    label, css_class = _level_display(snapshots, locale)[cctv_id]
+    result = snapshots[cctv_id].result
+    html = _alarm_html(label, css_class, LEVEL_ICONS[result.level], result.risk_score, locale, show_title)
+    st.markdown(html, unsafe_allow_html=True)
+
+
+@functools.lru_cache(maxsize=1024)
+def _description_html(text: str, locale: str) -> str:
     robot = _get_robot_as_base64()
-    st.markdown(
-        f"""
+    texts = LOCALES[locale]
+    return f"""
 <div class="desc-box">
   <div class="desc-head">
-    <img src="data:image/svg+xml;base64,{robot}" alt="robot" />
-    <span>{DESCRIPTION_TITLE}</span>
+    <img src="data:image/svg+xml;base64,{robot}" alt="{texts["robot_alt"]}" />
+    <span>{texts["description_title"]}</span>
   </div>
   <div class="desc-text">{text}</div>
 </div>
-        """,
-        unsafe_allow_html=True,
-    )
+        """
 
 
-def _render_report_two_columns(result: MockResult) -> None:
-    st.markdown(REPORT_TITLE)
-    st.markdown(
-        REPORT_TWO_COLUMNS_HTML.format(alarm_level=result.alarm_level, risk_score=result.risk_score),
-        unsafe_allow_html=True,
+@RENDER_SECONDS.time(function="description")
+def _render_description(text: str) -> None:
+    st.markdown(_description_html(text, _get_locale()), unsafe_allow_html=True)
+
+
+@RENDER_SECONDS.time(function="report")
+def _render_report_two_columns(cctv_id: str, result: MockResult) -> None:
+    # Rendered from the pre-parsed templates; repeat reruns with the same inputs are cache hits.
+    texts = _texts()
+    st.markdown(render_template(texts["report_title"], cctv_id=cctv_id))
+    st.markdown(render_report(texts["report_html"], _get_locale(), cctv_id, result), unsafe_allow_html=True)
+
+
+def _render_camera_tile(cctv_id: str) -> None:
+    # The tile is drawn into a slot owned by the page, not by the fragment: a fragment rerun
+    # that draws nothing leaves the slot's elements on screen instead of clearing them.
+    slot = st.empty()
+    st.session_state.setdefault("tile_keys", {}).pop(cctv_id, None)
+    _refresh_camera_tile(cctv_id, slot)
+
+
+@st.fragment(run_every=TILE_REFRESH_SECONDS)
+def _refresh_camera_tile(cctv_id: str, slot: DeltaGenerator) -> None:
+    # Reruns on its own timer, but redraws only when the camera's result or frame changed
+    # (or it went offline / came back) since this session last drew it.
+    store = _get_scoring_worker().store
+    snapshots = store.snapshot()
+    snapshot = snapshots.get(cctv_id)
+    if snapshot is None:
+        key = "offline" if cctv_id in store.offline() else "pending"
+    else:
+        key = (snapshot.changed_version, snapshot.frame.version)
+    tile_keys = st.session_state.tile_keys
+    if tile_keys.get(cctv_id) == key:
+        return
+    tile_keys[cctv_id] = key
+    with slot.container():
+        if snapshot is None:
+            _render_status_tile(cctv_id, key)
+        else:
+            _draw_camera_tile(cctv_id, snapshots)
+
+
+@RENDER_SECONDS.time(function="camera_tile")
+def _draw_camera_tile(cctv_id: str, snapshots: dict[str, CameraSnapshot]) -> None:
+    snapshot = snapshots[cctv_id]
+    col_image, col_output = st.columns([1.15, 1.1], gap="small")
+    with col_image:
+        with st.container(height=SYNC_ITEM_HEIGHT):
+            st.markdown(
+                f'<p class="cctv-item-title">{cctv_id}'
+                f'<span class="cctv-updated">{_format_updated(snapshot.changed_at)}</span></p>',
+                unsafe_allow_html=True,
+            )
+            st.image(get_thumbnail_cache().get(snapshot.frame), use_container_width=True)
+    with col_output:
+        with st.container(height=SYNC_ITEM_HEIGHT):
+            st.markdown(f'<p class="cctv-item-title">{cctv_id}</p>', unsafe_allow_html=True)
+            _render_alarm(cctv_id, snapshots, show_title=False)
+            _render_description(resolve_description(snapshot.result.description, _get_locale()))
+
+
+def _render_status_tile(cctv_id: str, status: str) -> None:
+    # No result to show: offline cameras never get a stock frame, pending ones wait for the worker.
+    status_html = _status_html(status, _get_locale())
+    for column in st.columns([1.15, 1.1], gap="small"):
+        with column, st.container(height=SYNC_ITEM_HEIGHT):
+            st.markdown(f'<p class="cctv-item-title">{cctv_id}</p>', unsafe_allow_html=True)
+            st.markdown(status_html, unsafe_allow_html=True)
+
+
+@RENDER_SECONDS.time(function="history_chart")
+def _render_history_chart(cctv_id: str) -> None:
+    now = time.time()
+    history = get_history_store().range(cctv_id, now - HISTORY_CHART_WINDOW_SECONDS, now)
+    if not len(history):
+        return
+    step = max(1, -(-len(history) // HISTORY_CHART_MAX_POINTS))
+    st.markdown(_texts()["history_chart_title"])
+    st.line_chart(
+        {
+            "time": history.ts_ms[::step].astype("datetime64[ms]"),
+            "risk_score": history.score[::step],
+        },
+        x="time",
+        y="risk_score",
+        height=200,
     )
 
 
-page_icon = "🚨"
-if os.path.exists(PIA_LOGO_DARK_PATH):
-    page_icon = Image.open(PIA_LOGO_DARK_PATH)
+@st.fragment(run_every=TILE_REFRESH_SECONDS)
+def _render_report(cctv_ids: list[str]) -> None:
+    # The selector lives inside the fragment, so switching cameras reruns only the report.
+    cctv_id = st.selectbox(_texts()["report_camera_label"], cctv_ids, key="report_cctv_id", label_visibility="collapsed")
+    if cctv_id is None:
+        return
+    worker = _get_scoring_worker()
+    worker.request([cctv_id])
+    snapshot = worker.store.snapshot().get(cctv_id)
+    if snapshot is None:
+        status = "offline" if cctv_id in worker.store.offline() else "pending"
+        st.markdown(_status_html(status, _get_locale()), unsafe_allow_html=True)
+        return
+    _render_report_two_columns(cctv_id, snapshot.result)
+    _render_history_chart(cctv_id)
+
+
+def _hot_first(cctv_ids: list[str], store: ResultStore) -> list[str]:
+    # The store keeps a severity ranking of every scored camera, so this is one pass over
+    # the filtered ids; cameras without a result yet go last.
+    matching = set(cctv_ids)
+    ranked = [cctv_id for cctv_id in store.ranked() if cctv_id in matching]
+    scored = store.snapshot()
+    return ranked + [cctv_id for cctv_id in cctv_ids if cctv_id not in scored]
+
+
+def _render_wall_controls(registry: CameraRegistry, store: ResultStore) -> list[str]:
+    """Zone / tag filters, sort order and page selector; returns the current page's camera ids.
+
+    The order is kept in the session and rebuilt only when the filters or sort change, the
+    user asks for it, or (hot first) a camera's level changed, so tiles do not move between
+    pages while they refresh.
+    """
+    texts = _texts()
+    col_zone, col_tags, col_sort, col_resort, col_page = st.columns(
+        [1, 1.4, 1.2, 0.9, 0.8], gap="small", vertical_alignment="bottom"
+    )
+    zone = col_zone.selectbox(
+        texts["wall_zone_label"],
+        ["", *registry.zones()],
+        format_func=lambda zone: zone or texts["wall_all_zones"],
+        key="wall_zone",
+    )
+    tags = col_tags.multiselect(texts["wall_tags_label"], registry.tags(), key="wall_tags")
+    cctv_ids = registry.filter(zone or None, tags)
+    sort = col_sort.selectbox(
+        texts["wall_sort_label"],
+        list(texts["wall_sort_modes"]),
+        index=list(texts["wall_sort_modes"]).index(WALL_DEFAULT_SORT),
+        format_func=texts["wall_sort_modes"].get,
+        key="wall_sort",
+    )
+    resort = col_resort.button(texts["wall_resort_label"], key="wall_resort", disabled=sort != "hot")
+    if sort == "hot":
+        state = st.session_state
+        order_key = (zone, tuple(tags), store.level_version)
+        if resort or state.get("wall_order_key") != order_key:
+            state.wall_order, state.wall_order_key = _hot_first(cctv_ids, store), order_key
+        cctv_ids = state.wall_order
+    else:
+        # Switching back to hot first builds a fresh order.
+        st.session_state.pop("wall_order_key", None)
+
+    pages = max(1, -(-len(cctv_ids) // WALL_PAGE_SIZE))
+    # A narrower filter can leave the remembered page past the end.
+    if st.session_state.get("wall_page", 1) > pages:
+        st.session_state.wall_page = pages
+    page = col_page.number_input(texts["wall_page_label"], min_value=1, max_value=pages, step=1, key="wall_page")
+    page_ids = cctv_ids[(page - 1) * WALL_PAGE_SIZE : page * WALL_PAGE_SIZE]
+    st.caption(texts["wall_count_format"].format(shown=len(page_ids), total=len(cctv_ids)))
+    return page_ids
+
+
+@st.fragment(run_every=TILE_REFRESH_SECONDS)
+def _watch_wall_order() -> None:
+    # The page is rerun only when the hot-first order would change; tiles refresh on their own.
+    order_key = st.session_state.get("wall_order_key")
+    if order_key is not None and order_key[-1] != _get_scoring_worker().store.level_version:
+        st.rerun(scope="app")
+
+
+def _render_wall() -> None:
+    # Only the page's tiles are rendered, whatever the fleet size; each refreshes on its own timer.
+    worker = _get_scoring_worker()
+    page_ids = _render_wall_controls(get_camera_registry(), worker.store)
+    # The worker scores this page's cameras ahead of the rest of the fleet; until then their
+    # tiles show a placeholder.
+    worker.request(page_ids)
+    offline = worker.store.offline()
+    if page_ids and all(cctv_id in offline for cctv_id in page_ids):
+        st.error(_texts()["no_frames_error"])
+
+    texts = _texts()
+    for column in st.columns(WALL_GRID_COLUMNS, gap="medium"):
+        head_image, head_output = column.columns([1.15, 1.1], gap="small")
+        head_image.markdown(f'<p class="card-title">{texts["cctv_view_title"]}</p>', unsafe_allow_html=True)
+        head_output.markdown(f'<p class="card-title">{texts["vlm_description_title"]}</p>', unsafe_allow_html=True)
+    for row_start in range(0, len(page_ids), WALL_GRID_COLUMNS):
+        if row_start:
+            st.markdown('<div class="section-sep"></div>', unsafe_allow_html=True)
+        row = page_ids[row_start : row_start + WALL_GRID_COLUMNS]
+        for column, cctv_id in zip(st.columns(WALL_GRID_COLUMNS, gap="medium"), row):
+            with column:
+                _render_camera_tile(cctv_id)
+    if st.session_state.get("wall_sort") == "hot":
+        _watch_wall_order()
+
+
+page_icon = get_asset_registry().image(PIA_LOGO_DARK_PATH) or "🚨"
 
 st.set_page_config(
-    page_title=PAGE_TITLE,
+    page_title=_texts()["page_title"],
     page_icon=page_icon,
     layout="wide",
     initial_sidebar_state="collapsed",
 )
 
+_start_metrics_server()
 _inject_css()
 _render_brand_header()
+_render_locale_selector()
+_render_live_alarm_strip()
 
-cctv_images = _load_cctv_images()
-if cctv_images is None:
-    st.error("기본 이미지를 찾지 못했습니다. `assets/case1.png` 또는 `assets/logo`를 확인해주세요.")
-    st.stop()
-
-cctv_ids = list(DEFAULT_CCTV_IMAGE_PATHS.keys())
-results = {cctv_id: _build_mock_result(f"{cctv_images[cctv_id][1]}-{cctv_id}") for cctv_id in cctv_ids}
-for cctv_id in cctv_ids:
-    if cctv_id == "CCTV2":
-        results[cctv_id] = MockResult(
-            alarm_level=CCTV2_OVERRIDE_LEVEL,
-            risk_score=CCTV2_OVERRIDE_SCORE,  # 60~74 권장
-            description=CCTV2_OVERRIDE_DESCRIPTION,
-            report_markdown=DEFAULT_REPORT_TEMPLATE,
-        )
-    else:
-        results[cctv_id] = _build_mock_result(f"{cctv_images[cctv_id][1]}-{cctv_id}")
-        
-col_image, col_output, col_report = st.columns([1.15, 1.1, 1.75], gap="small")
+col_wall, col_report = st.columns([2.25, 1.75], gap="small")
 
-with col_image:
-    with st.container(border=True):
-        st.markdown(f'<p class="card-title">{CCTV_VIEW_TITLE}</p>', unsafe_allow_html=True)
-        for idx, cctv_id in enumerate(cctv_ids):
-            with st.container(height=SYNC_ITEM_HEIGHT):
-                st.markdown(f'<p class="cctv-item-title">{cctv_id}</p>', unsafe_allow_html=True)
-                st.image(cctv_images[cctv_id][0], use_container_width=True)
-            if idx < len(cctv_ids) - 1:
-                st.markdown('<div class="section-sep"></div>', unsafe_allow_html=True)
-
-with col_output:
+with col_wall:
     with st.container(border=True):
-        st.markdown(f'<p class="card-title">{VLM_DESCRIPTION_TITLE}</p>', unsafe_allow_html=True)
-        for idx, cctv_id in enumerate(cctv_ids):
-            result = results[cctv_id]
-            with st.container(height=SYNC_ITEM_HEIGHT):
-                st.markdown(f'<p class="cctv-item-title">{cctv_id}</p>', unsafe_allow_html=True)
-                _render_alarm(result.alarm_level, result.risk_score, show_title=False)
-                _render_description(result.description)
-            if idx < len(cctv_ids) - 1:
-                st.markdown('<div class="section-sep"></div>', unsafe_allow_html=True)
+        _render_wall()
 
 with col_report:
     with st.container(border=True):
-        _render_report_two_columns(results[cctv_ids[0]])
+        _render_report(get_camera_registry().ids())
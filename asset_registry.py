@@ -0,0 +1,74 @@
+"""Per-process registry of static page assets, rebuilt only when their source file changes."""
+
+import base64
+import os
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from PIL import Image
+
+
+T = TypeVar("T")
+
+
+def _file_version(path: str | None) -> tuple[int, int] | None:
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_base64(path: str) -> str | None:
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return base64.b64encode(f.read()).decode()
+
+
+def _open_image(path: str) -> Image.Image | None:
+    if not os.path.exists(path):
+        return None
+    with Image.open(path) as image:
+        image.load()
+        return image.copy()
+
+
+class AssetRegistry:
+    """Memoizes assets by name; file-backed entries are rebuilt when the file's mtime/size changes."""
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, tuple[tuple[int, int] | None, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: Hashable, build: Callable[[], T], path: str | None = None) -> T:
+        version = _file_version(path)
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        value = build()
+        with self._lock:
+            self._entries[name] = (version, value)
+        return value
+
+    def file_base64(self, path: str) -> str | None:
+        return self.get(("base64", path), lambda: _read_base64(path), path)
+
+    def image(self, path: str) -> Image.Image | None:
+        return self.get(("image", path), lambda: _open_image(path), path)
+
+
+_asset_registry: AssetRegistry | None = None
+_asset_registry_lock = threading.Lock()
+
+
+def get_asset_registry() -> AssetRegistry:
+    global _asset_registry
+    if _asset_registry is None:
+        with _asset_registry_lock:
+            if _asset_registry is None:
+                _asset_registry = AssetRegistry()
+    return _asset_registry
@@ -0,0 +1,291 @@
+"""Headless batch scoring of archived image / video directories to JSONL (optionally Parquet).
+
+    python batch_score.py /archive/cctv scores.jsonl
+    python batch_score.py /archive/cctv scores.jsonl --backend onnx --parquet scores.parquet
+
+Decoder threads walk the tree and sample frames into a bounded queue; the main thread
+scores them in batches through the configured inference backend and appends one JSON
+line per frame. Every fully written source is recorded in `<output>.checkpoint`, and a
+rerun skips those sources, so an interrupted job resumes where it stopped.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from PIL import Image
+
+from config import (
+    BATCH_DECODE_WORKERS,
+    BATCH_PARQUET_ROW_GROUP,
+    BATCH_QUEUE_SIZE,
+    BATCH_SIZE,
+    BATCH_VIDEO_SAMPLE_FPS,
+    IMAGE_EXTENSIONS,
+)
+from inference import Frame, InferenceBackend, create_backend
+from results import classify_scores, level_labels
+from video_source import VIDEO_EXTENSIONS, open_video, sample_video
+
+
+@dataclass(frozen=True)
+class SourceFrame:
+    source: str
+    # Frame index and position (seconds) within a video; None for still images.
+    index: int | None
+    timestamp: float | None
+    frame: Frame
+
+
+@dataclass(frozen=True)
+class SourceDone:
+    source: str
+    error: str | None = None
+
+
+def iter_sources(root: str) -> Iterator[str]:
+    """Image and video files under `root`, as sorted paths relative to it."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.lower().endswith(IMAGE_EXTENSIONS + VIDEO_EXTENSIONS):
+                yield os.path.relpath(os.path.join(dirpath, filename), root)
+
+
+def _decode_source(
+    root: str, source: str, sample_fps: float, keyframes_only: bool
+) -> Iterator[tuple[int | None, float | None, Image.Image]]:
+    path = os.path.join(root, source)
+    if source.lower().endswith(VIDEO_EXTENSIONS):
+        for index, timestamp, array in sample_video(open_video(path), sample_fps, keyframes_only):
+            yield index, timestamp, Image.fromarray(array)
+        return
+    with Image.open(path) as image:
+        yield None, None, image.convert("RGB")
+
+
+def _decoder(
+    root: str,
+    sources: "queue.Queue[str | None]",
+    frames: "queue.Queue[SourceFrame | SourceDone | None]",
+    sample_fps: float,
+    keyframes_only: bool,
+) -> None:
+    while (source := sources.get()) is not None:
+        error = None
+        try:
+            for index, timestamp, image in _decode_source(root, source, sample_fps, keyframes_only):
+                key = source if index is None else f"{source}#{index}"
+                path = os.path.join(root, source) if index is None else None
+                # Blocks while the scorer is behind, which bounds memory to the queue size.
+                frames.put(SourceFrame(source, index, timestamp, Frame(key, image, path)))
+        except Exception as exc:  # one unreadable file must not stop the run
+            error = f"{type(exc).__name__}: {exc}"
+        frames.put(SourceDone(source, error))
+    frames.put(None)
+
+
+def read_checkpoint(path: str) -> set[str]:
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+
+def _drop_unfinished_rows(output: str, done: set[str]) -> None:
+    """Remove rows of sources that were cut off mid-way, so resuming never duplicates them."""
+    if not os.path.exists(output):
+        return
+    with open(output, encoding="utf-8") as src, open(f"{output}.tmp", "w", encoding="utf-8") as dst:
+        for line in src:
+            try:
+                if json.loads(line)["source"] in done:
+                    dst.write(line)
+            except (ValueError, KeyError):
+                continue  # a torn last line from the interrupted run
+    os.replace(f"{output}.tmp", output)
+
+
+class BatchScorer:
+    """Consumes decoded frames, scores them `batch_size` at a time and streams rows out."""
+
+    def __init__(self, backend: InferenceBackend, output: str, batch_size: int = BATCH_SIZE) -> None:
+        self.backend = backend
+        self.batch_size = batch_size
+        self.checkpoint_path = f"{output}.checkpoint"
+        self.rows = 0
+        self.sources = 0
+        self.errors = 0
+        self._out = open(output, "a", encoding="utf-8")
+        self._checkpoint = open(self.checkpoint_path, "a", encoding="utf-8")
+        self._batch: list[SourceFrame] = []
+        # Sources whose last frame has been queued; checkpointed once their rows are written.
+        self._finished: list[str] = []
+
+    def add(self, item: SourceFrame | SourceDone) -> None:
+        if isinstance(item, SourceDone):
+            if item.error is not None:
+                self.errors += 1
+                print(f"{item.source}: {item.error}", file=sys.stderr)
+            self._finished.append(item.source)
+            return
+        self._batch.append(item)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._batch:
+            scores = self.backend.score_batch([item.frame for item in self._batch])
+            labels = level_labels(classify_scores(scores)).tolist()
+            for item, score, label in zip(self._batch, scores, labels):
+                row = {
+                    "source": item.source,
+                    "frame": item.index,
+                    "timestamp": item.timestamp,
+                    "risk_score": score,
+                    "alarm_level": label,
+                    "model_version": self.backend.model_version,
+                }
+                self._out.write(json.dumps(row, ensure_ascii=False) + "\n")
+            self.rows += len(self._batch)
+            self._batch.clear()
+            self._out.flush()
+        # Every frame of these sources was queued before their SourceDone, so all are written now.
+        for source in self._finished:
+            self._checkpoint.write(source + "\n")
+        self.sources += len(self._finished)
+        self._finished.clear()
+        self._checkpoint.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._out.close()
+        self._checkpoint.close()
+
+
+def score_directory(
+    root: str,
+    output: str,
+    backend: InferenceBackend,
+    workers: int = BATCH_DECODE_WORKERS,
+    batch_size: int = BATCH_SIZE,
+    queue_size: int = BATCH_QUEUE_SIZE,
+    sample_fps: float = BATCH_VIDEO_SAMPLE_FPS,
+    keyframes_only: bool = False,
+) -> BatchScorer:
+    done = read_checkpoint(f"{output}.checkpoint")
+    _drop_unfinished_rows(output, done)
+    workers = workers or os.cpu_count() or 1
+
+    sources: queue.Queue[str | None] = queue.Queue()
+    frames: queue.Queue[SourceFrame | SourceDone | None] = queue.Queue(maxsize=queue_size)
+    for source in iter_sources(root):
+        if source not in done:
+            sources.put(source)
+    for _ in range(workers):
+        sources.put(None)
+    threads = [
+        threading.Thread(
+            target=_decoder,
+            args=(root, sources, frames, sample_fps, keyframes_only),
+            name=f"batch-decoder-{i}",
+            daemon=True,
+        )
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    scorer = BatchScorer(backend, output, batch_size)
+    running = workers
+    try:
+        while running:
+            try:
+                item = frames.get(timeout=1.0)
+            except queue.Empty:
+                # Decoders are slow (e.g. long seeks): score what is there instead of idling.
+                scorer.flush()
+                continue
+            if item is None:
+                running -= 1
+            else:
+                scorer.add(item)
+    finally:
+        scorer.close()
+    return scorer
+
+
+def write_parquet(jsonl_path: str, parquet_path: str, row_group: int = BATCH_PARQUET_ROW_GROUP) -> None:
+    """Convert the JSONL output to Parquet `row_group` rows at a time (needs pyarrow)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema(
+        [
+            ("source", pa.string()),
+            ("frame", pa.int64()),
+            ("timestamp", pa.float64()),
+            ("risk_score", pa.uint8()),
+            ("alarm_level", pa.string()),
+            ("model_version", pa.string()),
+        ]
+    )
+    with open(jsonl_path, encoding="utf-8") as f, pq.ParquetWriter(parquet_path, schema) as writer:
+        rows: list[dict] = []
+        for line in f:
+            rows.append(json.loads(line))
+            if len(rows) >= row_group:
+                writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+                rows.clear()
+        if rows:
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("root", help="directory tree of images and video clips")
+    parser.add_argument("output", help="JSONL output; appended to and resumed across runs")
+    parser.add_argument("--backend", help="mock, onnx or remote (default: VLM_INFERENCE_BACKEND / config)")
+    parser.add_argument("--workers", type=int, default=BATCH_DECODE_WORKERS, help="decoder threads")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--queue-size", type=int, default=BATCH_QUEUE_SIZE)
+    parser.add_argument("--fps", type=float, default=BATCH_VIDEO_SAMPLE_FPS, help="video sampling rate")
+    parser.add_argument("--keyframes", action="store_true", help="score only video keyframes")
+    parser.add_argument("--parquet", help="also write the full output as Parquet when done (needs pyarrow)")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.root):
+        parser.error(f"{args.root} is not a directory")
+    if args.parquet and importlib.util.find_spec("pyarrow") is None:
+        parser.error("--parquet needs pyarrow (pip install pyarrow)")
+
+    started = time.perf_counter()
+    scorer = score_directory(
+        args.root,
+        args.output,
+        create_backend(args.backend),
+        workers=args.workers,
+        batch_size=args.batch_size,
+        queue_size=args.queue_size,
+        sample_fps=args.fps,
+        keyframes_only=args.keyframes,
+    )
+    elapsed = time.perf_counter() - started
+    print(
+        f"scored {scorer.rows} frames from {scorer.sources} sources in {elapsed:.1f}s "
+        f"({scorer.rows / max(elapsed, 1e-9):.1f} frames/s, {scorer.errors} unreadable)"
+    )
+    if args.parquet:
+        write_parquet(args.output, args.parquet)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+"""Headless benchmark of the dashboard hot paths at growing camera counts.
+
+    python benchmarks/bench_dashboard.py                    # 4 / 16 / 64 / 256 cameras, compare to baseline
+    python benchmarks/bench_dashboard.py --cameras 16 64 --update-baseline
+
+Every camera count runs in its own subprocess (so peak RSS is per size) against a set of
+synthetic 1280x720 JPEG cameras. Per size it times frame loading (cold and warm), scoring,
+report rendering, and the first run and reruns of app.py through Streamlit's AppTest. It
+records latency percentiles, peak RSS, and the bytes the page emits (element protos plus
+the thumbnails of the rendered page). `score_ms` scores every camera afresh, with the change
+gate and result cache emptied; `score_warm_ms` is the same call once both are filled. Results are compared to `baseline.json` and the exit code is non-zero on a
+regression beyond `--tolerance`.
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_CAMERA_COUNTS = (4, 16, 64, 256)
+FRAME_SIZE = (1280, 720)
+# Metrics compared against the baseline; everything else is informational.
+CHECKED_METRICS = ("load_warm_ms.p50", "score_ms.p50", "rerun_ms.p50", "rerun_ms.p95", "peak_rss_mb")
+
+
+def _make_cameras(directory: str, count: int) -> dict[str, str]:
+    rng = np.random.default_rng(0)
+    base = np.linspace(0, 255, FRAME_SIZE[0], dtype=np.float32)[None, :, None]
+    cameras = {}
+    for i in range(count):
+        # A distinct gradient plus noise per camera, so hashes, gates and caches see different frames.
+        tint = rng.uniform(0.3, 1.0, size=3).astype(np.float32)
+        noise = rng.integers(0, 32, size=(FRAME_SIZE[1], FRAME_SIZE[0], 1), dtype=np.uint8)
+        pixels = np.clip(base * tint + noise, 0, 255).astype(np.uint8)
+        path = os.path.join(directory, f"cam{i:04d}.jpg")
+        Image.fromarray(np.broadcast_to(pixels, (FRAME_SIZE[1], FRAME_SIZE[0], 3))).save(path, quality=85)
+        cameras[f"CCTV{i + 1}"] = path
+    return cameras
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    values = np.asarray(samples) * 1000
+    return {
+        "p50": round(float(np.percentile(values, 50)), 3),
+        "p95": round(float(np.percentile(values, 95)), 3),
+        "p99": round(float(np.percentile(values, 99)), 3),
+        "n": len(samples),
+    }
+
+
+def _timed(fn, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def _emitted_bytes(at) -> int:
+    total = 0
+    stack = [at._tree]
+    while stack:
+        node = stack.pop()
+        proto = getattr(node, "proto", None)
+        if proto is not None and hasattr(proto, "ByteSize"):
+            total += proto.ByteSize()
+        stack.extend(getattr(node, "children", {}).values())
+    return total
+
+
+def run_size(count: int, repeat: int) -> dict:
+    """Benchmark one camera count in this process; meant to run in a fresh subprocess."""
+    workdir = tempfile.mkdtemp(prefix=f"bench-{count}-")
+    sys.path.insert(0, ROOT)
+    import config
+
+    # Synthetic cameras, private history and alarm event files, no live event or metrics
+    # server, and no background rescoring mid-measurement.
+    cameras = _make_cameras(workdir, count)
+    registry = os.path.join(workdir, "cameras.json")
+    with open(registry, "w", encoding="utf-8") as f:
+        json.dump({"cameras": [{"id": cctv_id, "source": path} for cctv_id, path in cameras.items()]}, f)
+    os.environ["VLM_CAMERA_REGISTRY"] = registry
+    config.HISTORY_DIR = os.path.join(workdir, "history")
+    config.ALARM_EVENT_LOG_PATH = os.path.join(workdir, "alarm_events.jsonl")
+    config.LIVE_EVENTS_ENABLED = False
+    config.METRICS_ENABLED = False
+    config.SCORING_INTERVAL_SECONDS = 3600.0
+
+    from change_gate import get_change_gate
+    from frame_cache import get_frame_cache
+    from inference import get_backend
+    from pipeline import load_camera_frames, score_cameras
+    from report_templates import REPORT_TEMPLATE_KEY, render_report
+    from results import AlarmLevel
+    from thumbnails import get_thumbnail_cache
+    from streamlit.testing.v1 import AppTest
+
+    frame_cache = get_frame_cache()
+
+    def load_cold() -> None:
+        frame_cache.stats.clear()
+        load_camera_frames()
+
+    load_cold_samples = _timed(load_cold, max(1, repeat // 4))
+    load_warm_samples = _timed(load_camera_frames, repeat)
+
+    # Every synthetic camera has a frame, so none is offline.
+    frames = load_camera_frames()
+    descriptions = {level.label: level.label for level in AlarmLevel}
+    score = lambda: score_cameras(frames, descriptions, REPORT_TEMPLATE_KEY, "override")  # noqa: E731
+    backend = get_backend()
+
+    def score_cold() -> None:
+        # Otherwise every sample after the first is served by the change gate.
+        get_change_gate().clear()
+        if hasattr(backend, "cache"):
+            backend.cache.clear()
+        score()
+
+    score_samples = _timed(score_cold, repeat)
+    score_warm_samples = _timed(score, repeat)
+    results = score()
+    report_samples = _timed(
+        lambda: [render_report(config.REPORT_TWO_COLUMNS_HTML, "en", cid, r) for cid, r in results.items()],
+        repeat,
+    )
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=600)
+    started = time.perf_counter()
+    at.run()
+    first_run = time.perf_counter() - started
+    if at.exception:
+        raise RuntimeError(f"app.py raised: {[e.value for e in at.exception]}")
+    rerun_samples = _timed(at.run, repeat)
+
+    # Only the first page's tiles carry a thumbnail, in the hot-first order the session keeps.
+    order = at.session_state["wall_order"] if "wall_order" in at.session_state else list(cameras)
+    thumbnails = get_thumbnail_cache()
+    thumbnail_bytes = sum(len(thumbnails.get(frames[cid])) for cid in order[: config.WALL_PAGE_SIZE])
+    return {
+        "cameras": count,
+        "load_cold_ms": _percentiles(load_cold_samples),
+        "load_warm_ms": _percentiles(load_warm_samples),
+        "score_ms": _percentiles(score_samples),
+        "score_warm_ms": _percentiles(score_warm_samples),
+        "report_render_ms": _percentiles(report_samples),
+        "first_run_ms": round(first_run * 1000, 3),
+        "rerun_ms": _percentiles(rerun_samples),
+        # ru_maxrss is in kilobytes on Linux.
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "emitted_bytes": {"elements": _emitted_bytes(at), "thumbnails": thumbnail_bytes},
+    }
+
+
+def _metric(result: dict, name: str) -> float:
+    value = result
+    for part in name.split("."):
+        value = value[part]
+    return float(value)
+
+
+def compare(results: list[dict], baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for result in results:
+        base = baseline.get(str(result["cameras"]))
+        if base is None:
+            continue
+        for name in CHECKED_METRICS:
+            current, reference = _metric(result, name), _metric(base, name)
+            if reference > 0 and current > reference * tolerance:
+                regressions.append(
+                    f"{result['cameras']} cameras: {name} {current:.1f} vs baseline {reference:.1f} "
+                    f"(x{current / reference:.2f})"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cameras", type=int, nargs="+", default=list(DEFAULT_CAMERA_COUNTS))
+    parser.add_argument("--repeat", type=int, default=20, help="samples per timed path")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="allowed ratio to the baseline")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", help="also write the results here")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child is not None:
+        print(json.dumps(run_size(args.child, args.repeat)))
+        return 0
+
+    results = []
+    for count in args.cameras:
+        completed = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", str(count), "--repeat", str(args.repeat)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        results.append(result)
+        print(
+            f"{count:>4} cameras  load {result['load_warm_ms']['p50']:>8.1f} ms  "
+            f"score {result['score_ms']['p50']:>8.1f} ms  "
+            f"rerun p50/p95 {result['rerun_ms']['p50']:>8.1f}/{result['rerun_ms']['p95']:.1f} ms  "
+            f"rss {result['peak_rss_mb']:>7.1f} MB  "
+            f"emitted {sum(result['emitted_bytes'].values()) / 1024:>8.1f} KiB"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baseline = json.load(f)
+    if args.update_baseline:
+        baseline.update({str(result["cameras"]): result for result in results})
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline updated: {BASELINE_PATH}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Camera registry (id, source, zone, tags) loaded from a JSON, YAML or SQLite file.
+
+    {"cameras": [{"id": "CCTV1", "source": "assets/case1.png", "zone": "assembly", "tags": ["indoor"]}]}
+
+A SQLite registry has a `cameras(id, source, zone, tags)` table with comma-separated tags.
+Relative sources are resolved against the registry file's directory; stream URLs are kept.
+"""
+
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from config import CAMERA_REGISTRY_PATH
+from video_source import is_stream_uri
+
+
+SQLITE_EXTENSIONS = (".sqlite", ".sqlite3", ".db")
+
+
+@dataclass(frozen=True)
+class Camera:
+    id: str
+    # Image path, video file or stream URL.
+    source: str
+    zone: str | None = None
+    tags: tuple[str, ...] = ()
+
+
+class CameraRegistry:
+    """Cameras in registry order, indexed by id, zone and tag for filtering the wall."""
+
+    def __init__(self, cameras: Iterable[Camera] = ()) -> None:
+        self._cameras: dict[str, Camera] = {}
+        self._by_zone: dict[str, list[str]] = {}
+        self._by_tag: dict[str, set[str]] = {}
+        for camera in cameras:
+            if camera.id in self._cameras:
+                raise ValueError(f"duplicate camera id {camera.id!r}")
+            self._cameras[camera.id] = camera
+            if camera.zone:
+                self._by_zone.setdefault(camera.zone, []).append(camera.id)
+            for tag in camera.tags:
+                self._by_tag.setdefault(tag, set()).add(camera.id)
+
+    def __len__(self) -> int:
+        return len(self._cameras)
+
+    def __contains__(self, cctv_id: str) -> bool:
+        return cctv_id in self._cameras
+
+    def get(self, cctv_id: str) -> Camera | None:
+        return self._cameras.get(cctv_id)
+
+    def ids(self) -> list[str]:
+        return list(self._cameras)
+
+    def zones(self) -> list[str]:
+        return sorted(self._by_zone)
+
+    def tags(self) -> list[str]:
+        return sorted(self._by_tag)
+
+    def zone_map(self) -> dict[str, str]:
+        return {cctv_id: camera.zone for cctv_id, camera in self._cameras.items() if camera.zone}
+
+    def filter(self, zone: str | None = None, tags: Iterable[str] = ()) -> list[str]:
+        """Ids in `zone` carrying every tag in `tags`, in registry order."""
+        ids = self._by_zone.get(zone, []) if zone else self._cameras
+        tags = list(tags)
+        if not tags:
+            return list(ids)
+        # Intersect the smallest tag sets first; most filters end up tiny.
+        required = sorted((self._by_tag.get(tag, set()) for tag in tags), key=len)
+        matches = set.intersection(*required)
+        return [cctv_id for cctv_id in ids if cctv_id in matches]
+
+
+def _resolve_source(source: str, base_dir: str) -> str:
+    if is_stream_uri(source) or os.path.isabs(source):
+        return source
+    return os.path.join(base_dir, source)
+
+
+def _camera(raw: dict, base_dir: str) -> Camera:
+    tags = raw.get("tags") or ()
+    if isinstance(tags, str):
+        tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
+    return Camera(
+        id=str(raw["id"]),
+        source=_resolve_source(str(raw["source"]), base_dir),
+        zone=raw.get("zone") or None,
+        tags=tuple(tags),
+    )
+
+
+def load_registry(path: str) -> CameraRegistry:
+    base_dir = os.path.dirname(os.path.abspath(path))
+    if path.lower().endswith(SQLITE_EXTENSIONS):
+        # The connection's own context manager only ends the transaction; closing() closes it.
+        with contextlib.closing(sqlite3.connect(f"file:{path}?mode=ro", uri=True)) as db:
+            db.row_factory = sqlite3.Row
+            rows = [dict(row) for row in db.execute("SELECT id, source, zone, tags FROM cameras ORDER BY rowid")]
+    else:
+        with open(path, encoding="utf-8") as f:
+            if path.lower().endswith((".yaml", ".yml")):
+                import yaml  # optional: only needed for YAML registries
+
+                data = yaml.safe_load(f) or {}
+            else:
+                data = json.load(f)
+        rows = data.get("cameras", [])
+    return CameraRegistry(_camera(row, base_dir) for row in rows)
+
+
+def registry_path() -> str:
+    return os.environ.get("VLM_CAMERA_REGISTRY") or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), CAMERA_REGISTRY_PATH
+    )
+
+
+_camera_registry: CameraRegistry | None = None
+_camera_registry_lock = threading.Lock()
+
+
+def get_camera_registry() -> CameraRegistry:
+    global _camera_registry
+    if _camera_registry is None:
+        with _camera_registry_lock:
+            if _camera_registry is None:
+                path = registry_path()
+                _camera_registry = load_registry(path) if os.path.exists(path) else CameraRegistry()
+    return _camera_registry
@@ -0,0 +1,130 @@
+"""Scene-change gate that skips risk scoring for cameras whose frame barely changed."""
+
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from PIL import Image, ImageChops, ImageStat
+
+from config import (
+    CHANGE_GATE_MAX_SKIP_SECONDS,
+    CHANGE_GATE_METHOD,
+    CHANGE_GATE_SIZE,
+    CHANGE_GATE_THRESHOLD,
+)
+from inference import Frame
+from metrics import STAGE_SECONDS, register_cache
+from results import MockResult
+
+
+HISTOGRAM_BINS = 64
+
+
+@dataclass
+class _Scored:
+    signature: Image.Image
+    result: MockResult
+    scored_at: float
+
+
+def _pixel_distance(a: Image.Image, b: Image.Image) -> float:
+    return ImageStat.Stat(ImageChops.difference(a, b)).mean[0] / 255.0
+
+
+def _histogram_distance(a: Image.Image, b: Image.Image) -> float:
+    # Total variation distance between normalized grayscale histograms, in [0, 1].
+    hist_a = a.point(lambda value: value * HISTOGRAM_BINS // 256).histogram()[:HISTOGRAM_BINS]
+    hist_b = b.point(lambda value: value * HISTOGRAM_BINS // 256).histogram()[:HISTOGRAM_BINS]
+    total_a, total_b = sum(hist_a) or 1, sum(hist_b) or 1
+    return sum(abs(x / total_a - y / total_b) for x, y in zip(hist_a, hist_b)) / 2
+
+
+DISTANCES: dict[str, Callable[[Image.Image, Image.Image], float]] = {
+    "pixel": _pixel_distance,
+    "histogram": _histogram_distance,
+}
+
+
+class ChangeGate:
+    """Forwards a camera's frame to scoring only when it differs enough from the last scored one.
+
+    Frames are compared as `size` grayscale thumbnails, by mean absolute pixel difference
+    or histogram distance, both normalized to [0, 1]. Unchanged cameras reuse their previous
+    result, but are re-scored at least every `max_skip_seconds` so results never go stale forever.
+    """
+
+    def __init__(
+        self,
+        threshold: float = CHANGE_GATE_THRESHOLD,
+        method: str = CHANGE_GATE_METHOD,
+        size: tuple[int, int] = CHANGE_GATE_SIZE,
+        max_skip_seconds: float = CHANGE_GATE_MAX_SKIP_SECONDS,
+    ) -> None:
+        if method not in DISTANCES:
+            raise ValueError(f"Unknown change gate method {method!r}; expected one of {sorted(DISTANCES)}.")
+        self.threshold = threshold
+        self.size = size
+        self.max_skip_seconds = max_skip_seconds
+        self._distance = DISTANCES[method]
+        self._last: dict[str, _Scored] = {}
+        self._lock = threading.Lock()
+        self.forwarded = 0
+        self.skipped = 0
+
+    def signature(self, image: Image.Image) -> Image.Image:
+        return image.convert("L").resize(self.size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+
+    def _is_unchanged(self, previous: _Scored | None, signature: Image.Image, now: float) -> bool:
+        if previous is None or now - previous.scored_at >= self.max_skip_seconds:
+            return False
+        return self._distance(previous.signature, signature) < self.threshold
+
+    def run(
+        self,
+        camera_ids: Sequence[str],
+        frames: Sequence[Frame],
+        score: Callable[[list[Frame]], list[MockResult]],
+    ) -> list[MockResult]:
+        """Score only the changed frames with `score` and return one result per camera."""
+        now = time.monotonic()
+        with STAGE_SECONDS.time(stage="change_gate"):
+            signatures = [self.signature(frame.image) for frame in frames]
+            with self._lock:
+                previous = [self._last.get(camera_id) for camera_id in camera_ids]
+
+            results: list[MockResult | None] = [None] * len(frames)
+            changed = []
+            for index, (last, signature) in enumerate(zip(previous, signatures)):
+                if self._is_unchanged(last, signature, now):
+                    results[index] = last.result
+                else:
+                    changed.append(index)
+
+        fresh = score([frames[index] for index in changed]) if changed else []
+        with self._lock:
+            for index, result in zip(changed, fresh):
+                results[index] = result
+                self._last[camera_ids[index]] = _Scored(signatures[index], result, now)
+            self.forwarded += len(changed)
+            self.skipped += len(frames) - len(changed)
+        return results
+
+    def clear(self) -> None:
+        with self._lock:
+            self._last.clear()
+
+
+_change_gate: ChangeGate | None = None
+_change_gate_lock = threading.Lock()
+
+
+def get_change_gate() -> ChangeGate:
+    global _change_gate
+    if _change_gate is None:
+        with _change_gate_lock:
+            if _change_gate is None:
+                _change_gate = ChangeGate()
+                # A skipped (unchanged) frame is a hit: its previous result was reused.
+                register_cache("change_gate", lambda: _change_gate.skipped, lambda: _change_gate.forwarded)
+    return _change_gate
@@ -1,24 +1,222 @@
-"""Text and template configuration for the Streamlit dashboard."""
+"""Runtime configuration: camera sources, caches, scoring, storage, services and UI text."""
 
 # --- Path config (project-relative) ---
 ASSETS_ROOT_DIR = "assets"
 LOGO_ASSETS_DIR = "assets/logo"
 
-DEFAULT_IMAGE_CANDIDATES_REL = [
-    "assets/case1.png",
-    "assets/logo/289.jpg",
-    "assets/logo/batch_test_sample.png",
-]
-
-DEFAULT_CCTV_IMAGE_PATHS_REL = {
-    "CCTV1": "assets/case1.png",
-    "CCTV2": "assets/case2.png",
-    "CCTV3": "assets/case3.png",
-    "CCTV4": "assets/case4.png",
-}
+# Camera registry (id, source, zone, tags): JSON, YAML (with PyYAML) or SQLite. Sources may
+# be image paths, video files or stream URLs (rtsp://...). VLM_CAMERA_REGISTRY overrides it.
+CAMERA_REGISTRY_PATH = "cameras.json"
 
 PIA_LOGO_DARK_REL_PATH = "assets/logo/pia-logo-white.png"
 
+# --- Cache config ---
+# Decoded RGB frames shared by every session of this process (LRU beyond this budget).
+FRAME_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# CCTV View thumbnails: covers the 240px-high tile with headroom for HiDPI screens.
+THUMBNAIL_BOX = (640, 360)
+THUMBNAIL_FORMAT = "WEBP"
+THUMBNAIL_QUALITY = 80
+THUMBNAIL_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# --- Video sources ---
+# Camera entries ending in a video extension or using rtsp://, http(s):// etc. are decoded with decord.
+VIDEO_SAMPLE_FPS = 1.0
+VIDEO_KEYFRAMES_ONLY = False
+# Recent sampled frames kept per camera.
+VIDEO_BUFFER_SIZE = 16
+# -1 decodes at the native resolution.
+VIDEO_DECODE_WIDTH = -1
+VIDEO_DECODE_HEIGHT = -1
+VIDEO_DECODE_THREADS = 1
+VIDEO_RECONNECT_SECONDS = 5.0
+VIDEO_FIRST_FRAME_TIMEOUT_SECONDS = 2.0
+
+# --- Change gate ---
+# Cameras whose downsampled frame differs from the last scored one by less than the
+# threshold (0-1) reuse the previous result; "pixel" or "histogram" distance.
+CHANGE_GATE_THRESHOLD = 0.02
+CHANGE_GATE_METHOD = "pixel"
+CHANGE_GATE_SIZE = (32, 32)
+CHANGE_GATE_MAX_SKIP_SECONDS = 600
+
+# --- Background scoring ---
+# Seconds between refreshes of every camera's result by the scoring worker thread.
+SCORING_INTERVAL_SECONDS = 5.0
+# Cameras loaded and scored per batch; cameras a page asks for are served between batches.
+SCORING_CHUNK_SIZE = 16
+# Each camera tile is a Streamlit fragment re-reading the latest snapshot on this timer.
+TILE_REFRESH_SECONDS = 2.0
+# Camera tiles per wall page. Only the page's tiles are rendered (and its unscored cameras
+# queued ahead of the pass); the worker still loads and scores every registered camera.
+WALL_PAGE_SIZE = 8
+# Tiles per grid row.
+WALL_GRID_COLUMNS = 2
+# "hot" lists the most severe cameras first; "registry" keeps the registry order.
+WALL_DEFAULT_SORT = "hot"
+
+# --- Score history ---
+# Append-only per-camera column files (memory-mapped for queries); one writer process at a time.
+# Relative to the project directory.
+HISTORY_DIR = "data/history"
+# Appended rows are buffered in memory and written out at most this often.
+HISTORY_FLUSH_SECONDS = 10.0
+# Time window of the trend chart in the report column.
+HISTORY_CHART_WINDOW_SECONDS = 3600
+# The chart is thinned to at most this many points.
+HISTORY_CHART_MAX_POINTS = 720
+
+# --- Alarm rules ---
+# Per-camera / per-zone overrides, threshold bands and suppression windows (JSON, or YAML
+# with PyYAML installed); relative to the project directory, VLM_RULES_PATH overrides it.
+RULES_PATH = "rules.json"
+# The file's modification time is checked at most this often; changes apply without a restart.
+RULES_RELOAD_SECONDS = 5.0
+
+# --- Alarm events ---
+# Discrete open/close events per camera incident, debounced against flapping scores.
+# An incident is open while the camera's level is at least this.
+ALARM_OPEN_LEVEL = "High"
+# A camera drops below a level only once its score is this far under the level's threshold.
+ALARM_HYSTERESIS = 5
+# A level change must persist this long before it takes effect.
+ALARM_MIN_DWELL_SECONDS = 10.0
+# Incidents opening this soon after the camera's last notified one emit no events.
+ALARM_COOLDOWN_SECONDS = 300.0
+# Events waiting for consumers; the oldest are dropped when it is full.
+ALARM_EVENT_QUEUE_SIZE = 1024
+# Every event is appended here as one JSON line; relative to the project directory, None disables it.
+ALARM_EVENT_LOG_PATH = "data/alarm_events.jsonl"
+
+# --- Inference config ---
+# "mock" (offline, hash-based), "onnx" or "remote"; the VLM_INFERENCE_BACKEND env var overrides it.
+INFERENCE_BACKEND = "mock"
+
+# Scores are cached per (model version, frame hash); "perceptual" also matches near-identical frames.
+RESULT_CACHE_ENABLED = True
+RESULT_CACHE_HASH = "perceptual"
+RESULT_CACHE_MAX_ENTRIES = 4096
+RESULT_CACHE_TTL_SECONDS = 300
+
+RISK_HIGH_THRESHOLD = 75
+RISK_MEDIUM_THRESHOLD = 60
+# Per-site (Medium, High) lower score bounds; the active site is VLM_SITE or SITE_ID, and
+# sites not listed here use the two thresholds above.
+SITE_ID = None
+RISK_THRESHOLDS_BY_SITE: dict[str, tuple[int, int]] = {}
+
+# Local model path, or a Hugging Face Hub repo to download ONNX_MODEL_FILENAME from.
+ONNX_MODEL_PATH = "models/risk_vlm.onnx"
+ONNX_MODEL_REPO_ID = None
+ONNX_MODEL_FILENAME = "model.onnx"
+ONNX_INPUT_SIZE = (224, 224)
+ONNX_INPUT_MEAN = (0.485, 0.456, 0.406)
+ONNX_INPUT_STD = (0.229, 0.224, 0.225)
+# 0 lets onnxruntime choose; inter-op threads > 1 switch the session to parallel execution.
+ONNX_INTRA_OP_THREADS = 0
+ONNX_INTER_OP_THREADS = 0
+
+# Worker processes preparing ONNX input tensors in shared memory (0 = one per CPU, -1 = disabled).
+PREPROCESS_WORKERS = 0
+# Smaller batches are prepared inline, where pool round-trips would cost more than they save.
+PREPROCESS_MIN_BATCH = 8
+
+# --- Inference service (inference_server.py) ---
+# Backend the service itself runs; the VLM_SERVER_BACKEND env var overrides it.
+INFERENCE_SERVER_BACKEND = "mock"
+INFERENCE_MAX_BATCH_SIZE = 32
+INFERENCE_MAX_WAIT_MS = 10
+# Used by the "remote" backend; the VLM_INFERENCE_SERVER_URL env var overrides it.
+INFERENCE_SERVER_URL = "http://127.0.0.1:8000"
+INFERENCE_HTTP_POOL_SIZE = 16
+INFERENCE_HTTP_TIMEOUT_SECONDS = 30
+# Frames are downscaled to this longest side and JPEG-encoded before upload.
+REMOTE_FRAME_MAX_SIDE = 640
+
+# --- Live alarm channel (server-sent events, live_events.py) ---
+# Each dashboard process streams its own scoring worker's results to the live strip from a
+# small HTTP server (the VLM_LIVE_EVENTS_PORT env var overrides the port).
+LIVE_EVENTS_ENABLED = True
+LIVE_EVENTS_HOST = "127.0.0.1"
+LIVE_EVENTS_PORT = 9109
+# Browser-reachable stream URL; None means http://LIVE_EVENTS_HOST:<port>/v1/alarms/stream.
+# The VLM_LIVE_EVENTS_URL env var overrides it, e.g. behind a reverse proxy.
+LIVE_EVENTS_URL = None
+# inference_server.py can score the registered cameras itself and stream them on its own
+# /v1/alarms/stream (or VLM_LIVE_SCORING=1). Off by default: the dashboard already scores
+# every camera, and a second worker would run the same inference twice.
+LIVE_SCORING_ENABLED = False
+LIVE_KEEPALIVE_SECONDS = 15
+LIVE_ALLOWED_ORIGINS = ["*"]
+
+# --- Metrics ---
+# Prometheus text format: /metrics on the inference service, and a small HTTP server
+# started by each dashboard process (the VLM_METRICS_PORT env var overrides the port).
+METRICS_ENABLED = True
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9108
+# Histogram bucket upper bounds in seconds, from a cached HTML render to a slow model call.
+METRICS_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# --- Batch scoring (batch_score.py) ---
+# Decoder threads feeding the scorer (0 = one per CPU), frames per inference batch,
+# and the bound on decoded frames waiting to be scored.
+BATCH_DECODE_WORKERS = 0
+BATCH_SIZE = 32
+BATCH_QUEUE_SIZE = 256
+# Archived clips are sampled at this rate (or at keyframes only with --keyframes).
+BATCH_VIDEO_SAMPLE_FPS = 1.0
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".bmp")
+# Rows per Parquet row group when converting the JSONL output.
+BATCH_PARQUET_ROW_GROUP = 100_000
+
+# --- Report export (export_reports.py) ---
+# Render processes (0 = one per CPU) and the cap on reports rendered but not yet written.
+EXPORT_WORKERS = 0
+EXPORT_MAX_IN_FLIGHT = 64
+# Default period covered by an export, ending now.
+EXPORT_PERIOD_HOURS = 24
+
+# Standalone HTML export page; the report-card styles match the dashboard's.
+EXPORT_HTML_DOCUMENT = """<!doctype html>
+<html lang="__LANG__">
+<head>
+<meta charset="utf-8">
+<title>__TITLE__</title>
+<style>
+  body { margin: 24px; background: #0A0A1A; color: #FFFFFF; font-family: "Source Sans Pro", sans-serif; }
+  .report-period { color: rgba(255, 255, 255, 0.75); font-size: 14px; }
+  .report-layout { width: 100%; max-width: 1100px; box-sizing: border-box; }
+  .report-row {
+    display: grid;
+    grid-template-columns: minmax(0, 1fr) minmax(0, 1fr);
+    gap: 10px;
+    align-items: stretch;
+    margin-bottom: 10px;
+  }
+  .report-card {
+    border-radius: 12px;
+    padding: 12px 14px;
+    background: linear-gradient(135deg, #18243d 0%, #223559 100%);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    box-sizing: border-box;
+    overflow-wrap: anywhere;
+  }
+  .report-card h4 { margin: 0 0 8px; font-size: 18px; font-weight: 800; }
+  .report-card p, .report-card li { margin: 0; color: #f8fafc; line-height: 1.55; font-size: 14px; }
+  .report-card ul, .report-card ol { margin: 0; padding-left: 18px; }
+  .report-quote { margin: 0; padding-left: 10px; border-left: 3px solid #93c5fd; }
+</style>
+</head>
+<body>
+<h1>__TITLE__</h1>
+<p class="report-period">__PERIOD__</p>
+__REPORT__
+</body>
+</html>
+"""
+
 # --- English ---
 PAGE_TITLE = "DTRO Safety Dashboard"
 BRAND_TITLE = "PIA-SPACE Safety Dashboard"
@@ -27,12 +225,33 @@ BRAND_SUBTITLE = "PIA SPACE - CCTV-Based Safety Description Report"
 ALARM_CARD_TITLE = "Alarm"
 ALARM_MAIN_FORMAT = "{icon} {level} Risk"
 ALARM_SUB_FORMAT = "Risk Score: {score} / 100"
+OFFLINE_MAIN = "📴 Offline"
+OFFLINE_SUB = "No frame from this camera"
+PENDING_MAIN = "⏳ Scoring…"
+PENDING_SUB = "Waiting for this camera's first result"
 
 DESCRIPTION_TITLE = "Description"
 CCTV_VIEW_TITLE = "CCTV View"
 VLM_DESCRIPTION_TITLE = "VLM Description"
+UPDATED_AT_FORMAT = "updated {time}"
+LIVE_ALARM_TITLE = "Live"
+HISTORY_CHART_TITLE = "#### 📈 Risk Score Trend"
+REPORT_CAMERA_LABEL = "Report camera"
+WALL_ZONE_LABEL = "Zone"
+WALL_ALL_ZONES = "All zones"
+WALL_TAGS_LABEL = "Tags"
+WALL_SORT_LABEL = "Order"
+WALL_SORT_MODES = {"hot": "Hot cameras first", "registry": "Registry order"}
+WALL_PAGE_LABEL = "Page"
+WALL_RESORT_LABEL = "↻ Re-sort"
+WALL_COUNT_FORMAT = "{shown} of {total} cameras"
+NO_FRAMES_ERROR = "No camera frames could be loaded. Check the camera sources in `cameras.json`."
+REPORT_PERIOD_FORMAT = (
+    "{start} – {end} · {samples} samples · peak {peak} · mean {mean:.1f} · "
+    "High {high:.0%} · Medium {medium:.0%} · Low {low:.0%}"
+)
 
-REPORT_TITLE = "# 🚨 CCTV1 Safety Risk Assessment Report"
+REPORT_TITLE = "# 🚨 {cctv_id} Safety Risk Assessment Report"
 REPORT_TWO_COLUMNS_HTML = """
 <div class="report-layout">
   <div class="report-row">
@@ -54,20 +273,13 @@ REPORT_TWO_COLUMNS_HTML = """
     <div class="report-card">
       <h4>👀 Observation</h4>
       <ul>
-        <li>A forklift is actively transporting palletized goods within a warehouse rack aisle</li>
-        <li>Multiple workers and pedestrians are present in the same aisle during forklift operation</li>
-        <li>Personnel are positioned very close to the forklift's travel path</li>
-        <li>Work activities such as box handling are occurring simultaneously with vehicle movement</li>
-        <li>Clear separation between pedestrian walkways and forklift operating routes is not observed</li>
+        {observations:li}
       </ul>
     </div>
     <div class="report-card">
       <h4>✅ Recommended Actions</h4>
       <ol>
-        <li><strong>Immediately restrict pedestrian access</strong> to forklift operating aisles during active transport</li>
-        <li><strong>Implement physical separation</strong> (floor markings, cones, barriers) between pedestrian and equipment routes</li>
-        <li>Assign a <strong>spotter or traffic controller</strong> when forklift operations occur in shared spaces</li>
-        <li>Reinforce safety procedures regarding <strong>forklift blind spots, stopping distance, and turning radius</strong></li>
+        {actions:li}
       </ol>
     </div>
   </div>
@@ -87,26 +299,38 @@ REPORT_TWO_COLUMNS_HTML = """
 </div>
 """
 
-DEFAULT_REPORT_TEMPLATE = """## 🚨 CCTV1 Safety Risk Assessment Report
+# Default report sections, used when a result carries no observations/actions of its own.
+REPORT_OBSERVATIONS = (
+    "A forklift is actively transporting palletized goods within a warehouse rack aisle",
+    "Multiple workers and pedestrians are present in the same aisle during forklift operation",
+    "Personnel are positioned very close to the forklift's travel path",
+    "Work activities such as box handling are occurring simultaneously with vehicle movement",
+    "Clear separation between pedestrian walkways and forklift operating routes is not observed",
+)
+REPORT_ACTIONS = (
+    "**Immediately restrict pedestrian access** to forklift operating aisles during active transport",
+    "**Implement physical separation** (floor markings, cones, barriers) between pedestrian and equipment routes",
+    "Assign a **spotter or traffic controller** when forklift operations occur in shared spaces",
+    "Reinforce safety procedures regarding **forklift blind spots, stopping distance, and turning radius**",
+)
+
+# The markdown report's own default lists; in English they match the HTML report's.
+REPORT_MARKDOWN_OBSERVATIONS = REPORT_OBSERVATIONS
+REPORT_MARKDOWN_ACTIONS = REPORT_ACTIONS
+
+DEFAULT_REPORT_TEMPLATE = """## 🚨 {cctv_id} Safety Risk Assessment Report
 ### 🔍 Summary
 - Forklift operating in a warehouse aisle with pedestrians working in close proximity, indicating insufficient separation between personnel and equipment.
 ---
 ### ⚠️ Risk Level
-- **High**  
-- Risk Score: **82 / 100**
+- **{alarm_level}**  
+- Risk Score: **{risk_score} / 100**
 ---
 ### 👀 Observation
-- A forklift is actively transporting palletized goods within a warehouse rack aisle
-- Multiple workers and pedestrians are present in the same aisle during forklift operation
-- Personnel are positioned very close to the forklift’s travel path
-- Work activities such as box handling are occurring simultaneously with vehicle movement
-- Clear separation between pedestrian walkways and forklift operating routes is not observed
+{markdown_observations:-}
 ---
 ### ✅ Recommended Actions
-1. **Immediately restrict pedestrian access** to forklift operating aisles during active transport
-2. **Implement physical separation** (floor markings, cones, barriers) between pedestrian and equipment routes
-3. Assign a **spotter or traffic controller** when forklift operations occur in shared spaces
-4. Reinforce safety procedures regarding **forklift blind spots, stopping distance, and turning radius**
+{markdown_actions:1.}
 ---
 ### 📘 Safety Guideline Reference
 > Forklift operation and pedestrian traffic separation guidelines
@@ -134,15 +358,91 @@ RISK_LEVEL_DESCRIPTIONS = {
     ),
 }
 
-CCTV2_OVERRIDE_LEVEL = "Medium"
-CCTV2_OVERRIDE_SCORE = 68
-CCTV2_OVERRIDE_DESCRIPTION = (
+# Indexed by AlarmLevel (Low, Medium, High).
+LEVEL_CSS_CLASSES = ("alarm-low", "alarm-medium", "alarm-high")
+LEVEL_ICONS = ("✅", "⚠️", "🚨")
+
+LEVEL_LABELS = {
+    "High": "High",
+    "Medium": "Medium",
+    "Low": "Low",
+}
+
+# Description of results fixed by an "override" alarm rule (see rules.json).
+OVERRIDE_DESCRIPTION = (
     "Some risk signs are observed. It is not at the level of requiring an immediate stop, "
     "but sufficient distance between personnel and equipment appears necessary. "
     "Please quickly verify compliance with safe separation distances between nearby workers and equipment, "
     "as well as PPE usage."
 )
 
+# Rendered in a components iframe; updates badges in place from the SSE stream, no reruns.
+LIVE_ALARM_STRIP_HTML = """
+<style>
+  body { margin: 0; font-family: "Source Sans Pro", sans-serif; background: transparent; }
+  .live-strip { display: flex; flex-wrap: wrap; align-items: center; gap: 6px; }
+  .live-title { color: rgba(255, 255, 255, 0.75); font-size: 13px; font-weight: 700; margin-right: 4px; }
+  .live-badge { border-radius: 10px; padding: 3px 9px; color: #ffffff; font-size: 13px; font-weight: 700; }
+  .live-high { background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); }
+  .live-medium { background: linear-gradient(135deg, #f59e0b 0%, #ea580c 100%); }
+  .live-low { background: linear-gradient(135deg, #10b981 0%, #059669 100%); }
+  .live-offline { background: #4b5563; color: rgba(255, 255, 255, 0.7); }
+  .live-incident { box-shadow: 0 0 0 2px #ffffff; }
+</style>
+<div class="live-strip" id="live-strip"><span class="live-title">__TITLE__</span></div>
+<script>
+  const labels = __LEVEL_LABELS__;
+  const offlineLabel = __OFFLINE_LABEL__;
+  const strip = document.getElementById("live-strip");
+  const badges = {};
+  const source = new EventSource("__EVENTS_URL__");
+  const open = new Set();
+  function badgeFor(cameraId) {
+    let badge = badges[cameraId];
+    if (!badge) {
+      badge = document.createElement("span");
+      badge.className = "live-badge";
+      strip.appendChild(badge);
+      badges[cameraId] = badge;
+    }
+    return badge;
+  }
+  // A (re)connected stream starts with the full current state, so drop what the last one showed.
+  source.addEventListener("open", () => {
+    for (const cameraId of Object.keys(badges)) {
+      badges[cameraId].remove();
+      delete badges[cameraId];
+    }
+  });
+  source.addEventListener("alarm", (event) => {
+    const alarm = JSON.parse(event.data);
+    const badge = badgeFor(alarm.camera_id);
+    badge.className = "live-badge live-" + alarm.level.toLowerCase();
+    badge.classList.toggle("live-incident", open.has(alarm.camera_id));
+    badge.textContent = alarm.camera_id + " · " + (labels[alarm.level] || alarm.level) + " " + alarm.score;
+    badge.title = alarm.description;
+  });
+  // Greys out cameras that stopped producing frames until they report again.
+  source.addEventListener("offline", (event) => {
+    const offline = JSON.parse(event.data);
+    const badge = badgeFor(offline.camera_id);
+    badge.className = "live-badge live-offline";
+    badge.textContent = offline.camera_id + " · " + offlineLabel;
+    badge.title = "";
+  });
+  // Outlines the cameras with an open incident (debounced by alarm_events.py).
+  source.addEventListener("incident", (event) => {
+    const incident = JSON.parse(event.data);
+    if (incident.kind === "open") {
+      open.add(incident.camera_id);
+    } else {
+      open.delete(incident.camera_id);
+    }
+    badgeFor(incident.camera_id).classList.toggle("live-incident", open.has(incident.camera_id));
+  });
+</script>
+"""
+
 # --- Korean --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- ---
 # --- Korean ---
 PAGE_TITLE_KO = "DTRO 안전 대시보드"
@@ -150,14 +450,35 @@ BRAND_TITLE_KO = "PIA-SPACE 안전 대시보드"
 BRAND_SUBTITLE_KO = "PIA SPACE - CCTV 기반 안전 설명 보고서"
 
 ALARM_CARD_TITLE_KO = "알림"
-ALARM_MAIN_FORMAT_KO = "{icon} {level_ko} 위험"
+ALARM_MAIN_FORMAT_KO = "{icon} {level} 위험"
 ALARM_SUB_FORMAT_KO = "위험 점수: {score} / 100"
+OFFLINE_MAIN_KO = "📴 오프라인"
+OFFLINE_SUB_KO = "이 카메라의 영상이 없습니다"
+PENDING_MAIN_KO = "⏳ 분석 중…"
+PENDING_SUB_KO = "이 카메라의 첫 결과를 기다리는 중입니다"
 
 DESCRIPTION_TITLE_KO = "설명"
 CCTV_VIEW_TITLE_KO = "CCTV 화면"
 VLM_DESCRIPTION_TITLE_KO = "VLM 설명"
+UPDATED_AT_FORMAT_KO = "{time} 갱신"
+LIVE_ALARM_TITLE_KO = "실시간"
+HISTORY_CHART_TITLE_KO = "#### 📈 위험 점수 추이"
+REPORT_CAMERA_LABEL_KO = "보고서 카메라"
+WALL_ZONE_LABEL_KO = "구역"
+WALL_ALL_ZONES_KO = "전체 구역"
+WALL_TAGS_LABEL_KO = "태그"
+WALL_SORT_LABEL_KO = "정렬"
+WALL_SORT_MODES_KO = {"hot": "위험 카메라 우선", "registry": "등록 순서"}
+WALL_PAGE_LABEL_KO = "페이지"
+WALL_RESORT_LABEL_KO = "↻ 다시 정렬"
+WALL_COUNT_FORMAT_KO = "카메라 {total}대 중 {shown}대"
+NO_FRAMES_ERROR_KO = "카메라 영상을 불러오지 못했습니다. `cameras.json`의 카메라 소스를 확인해주세요."
+REPORT_PERIOD_FORMAT_KO = (
+    "{start} – {end} · 표본 {samples}개 · 최고 {peak} · 평균 {mean:.1f} · "
+    "높음 {high:.0%} · 보통 {medium:.0%} · 낮음 {low:.0%}"
+)
 
-REPORT_TITLE_KO = "# 🚨 CCTV1 안전 위험 평가 보고서"
+REPORT_TITLE_KO = "# 🚨 {cctv_id} 안전 위험 평가 보고서"
 REPORT_TWO_COLUMNS_HTML_KO = """
 <div class="report-layout">
   <div class="report-row">
@@ -170,7 +491,7 @@ REPORT_TWO_COLUMNS_HTML_KO = """
     <div class="report-card">
       <h4>⚠️ 위험 수준</h4>
       <ul>
-        <li><strong>{alarm_level_ko}</strong></li>
+        <li><strong>{alarm_level}</strong></li>
         <li>위험 점수: <strong>{risk_score} / 100</strong></li>
       </ul>
     </div>
@@ -179,17 +500,13 @@ REPORT_TWO_COLUMNS_HTML_KO = """
     <div class="report-card">
       <h4>👀 관찰 내용</h4>
       <ul>
-        <li>지게차 작업 구역에 3명의 인원이 있습니다</li>
-        <li>모든 인원이 필수 안전모를 착용하지 않았습니다</li>
-        <li>지게차 작업이 진행 중이어서 두부 손상 위험이 증가합니다</li>
+        {observations:li}
       </ul>
     </div>
     <div class="report-card">
       <h4>✅ 권고 조치</h4>
       <ol>
-        <li><strong>즉시 안전모 착용 의무화</strong>를 시행합니다</li>
-        <li>PPE 준수 확인 전까지 <strong>지게차 작업을 중단</strong>합니다</li>
-        <li>해당 구역 전 인원을 대상으로 <strong>의무 안전 브리핑</strong>을 실시합니다</li>
+        {actions:li}
       </ol>
     </div>
   </div>
@@ -209,26 +526,44 @@ REPORT_TWO_COLUMNS_HTML_KO = """
 </div>
 """
 
-DEFAULT_REPORT_TEMPLATE_KO = """## 🚨 CCTV1 안전 위험 평가 보고서
+REPORT_OBSERVATIONS_KO = (
+    "지게차 작업 구역에 3명의 인원이 있습니다",
+    "모든 인원이 필수 안전모를 착용하지 않았습니다",
+    "지게차 작업이 진행 중이어서 두부 손상 위험이 증가합니다",
+)
+REPORT_ACTIONS_KO = (
+    "**즉시 안전모 착용 의무화**를 시행합니다",
+    "PPE 준수 확인 전까지 **지게차 작업을 중단**합니다",
+    "해당 구역 전 인원을 대상으로 **의무 안전 브리핑**을 실시합니다",
+)
+
+REPORT_MARKDOWN_OBSERVATIONS_KO = (
+    "지게차가 창고 랙 통로에서 팔레트 화물을 운반하고 있습니다",
+    "지게차 운행 중 동일 통로에 다수의 작업자와 보행자가 함께 있습니다",
+    "인원이 지게차 주행 경로와 매우 근접해 있습니다",
+    "차량 이동과 동시에 박스 취급 등 작업이 병행되고 있습니다",
+    "보행자 동선과 지게차 운행 동선의 명확한 분리가 확인되지 않습니다",
+)
+REPORT_MARKDOWN_ACTIONS_KO = (
+    "지게차 운행 중 통로에 대한 **보행자 접근을 즉시 제한**합니다",
+    "보행자/장비 동선 사이에 **물리적 분리 수단**(바닥 표시, 콘, 차단대)을 적용합니다",
+    "공유 작업 공간에서 지게차 운행 시 **유도자(스포터) 또는 교통 통제 담당자**를 배치합니다",
+    "**지게차 사각지대, 제동거리, 회전 반경** 관련 안전 절차를 재강화합니다",
+)
+
+DEFAULT_REPORT_TEMPLATE_KO = """## 🚨 {cctv_id} 안전 위험 평가 보고서
 ### 🔍 요약
 - 창고 랙 통로에서 지게차가 운행 중이며 보행자가 근접 작업 중이어서, 인원과 장비 간 분리가 불충분합니다.
 ---
 ### ⚠️ 위험 수준
-- **높음**  
-- 위험 점수: **82 / 100**
+- **{alarm_level}**  
+- 위험 점수: **{risk_score} / 100**
 ---
 ### 👀 관찰 내용
-- 지게차가 창고 랙 통로에서 팔레트 화물을 운반하고 있습니다
-- 지게차 운행 중 동일 통로에 다수의 작업자와 보행자가 함께 있습니다
-- 인원이 지게차 주행 경로와 매우 근접해 있습니다
-- 차량 이동과 동시에 박스 취급 등 작업이 병행되고 있습니다
-- 보행자 동선과 지게차 운행 동선의 명확한 분리가 확인되지 않습니다
+{markdown_observations:-}
 ---
 ### ✅ 권고 조치
-1. 지게차 운행 중 통로에 대한 **보행자 접근을 즉시 제한**합니다
-2. 보행자/장비 동선 사이에 **물리적 분리 수단**(바닥 표시, 콘, 차단대)을 적용합니다
-3. 공유 작업 공간에서 지게차 운행 시 **유도자(스포터) 또는 교통 통제 담당자**를 배치합니다
-4. **지게차 사각지대, 제동거리, 회전 반경** 관련 안전 절차를 재강화합니다
+{markdown_actions:1.}
 ---
 ### 📘 안전 지침 참고
 > 지게차 운행 및 보행자 동선 분리 지침
@@ -260,8 +595,99 @@ RISK_LEVEL_DESCRIPTIONS_KO = {
     ),
 }
 
-CCTV2_OVERRIDE_DESCRIPTION_KO = (
+OVERRIDE_DESCRIPTION_KO = (
     "일부 위험 징후가 관찰됩니다. 즉시 작업 중지 수준은 아니지만, "
     "인원과 장비 간 충분한 거리 확보가 필요합니다. "
     "근접 작업 상황과 PPE 준수 여부를 빠르게 확인해야 합니다."
 )
+
+# --- Locales ---
+# Every user-facing string per language. The dashboard serves all of them from one
+# process and picks the table per session (`?lang=ko` or the header selector); the
+# inference service picks it per request.
+DEFAULT_LOCALE = "en"
+LOCALE_QUERY_PARAM = "lang"
+LOCALES = {
+    "en": {
+        "name": "English",
+        "page_title": PAGE_TITLE,
+        "brand_title": BRAND_TITLE,
+        "brand_subtitle": BRAND_SUBTITLE,
+        "alarm_card_title": ALARM_CARD_TITLE,
+        "alarm_main_format": ALARM_MAIN_FORMAT,
+        "alarm_sub_format": ALARM_SUB_FORMAT,
+        "offline_main": OFFLINE_MAIN,
+        "offline_sub": OFFLINE_SUB,
+        "pending_main": PENDING_MAIN,
+        "pending_sub": PENDING_SUB,
+        "description_title": DESCRIPTION_TITLE,
+        "robot_alt": "robot",
+        "cctv_view_title": CCTV_VIEW_TITLE,
+        "vlm_description_title": VLM_DESCRIPTION_TITLE,
+        "updated_at_format": UPDATED_AT_FORMAT,
+        "live_alarm_title": LIVE_ALARM_TITLE,
+        "history_chart_title": HISTORY_CHART_TITLE,
+        "report_camera_label": REPORT_CAMERA_LABEL,
+        "wall_zone_label": WALL_ZONE_LABEL,
+        "wall_all_zones": WALL_ALL_ZONES,
+        "wall_tags_label": WALL_TAGS_LABEL,
+        "wall_sort_label": WALL_SORT_LABEL,
+        "wall_sort_modes": WALL_SORT_MODES,
+        "wall_page_label": WALL_PAGE_LABEL,
+        "wall_resort_label": WALL_RESORT_LABEL,
+        "wall_count_format": WALL_COUNT_FORMAT,
+        "no_frames_error": NO_FRAMES_ERROR,
+        "report_period_format": REPORT_PERIOD_FORMAT,
+        "report_title": REPORT_TITLE,
+        "report_html": REPORT_TWO_COLUMNS_HTML,
+        "report_observations": REPORT_OBSERVATIONS,
+        "report_actions": REPORT_ACTIONS,
+        "report_template": DEFAULT_REPORT_TEMPLATE,
+        "report_markdown_observations": REPORT_MARKDOWN_OBSERVATIONS,
+        "report_markdown_actions": REPORT_MARKDOWN_ACTIONS,
+        "level_labels": LEVEL_LABELS,
+        "risk_level_descriptions": RISK_LEVEL_DESCRIPTIONS,
+        "override_description": OVERRIDE_DESCRIPTION,
+    },
+    "ko": {
+        "name": "한국어",
+        "page_title": PAGE_TITLE_KO,
+        "brand_title": BRAND_TITLE_KO,
+        "brand_subtitle": BRAND_SUBTITLE_KO,
+        "alarm_card_title": ALARM_CARD_TITLE_KO,
+        "alarm_main_format": ALARM_MAIN_FORMAT_KO,
+        "alarm_sub_format": ALARM_SUB_FORMAT_KO,
+        "offline_main": OFFLINE_MAIN_KO,
+        "offline_sub": OFFLINE_SUB_KO,
+        "pending_main": PENDING_MAIN_KO,
+        "pending_sub": PENDING_SUB_KO,
+        "description_title": DESCRIPTION_TITLE_KO,
+        "robot_alt": "로봇",
+        "cctv_view_title": CCTV_VIEW_TITLE_KO,
+        "vlm_description_title": VLM_DESCRIPTION_TITLE_KO,
+        "updated_at_format": UPDATED_AT_FORMAT_KO,
+        "live_alarm_title": LIVE_ALARM_TITLE_KO,
+        "history_chart_title": HISTORY_CHART_TITLE_KO,
+        "report_camera_label": REPORT_CAMERA_LABEL_KO,
+        "wall_zone_label": WALL_ZONE_LABEL_KO,
+        "wall_all_zones": WALL_ALL_ZONES_KO,
+        "wall_tags_label": WALL_TAGS_LABEL_KO,
+        "wall_sort_label": WALL_SORT_LABEL_KO,
+        "wall_sort_modes": WALL_SORT_MODES_KO,
+        "wall_page_label": WALL_PAGE_LABEL_KO,
+        "wall_resort_label": WALL_RESORT_LABEL_KO,
+        "wall_count_format": WALL_COUNT_FORMAT_KO,
+        "no_frames_error": NO_FRAMES_ERROR_KO,
+        "report_period_format": REPORT_PERIOD_FORMAT_KO,
+        "report_title": REPORT_TITLE_KO,
+        "report_html": REPORT_TWO_COLUMNS_HTML_KO,
+        "report_observations": REPORT_OBSERVATIONS_KO,
+        "report_actions": REPORT_ACTIONS_KO,
+        "report_template": DEFAULT_REPORT_TEMPLATE_KO,
+        "report_markdown_observations": REPORT_MARKDOWN_OBSERVATIONS_KO,
+        "report_markdown_actions": REPORT_MARKDOWN_ACTIONS_KO,
+        "level_labels": LEVEL_LABELS_KO,
+        "risk_level_descriptions": RISK_LEVEL_DESCRIPTIONS_KO,
+        "override_description": OVERRIDE_DESCRIPTION_KO,
+    },
+}
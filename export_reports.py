@@ -0,0 +1,254 @@
+"""Headless bulk export of per-camera safety reports (HTML / Markdown) to a directory or zip.
+
+    python export_reports.py reports/ --hours 24 --locale en ko
+    python export_reports.py nightly.zip --since 2026-10-17T18:00 --until 2026-10-18T06:00
+
+Each camera's period is summarized from the score history store; `--live` scores the
+current frames instead. Reports are rendered in worker processes and written as they
+complete, with at most `--max-in-flight` rendered reports held in memory.
+"""
+
+import argparse
+import concurrent.futures
+import multiprocessing
+import os
+import re
+import sys
+import time
+import zipfile
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+
+from config import (
+    EXPORT_HTML_DOCUMENT,
+    EXPORT_MAX_IN_FLIGHT,
+    EXPORT_PERIOD_HOURS,
+    EXPORT_WORKERS,
+    LOCALES,
+)
+from history_store import HistoryStore, history_root
+from report_templates import REPORT_TEMPLATE_KEY, render_report, render_template
+from results import AlarmLevel, MockResult
+
+
+FORMATS = ("html", "md")
+
+
+@dataclass(frozen=True)
+class ReportJob:
+    cctv_id: str
+    level: AlarmLevel
+    score: int
+    start: float
+    end: float
+    samples: int
+    peak: int
+    mean: float
+    # Share of samples at each level, indexed by AlarmLevel.
+    level_shares: tuple[float, float, float]
+
+
+def _format_time(ts: float) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+
+
+def _render_document(job: ReportJob, locale: str, fmt: str) -> str:
+    texts = LOCALES[locale]
+    result = MockResult.create(job.level, job.score, job.level.label, REPORT_TEMPLATE_KEY)
+    period = texts["report_period_format"].format(
+        start=_format_time(job.start),
+        end=_format_time(job.end),
+        samples=job.samples,
+        peak=job.peak,
+        mean=job.mean,
+        low=job.level_shares[AlarmLevel.LOW],
+        medium=job.level_shares[AlarmLevel.MEDIUM],
+        high=job.level_shares[AlarmLevel.HIGH],
+    )
+    if fmt == "md":
+        return f"{render_report(texts['report_template'], locale, job.cctv_id, result)}\n---\n_{period}_\n"
+    title = render_template(texts["report_title"], cctv_id=job.cctv_id).lstrip("# ")
+    return (
+        EXPORT_HTML_DOCUMENT.replace("__LANG__", locale)
+        .replace("__TITLE__", title)
+        .replace("__PERIOD__", period)
+        .replace("__REPORT__", render_report(texts["report_html"], locale, job.cctv_id, result))
+    )
+
+
+def _render_job(job: ReportJob, locales: tuple[str, ...], formats: tuple[str, ...]) -> list[tuple[str, bytes]]:
+    stem = re.sub(r"[^A-Za-z0-9_.-]", "_", job.cctv_id)
+    return [
+        (f"{stem}_{locale}.{fmt}", _render_document(job, locale, fmt).encode("utf-8"))
+        for locale in locales
+        for fmt in formats
+    ]
+
+
+def iter_history_jobs(history: HistoryStore, cameras: list[str], start: float, end: float) -> Iterator[ReportJob]:
+    """One job per camera with history in [start, end]; only one camera's columns are read at a time."""
+    for cctv_id in cameras:
+        rows = history.range(cctv_id, start, end)
+        if not len(rows):
+            print(
+                f"{cctv_id}: no history between {_format_time(start)} and {_format_time(end)}, skipped",
+                file=sys.stderr,
+            )
+            continue
+        counts = np.bincount(rows.level, minlength=len(AlarmLevel))[: len(AlarmLevel)]
+        yield ReportJob(
+            cctv_id=cctv_id,
+            level=AlarmLevel(int(rows.level[-1])),
+            score=int(rows.score[-1]),
+            start=start,
+            end=end,
+            samples=len(rows),
+            peak=int(rows.score.max()),
+            mean=float(rows.score.mean()),
+            level_shares=tuple(float(share) for share in counts / len(rows)),
+        )
+
+
+def iter_live_jobs(cameras: list[str]) -> Iterator[ReportJob]:
+    # Imported here so render workers, which re-import this module, skip the inference stack.
+    from pipeline import load_camera_frames, score_cameras
+    from report_templates import OVERRIDE_DESCRIPTION_KEY
+
+    frames = {}
+    for cctv_id, frame in load_camera_frames(cameras or None).items():
+        if frame is None:
+            print(f"{cctv_id}: offline, skipped", file=sys.stderr)
+        else:
+            frames[cctv_id] = frame
+    results = score_cameras(
+        frames,
+        descriptions={level.label: level.label for level in AlarmLevel},
+        report_template=REPORT_TEMPLATE_KEY,
+        override_description=OVERRIDE_DESCRIPTION_KEY,
+    )
+    now = time.time()
+    for cctv_id, result in results.items():
+        shares = [0.0] * len(AlarmLevel)
+        shares[result.level] = 1.0
+        yield ReportJob(
+            cctv_id=cctv_id,
+            level=result.level,
+            score=result.risk_score,
+            start=now,
+            end=now,
+            samples=1,
+            peak=result.risk_score,
+            mean=float(result.risk_score),
+            level_shares=tuple(shares),
+        )
+
+
+class _ReportWriter:
+    """Writes finished reports one by one to a directory, or to a zip when the path ends in .zip."""
+
+    def __init__(self, output: str) -> None:
+        self.count = 0
+        self._zip = None
+        self._dir = output
+        if output.lower().endswith(".zip"):
+            parent = os.path.dirname(os.path.abspath(output))
+            os.makedirs(parent, exist_ok=True)
+            self._zip = zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED)
+        else:
+            os.makedirs(output, exist_ok=True)
+
+    def write(self, name: str, data: bytes) -> None:
+        if self._zip is not None:
+            self._zip.writestr(name, data)
+        else:
+            path = os.path.join(self._dir, name)
+            with open(f"{path}.tmp", "wb") as f:
+                f.write(data)
+            os.replace(f"{path}.tmp", path)
+        self.count += 1
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+
+
+def export_reports(
+    jobs: Iterator[ReportJob],
+    output: str,
+    locales: tuple[str, ...],
+    formats: tuple[str, ...],
+    workers: int = EXPORT_WORKERS,
+    max_in_flight: int = EXPORT_MAX_IN_FLIGHT,
+) -> int:
+    """Render `jobs` in a process pool and write each report as soon as it is done; return the file count."""
+    writer = _ReportWriter(output)
+    pending: set[concurrent.futures.Future] = set()
+
+    def drain(return_when: str) -> None:
+        done, _ = concurrent.futures.wait(pending, return_when=return_when)
+        for future in done:
+            pending.remove(future)
+            for name, data in future.result():
+                writer.write(name, data)
+
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            for job in jobs:
+                # Back-pressure: stop pulling jobs while too many renders are unwritten.
+                if len(pending) >= max_in_flight:
+                    drain(concurrent.futures.FIRST_COMPLETED)
+                pending.add(pool.submit(_render_job, job, locales, formats))
+            if pending:
+                drain(concurrent.futures.ALL_COMPLETED)
+    finally:
+        writer.close()
+    return writer.count
+
+
+def _parse_time(value: str) -> float:
+    return datetime.fromisoformat(value).timestamp()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", help="output directory, or a .zip file")
+    parser.add_argument("--format", nargs="+", choices=FORMATS, default=list(FORMATS), dest="formats")
+    parser.add_argument("--locale", nargs="+", choices=list(LOCALES), default=list(LOCALES), dest="locales")
+    parser.add_argument("--cameras", nargs="+", help="camera ids (default: every camera in the history)")
+    parser.add_argument("--hours", type=float, default=EXPORT_PERIOD_HOURS, help="period ending at --until")
+    parser.add_argument("--since", type=_parse_time, help="period start, ISO 8601 (overrides --hours)")
+    parser.add_argument("--until", type=_parse_time, help="period end, ISO 8601 (default: now)")
+    parser.add_argument("--live", action="store_true", help="score the current frames instead of reading history")
+    parser.add_argument("--workers", type=int, default=EXPORT_WORKERS)
+    parser.add_argument("--max-in-flight", type=int, default=EXPORT_MAX_IN_FLIGHT)
+    args = parser.parse_args(argv)
+
+    if args.live:
+        jobs = iter_live_jobs(args.cameras or [])
+    else:
+        end = args.until if args.until is not None else time.time()
+        start = args.since if args.since is not None else end - args.hours * 3600
+        history = HistoryStore(history_root(), read_only=True)
+        jobs = iter_history_jobs(history, args.cameras or history.cameras(), start, end)
+
+    started = time.perf_counter()
+    count = export_reports(
+        jobs,
+        args.output,
+        tuple(args.locales),
+        tuple(args.formats),
+        workers=args.workers,
+        max_in_flight=args.max_in_flight,
+    )
+    print(f"wrote {count} reports to {args.output} in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Process-wide cache of decoded CCTV frames shared across Streamlit sessions."""
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from PIL import Image
+
+from config import FRAME_CACHE_MAX_BYTES, VIDEO_FIRST_FRAME_TIMEOUT_SECONDS
+from metrics import register_cache
+from video_source import get_video_source, is_video_source
+
+
+V = TypeVar("V")
+
+# (absolute path, mtime in ns, file size in bytes)
+FrameKey = tuple[str, int, int]
+
+
+class LRUByteCache(Generic[V]):
+    """Thread-safe LRU mapping bounded by the total byte cost of its values."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[V, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: V, nbytes: int) -> None:
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+def frame_key(path: str) -> FrameKey:
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def _image_nbytes(image: Image.Image) -> int:
+    return image.width * image.height * len(image.getbands())
+
+
+class FrameCache:
+    """Decoded RGB frames keyed by path plus mtime/size, evicted LRU by byte budget.
+
+    Returned images are shared between sessions and marked read-only, so any
+    in-place edit made by a caller copies the pixels first instead of
+    corrupting the cached frame.
+    """
+
+    def __init__(self, max_bytes: int = FRAME_CACHE_MAX_BYTES) -> None:
+        self._lru: LRUByteCache[Image.Image] = LRUByteCache(max_bytes)
+
+    @property
+    def stats(self) -> LRUByteCache[Image.Image]:
+        return self._lru
+
+    def get(self, path: str) -> Image.Image:
+        key = frame_key(path)
+        image = self._lru.get(key)
+        if image is None:
+            with Image.open(path) as source:
+                image = source.convert("RGB")
+            # Pillow copies before mutating images flagged read-only.
+            image.readonly = 1
+            self._lru.put(key, image, _image_nbytes(image))
+        return image
+
+
+_frame_cache: FrameCache | None = None
+_frame_cache_lock = threading.Lock()
+
+
+def get_frame_cache() -> FrameCache:
+    global _frame_cache
+    if _frame_cache is None:
+        with _frame_cache_lock:
+            if _frame_cache is None:
+                _frame_cache = FrameCache()
+                register_cache("frames", lambda: _frame_cache.stats.hits, lambda: _frame_cache.stats.misses)
+    return _frame_cache
+
+
+@dataclass(frozen=True)
+class CameraFrame:
+    image: Image.Image
+    # Image path, video file path or stream URI the frame came from.
+    source: str
+    # Changes whenever the frame does: the FrameKey for still images, the source's sample
+    # sequence number for video (frame indexes repeat when a file loops or a stream reconnects).
+    version: Hashable
+    is_video: bool = False
+
+    @property
+    def name(self) -> str:
+        name = os.path.basename(self.source.rstrip("/"))
+        return f"{name}#{self.version}" if self.is_video else name
+
+
+def load_camera_frame(source: str, timeout: float = VIDEO_FIRST_FRAME_TIMEOUT_SECONDS) -> CameraFrame | None:
+    """Latest frame of a still image, video file or stream.
+
+    None when the image is missing or unreadable, or a video has no frame within `timeout`.
+    """
+    if is_video_source(source):
+        sampled = get_video_source(source).latest(timeout=timeout)
+        if sampled is None:
+            return None
+        return CameraFrame(sampled.image, source, sampled.sequence, is_video=True)
+    try:
+        return CameraFrame(get_frame_cache().get(source), source, frame_key(source))
+    except OSError:  # missing file, or not an image Pillow can decode
+        return None
@@ -0,0 +1,292 @@
+"""Append-only, memory-mapped columnar store of per-camera risk score history."""
+
+import atexit
+import fcntl
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from config import HISTORY_DIR, HISTORY_FLUSH_SECONDS
+from results import AlarmLevel
+from scoring_worker import CameraSnapshot
+
+
+# One fixed-width file per column and camera; rows are appended in time order.
+COLUMNS: dict[str, np.dtype] = {
+    "ts_ms": np.dtype("<i8"),
+    "level": np.dtype("u1"),
+    "score": np.dtype("u1"),
+    "description_id": np.dtype("<u4"),
+}
+
+
+@dataclass(frozen=True)
+class HistorySlice:
+    ts_ms: np.ndarray
+    level: np.ndarray
+    score: np.ndarray
+    description_id: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ts_ms)
+
+
+def _empty_slice() -> HistorySlice:
+    return HistorySlice(*(np.empty(0, dtype=dtype) for dtype in COLUMNS.values()))
+
+
+class _CameraColumns:
+    """Memory maps of one camera's column files plus rows not flushed yet."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.pending: dict[str, list[int]] = {name: [] for name in COLUMNS}
+        self._maps: dict[str, np.ndarray] = {}
+        self._sizes: dict[str, int] = {}
+        self._last_ts_ms: int | None = None
+
+    def last_ts_ms(self) -> int:
+        """Timestamp of the newest row, flushed or pending (-1 when there is none)."""
+        if self._last_ts_ms is None:
+            flushed = self.column("ts_ms")
+            self._last_ts_ms = int(flushed[-1]) if len(flushed) else -1
+        return self._last_ts_ms
+
+    def add(self, row: dict[str, int]) -> None:
+        for name, value in row.items():
+            self.pending[name].append(value)
+        self._last_ts_ms = row["ts_ms"]
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.bin")
+
+    def flush(self) -> None:
+        if not self.pending["ts_ms"]:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        for name, dtype in COLUMNS.items():
+            with open(self.path(name), "ab") as f:
+                f.write(np.asarray(self.pending[name], dtype=dtype).tobytes())
+            self.pending[name].clear()
+
+    def column(self, name: str) -> np.ndarray:
+        path = self.path(name)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if self._sizes.get(name) != size:
+            # Files only grow, so re-map when the size changed since the last query.
+            dtype = COLUMNS[name]
+            count = size // dtype.itemsize
+            self._maps[name] = np.memmap(path, dtype=dtype, mode="r", shape=(count,)) if count else np.empty(0, dtype)
+            self._sizes[name] = size
+        return self._maps[name]
+
+    def flushed(self) -> HistorySlice:
+        columns = {name: self.column(name) for name in COLUMNS}
+        # A crash between column writes can leave one column longer than the others.
+        length = min(len(column) for column in columns.values())
+        return HistorySlice(**{name: column[:length] for name, column in columns.items()})
+
+
+def _time_slice(rows: HistorySlice, start_ms: int, end_ms: int) -> HistorySlice:
+    lo = np.searchsorted(rows.ts_ms, start_ms, side="left")
+    hi = np.searchsorted(rows.ts_ms, end_ms, side="right")
+    return HistorySlice(**{name: getattr(rows, name)[lo:hi] for name in COLUMNS})
+
+
+def _camera_dirname(camera_id: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", camera_id)
+
+
+class HistoryStore:
+    """Per-camera columns of (timestamp, level code, score, description id).
+
+    Each camera has its own time-ordered columns, so a camera time range is two binary
+    searches over a memory map and a fleet-wide range is one per camera. Description
+    strings are interned in a shared table. Only one process may write: the first to
+    take the directory lock; every other instance is read-only, and a `read_only` one
+    never creates files. Rows older than a camera's newest row are dropped, since results
+    are published from several threads and `range` relies on the columns being sorted.
+    """
+
+    def __init__(
+        self,
+        root: str = HISTORY_DIR,
+        flush_seconds: float = HISTORY_FLUSH_SECONDS,
+        read_only: bool = False,
+    ) -> None:
+        self.root = root
+        self.flush_seconds = flush_seconds
+        self._lock = threading.Lock()
+        self._cameras: dict[str, _CameraColumns] = {}
+        self._descriptions: list[str] = []
+        self._description_ids: dict[str, int] = {}
+        self._last_flush = time.monotonic()
+        self._lock_file = None
+        self.writable = False
+        if not read_only:
+            os.makedirs(root, exist_ok=True)
+            self._lock_file = open(os.path.join(root, "writer.lock"), "a")
+            try:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                self.writable = True
+            except BlockingIOError:
+                pass
+        self._load_metadata()
+
+    def _metadata_path(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def _load_metadata(self) -> None:
+        cameras_path = self._metadata_path("cameras.json")
+        if os.path.exists(cameras_path):
+            with open(cameras_path, encoding="utf-8") as f:
+                for camera_id, dirname in json.load(f).items():
+                    self._cameras.setdefault(camera_id, _CameraColumns(os.path.join(self.root, dirname)))
+        descriptions_path = self._metadata_path("descriptions.json")
+        if os.path.exists(descriptions_path):
+            with open(descriptions_path, encoding="utf-8") as f:
+                descriptions = json.load(f)
+            for text in descriptions[len(self._descriptions):]:
+                self._description_ids[text] = len(self._descriptions)
+                self._descriptions.append(text)
+
+    def _write_json(self, name: str, data: object) -> None:
+        path = self._metadata_path(name)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(f"{path}.tmp", path)
+
+    def _camera(self, camera_id: str) -> _CameraColumns:
+        columns = self._cameras.get(camera_id)
+        if columns is None:
+            columns = _CameraColumns(os.path.join(self.root, _camera_dirname(camera_id)))
+            self._cameras[camera_id] = columns
+            self._write_json(
+                "cameras.json",
+                {cid: os.path.basename(cols.directory) for cid, cols in self._cameras.items()},
+            )
+        return columns
+
+    def _description_id(self, text: str) -> int:
+        description_id = self._description_ids.get(text)
+        if description_id is None:
+            description_id = self._description_ids[text] = len(self._descriptions)
+            self._descriptions.append(text)
+            self._write_json("descriptions.json", self._descriptions)
+        return description_id
+
+    def append(self, camera_id: str, ts: float, level: AlarmLevel, score: int, description: str) -> bool:
+        """Append one row; False if it was dropped (read-only store, or older than the camera's last row)."""
+        if not self.writable:
+            return False
+        with self._lock:
+            appended = self._append_locked(camera_id, ts, level, score, description)
+            self._maybe_flush_locked()
+        return appended
+
+    def record(self, snapshots: dict[str, CameraSnapshot], version: int) -> None:
+        """Append the cameras published at store `version` (a `ResultStore` listener)."""
+        if not self.writable:
+            return
+        with self._lock:
+            for camera_id, snapshot in snapshots.items():
+                if snapshot.version == version:
+                    result = snapshot.result
+                    self._append_locked(
+                        camera_id, snapshot.updated_at, result.level, result.risk_score, result.description
+                    )
+            self._maybe_flush_locked()
+
+    def _append_locked(self, camera_id: str, ts: float, level: AlarmLevel, score: int, description: str) -> bool:
+        columns = self._camera(camera_id)
+        ts_ms = int(ts * 1000)
+        if ts_ms < columns.last_ts_ms():
+            return False
+        columns.add(
+            {
+                "ts_ms": ts_ms,
+                "level": int(level),
+                "score": score,
+                "description_id": self._description_id(description),
+            }
+        )
+        return True
+
+    def _maybe_flush_locked(self) -> None:
+        if time.monotonic() - self._last_flush >= self.flush_seconds:
+            self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        for columns in self._cameras.values():
+            columns.flush()
+        self._last_flush = time.monotonic()
+
+    def cameras(self) -> list[str]:
+        if not self.writable:
+            self._load_metadata()
+        return list(self._cameras)
+
+    def description(self, description_id: int) -> str:
+        if description_id >= len(self._descriptions):
+            self._load_metadata()
+        return self._descriptions[description_id]
+
+    def range(self, camera_id: str, start: float, end: float) -> HistorySlice:
+        """Rows of one camera with `start <= ts <= end` (epoch seconds)."""
+        if camera_id not in self._cameras and not self.writable:
+            self._load_metadata()
+        columns = self._cameras.get(camera_id)
+        if columns is None:
+            return _empty_slice()
+        with self._lock:
+            flushed = columns.flushed()
+            pending = {name: np.asarray(values, dtype=COLUMNS[name]) for name, values in columns.pending.items()}
+        start_ms, end_ms = int(start * 1000), int(end * 1000)
+        # Slice the memory map before touching pending rows, so only the rows in range are copied.
+        rows = _time_slice(flushed, start_ms, end_ms)
+        if len(pending["ts_ms"]):
+            recent = _time_slice(HistorySlice(**pending), start_ms, end_ms)
+            if len(recent):
+                rows = HistorySlice(
+                    **{name: np.concatenate([getattr(rows, name), getattr(recent, name)]) for name in COLUMNS}
+                )
+        return rows
+
+    def range_all(self, start: float, end: float) -> dict[str, HistorySlice]:
+        return {camera_id: self.range(camera_id, start, end) for camera_id in self.cameras()}
+
+    def close(self) -> None:
+        if self.writable:
+            self.flush()
+            self.writable = False
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+def history_root() -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), HISTORY_DIR)
+
+
+_history_store: HistoryStore | None = None
+_history_store_lock = threading.Lock()
+
+
+def get_history_store() -> HistoryStore:
+    global _history_store
+    if _history_store is None:
+        with _history_store_lock:
+            if _history_store is None:
+                _history_store = HistoryStore(history_root())
+                # Rows still pending at exit would otherwise be lost.
+                atexit.register(_history_store.close)
+    return _history_store
@@ -0,0 +1,298 @@
+"""Pluggable VLM inference backends returning dashboard risk results."""
+
+import base64
+import hashlib
+import io
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from PIL import Image
+
+from config import (
+    INFERENCE_BACKEND,
+    INFERENCE_HTTP_POOL_SIZE,
+    INFERENCE_HTTP_TIMEOUT_SECONDS,
+    INFERENCE_SERVER_URL,
+    ONNX_INPUT_MEAN,
+    ONNX_INPUT_SIZE,
+    ONNX_INPUT_STD,
+    ONNX_INTER_OP_THREADS,
+    ONNX_INTRA_OP_THREADS,
+    ONNX_MODEL_FILENAME,
+    ONNX_MODEL_PATH,
+    ONNX_MODEL_REPO_ID,
+    PREPROCESS_MIN_BATCH,
+    PREPROCESS_WORKERS,
+    REMOTE_FRAME_MAX_SIDE,
+    RESULT_CACHE_ENABLED,
+    RESULT_CACHE_HASH,
+)
+from metrics import register_cache
+from preprocess import Preprocessor, get_preprocessor, normalize_image
+from result_cache import FrameHasher, ResultCache
+from results import MockResult, build_results
+
+
+@dataclass(frozen=True)
+class Frame:
+    # Stable identity of the frame source, e.g. "case1.png-CCTV1".
+    key: str
+    image: Image.Image
+    path: str | None = None
+
+
+class InferenceBackend(ABC):
+    """Scores a batch of frames in one call; `infer` wraps scores into `MockResult`s."""
+
+    model_version = "unknown"
+    # False when scores depend on the frame key rather than its pixels (e.g. the mock).
+    content_addressed = True
+
+    @abstractmethod
+    def score_batch(self, frames: Sequence[Frame]) -> list[int]:
+        """Return one 0-100 risk score per frame, in input order."""
+
+    def infer(
+        self,
+        frames: Sequence[Frame],
+        descriptions: dict[str, str],
+        report_template: str,
+    ) -> list[MockResult]:
+        scores = self.score_batch(frames) if frames else []
+        return build_results(scores, descriptions, report_template)
+
+
+class MockBackend(InferenceBackend):
+    """Deterministic offline backend deriving a score from the SHA-256 of the frame key."""
+
+    model_version = "mock-sha256"
+    content_addressed = False
+
+    def score_batch(self, frames: Sequence[Frame]) -> list[int]:
+        scores = []
+        for frame in frames:
+            digest = hashlib.sha256(frame.key.encode("utf-8")).hexdigest()
+            scores.append(45 + (int(digest[:8], 16) % 51))
+        return scores
+
+
+_onnx_sessions: dict[tuple[str, int, int], Any] = {}
+_onnx_sessions_lock = threading.Lock()
+
+
+def get_onnx_session(model_path: str, intra_op_threads: int = 0, inter_op_threads: int = 0) -> Any:
+    """Return the process-wide CPU `InferenceSession` for a model and thread configuration."""
+    key = (os.path.abspath(model_path), intra_op_threads, inter_op_threads)
+    with _onnx_sessions_lock:
+        session = _onnx_sessions.get(key)
+        if session is None:
+            import onnxruntime as ort
+
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            # 0 lets onnxruntime pick the number of physical cores.
+            options.intra_op_num_threads = intra_op_threads
+            options.inter_op_num_threads = inter_op_threads
+            if inter_op_threads > 1:
+                options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+            session = ort.InferenceSession(key[0], sess_options=options, providers=["CPUExecutionProvider"])
+            _onnx_sessions[key] = session
+        return session
+
+
+def resolve_onnx_model_path() -> str:
+    if ONNX_MODEL_PATH and os.path.exists(ONNX_MODEL_PATH):
+        return ONNX_MODEL_PATH
+    if ONNX_MODEL_REPO_ID:
+        from huggingface_hub import hf_hub_download
+
+        return hf_hub_download(repo_id=ONNX_MODEL_REPO_ID, filename=ONNX_MODEL_FILENAME)
+    raise FileNotFoundError(
+        f"ONNX model not found: set ONNX_MODEL_PATH ({ONNX_MODEL_PATH!r}) or ONNX_MODEL_REPO_ID in config.py."
+    )
+
+
+class OnnxBackend(InferenceBackend):
+    """CPU ONNX Runtime backend running every frame of a refresh in one session call.
+
+    The model takes an `NCHW` float32 batch normalized with `ONNX_INPUT_MEAN`/`ONNX_INPUT_STD`
+    and returns a risk probability in [0, 1] per frame, shaped `(N,)` or `(N, 1)`.
+    Batches of at least `PREPROCESS_MIN_BATCH` frames are prepared by the shared-memory
+    process pool; smaller ones are cheaper to prepare inline.
+    """
+
+    def __init__(
+        self,
+        model_path: str | None = None,
+        input_size: tuple[int, int] = ONNX_INPUT_SIZE,
+        intra_op_threads: int = ONNX_INTRA_OP_THREADS,
+        inter_op_threads: int = ONNX_INTER_OP_THREADS,
+    ) -> None:
+        model_path = model_path or resolve_onnx_model_path()
+        self.session = get_onnx_session(model_path, intra_op_threads, inter_op_threads)
+        self.input_name = self.session.get_inputs()[0].name
+        self.input_size = input_size
+        self._mean = np.asarray(ONNX_INPUT_MEAN, dtype=np.float32).reshape(3, 1, 1)
+        self._std = np.asarray(ONNX_INPUT_STD, dtype=np.float32).reshape(3, 1, 1)
+        self.preprocessor: Preprocessor | None = None
+        if PREPROCESS_WORKERS >= 0:
+            self.preprocessor = get_preprocessor(input_size, ONNX_INPUT_MEAN, ONNX_INPUT_STD)
+        stat = os.stat(model_path)
+        self.model_version = f"onnx:{os.path.basename(model_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def preprocess(self, image: Image.Image) -> np.ndarray:
+        return normalize_image(image, self.input_size, self._mean, self._std)
+
+    def run_tensor(self, batch: np.ndarray) -> list[int]:
+        outputs = self.session.run(None, {self.input_name: batch})[0]
+        probabilities = np.clip(np.asarray(outputs, dtype=np.float32).reshape(len(batch)), 0.0, 1.0)
+        return np.rint(probabilities * 100).astype(int).tolist()
+
+    def score_batch(self, frames: Sequence[Frame]) -> list[int]:
+        if self.preprocessor is None or len(frames) < PREPROCESS_MIN_BATCH:
+            return self.run_tensor(np.stack([self.preprocess(frame.image) for frame in frames]))
+        with self.preprocessor.prepare([frame.path or frame.image for frame in frames]) as batch:
+            return self.run_tensor(batch.array)
+
+
+class RemoteBackend(InferenceBackend):
+    """Client for `inference_server.py`, sharing one pooled HTTP session per process."""
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        pool_size: int = INFERENCE_HTTP_POOL_SIZE,
+        timeout: float = INFERENCE_HTTP_TIMEOUT_SECONDS,
+    ) -> None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.base_url = (base_url or os.environ.get("VLM_INFERENCE_SERVER_URL") or INFERENCE_SERVER_URL).rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Known up front, so results cached before and after the first batch share one version.
+        self.model_version = self._fetch_model_version()
+
+    def _fetch_model_version(self) -> str:
+        import requests
+
+        try:
+            response = self.session.get(f"{self.base_url}/healthz", timeout=min(self.timeout, 5))
+            response.raise_for_status()
+            return f"remote:{response.json()['model_version']}"
+        except (requests.RequestException, ValueError, KeyError):
+            # The service is not up yet; the first response names its model.
+            return f"remote:{self.base_url}"
+
+    @staticmethod
+    def encode_frame(image: Image.Image) -> str:
+        image = image.convert("RGB")
+        if max(image.size) > REMOTE_FRAME_MAX_SIDE:
+            image = image.copy()
+            image.thumbnail((REMOTE_FRAME_MAX_SIDE, REMOTE_FRAME_MAX_SIDE), Image.Resampling.BILINEAR)
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=90)
+        return base64.b64encode(buffer.getvalue()).decode()
+
+    def score_batch(self, frames: Sequence[Frame]) -> list[int]:
+        payload = {"frames": [{"key": frame.key, "image_b64": self.encode_frame(frame.image)} for frame in frames]}
+        response = self.session.post(f"{self.base_url}/v1/infer", json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        body = response.json()
+        version = f"remote:{body['model_version']}"
+        if version != self.model_version:
+            # The service was unreachable at start, or has been redeployed with another model.
+            self.model_version = version
+        return [int(result["risk_score"]) for result in body["results"]]
+
+
+class CachedBackend(InferenceBackend):
+    """Wraps a backend so each distinct frame is scored at most once per cache TTL.
+
+    Keys combine the wrapped backend's model version with a hash of the decoded frame
+    (or the frame key for backends that are not content-addressed). Duplicates inside
+    one batch, such as cameras pointed at the same image, are scored once.
+    """
+
+    def __init__(
+        self,
+        backend: InferenceBackend,
+        cache: ResultCache | None = None,
+        hash_mode: str = RESULT_CACHE_HASH,
+    ) -> None:
+        self.backend = backend
+        self.cache = cache if cache is not None else ResultCache()
+        self.hasher = FrameHasher(hash_mode)
+        self.content_addressed = backend.content_addressed
+
+    @property
+    def model_version(self) -> str:
+        return self.backend.model_version
+
+    def cache_key(self, frame: Frame) -> tuple[str, str]:
+        fingerprint = self.hasher(frame.image) if self.content_addressed else f"key:{frame.key}"
+        return self.backend.model_version, fingerprint
+
+    def score_batch(self, frames: Sequence[Frame]) -> list[int]:
+        scores: list[int | None] = [None] * len(frames)
+        pending: dict[tuple[str, str], list[int]] = {}
+        for index, frame in enumerate(frames):
+            key = self.cache_key(frame)
+            if key in pending:
+                pending[key].append(index)
+                continue
+            score = self.cache.get(key)
+            if score is None:
+                pending[key] = [index]
+            else:
+                scores[index] = score
+
+        if pending:
+            fresh = self.backend.score_batch([frames[indices[0]] for indices in pending.values()])
+            # Filed under the version that produced the scores, which a remote backend may only
+            # learn from the response.
+            version = self.backend.model_version
+            for ((_, fingerprint), indices), score in zip(pending.items(), fresh):
+                self.cache.put((version, fingerprint), score)
+                for index in indices:
+                    scores[index] = score
+        return scores
+
+
+_BACKENDS: dict[str, type[InferenceBackend]] = {
+    "mock": MockBackend,
+    "onnx": OnnxBackend,
+    "remote": RemoteBackend,
+}
+
+
+def create_backend(name: str | None = None) -> InferenceBackend:
+    name = (name or os.environ.get("VLM_INFERENCE_BACKEND") or INFERENCE_BACKEND).lower()
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown inference backend {name!r}; expected one of {sorted(_BACKENDS)}.")
+    return _BACKENDS[name]()
+
+
+_backend: InferenceBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def get_backend() -> InferenceBackend:
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                backend = create_backend()
+                if RESULT_CACHE_ENABLED:
+                    backend = CachedBackend(backend)
+                    register_cache("results", lambda: backend.cache.hits, lambda: backend.cache.misses)
+                _backend = backend
+    return _backend
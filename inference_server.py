@@ -0,0 +1,292 @@
+"""Standalone FastAPI inference service coalescing concurrent requests into micro-batches.
+
+Run with `uvicorn inference_server:app --host 0.0.0.0 --port 8000`.
+"""
+
+import asyncio
+import base64
+import functools
+import io
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from PIL import Image
+from pydantic import BaseModel
+
+from alarm_events import IncidentFeed, get_alarm_pipeline, get_incident_feed
+from config import (
+    DEFAULT_LOCALE,
+    INFERENCE_MAX_BATCH_SIZE,
+    INFERENCE_MAX_WAIT_MS,
+    INFERENCE_SERVER_BACKEND,
+    LIVE_ALLOWED_ORIGINS,
+    LIVE_KEEPALIVE_SECONDS,
+    LIVE_SCORING_ENABLED,
+    LOCALE_QUERY_PARAM,
+    LOCALES,
+    RESULT_CACHE_ENABLED,
+)
+from inference import CachedBackend, Frame, InferenceBackend, create_backend
+from live_events import KEEPALIVE, RETRY, incident_events, state_events, stream_locale
+from metrics import CONTENT_TYPE, STAGE_SECONDS, get_registry, register_cache
+from pipeline import load_camera_frames, score_cameras
+from report_templates import OVERRIDE_DESCRIPTION_KEY, REPORT_TEMPLATE_KEY, render_report
+from results import AlarmLevel, build_results
+from scoring_worker import ResultStore, ScoringWorker
+
+
+BATCH_SIZE_HISTOGRAM = get_registry().histogram(
+    "vlm_inference_batch_size",
+    "Frames per micro-batch sent to the backend.",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+
+
+class FrameIn(BaseModel):
+    key: str
+    # Base64 of an encoded image file (JPEG/PNG/WebP).
+    image_b64: str
+    # Camera named in the report; defaults to `key`, which usually identifies the frame.
+    cctv_id: str | None = None
+
+
+class InferRequest(BaseModel):
+    frames: list[FrameIn]
+    locale: str = DEFAULT_LOCALE
+
+
+class ResultOut(BaseModel):
+    alarm_level: str
+    risk_score: int
+    description: str
+    report_markdown: str
+
+
+class InferResponse(BaseModel):
+    model_version: str
+    results: list[ResultOut]
+
+
+class MicroBatcher:
+    """Queues frames from concurrent requests and scores them together.
+
+    A batch is dispatched once it holds `max_batch_size` frames or `max_wait_ms`
+    has passed since its first frame arrived, whichever comes first.
+    """
+
+    def __init__(self, backend: InferenceBackend, max_batch_size: int, max_wait_ms: float) -> None:
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue[tuple[Frame, asyncio.Future[int]]] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, frames: list[Frame]) -> list[int]:
+        loop = asyncio.get_running_loop()
+        futures = []
+        for frame in frames:
+            future: asyncio.Future[int] = loop.create_future()
+            self._queue.put_nowait((frame, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    async def _collect(self) -> list[tuple[Frame, asyncio.Future[int]]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            frames = [frame for frame, _ in batch]
+            try:
+                # One batch in flight at a time; the backend owns intra-op parallelism.
+                BATCH_SIZE_HISTOGRAM.observe(len(frames))
+                with STAGE_SECONDS.time(stage="server_batch"):
+                    scores = await asyncio.to_thread(self.backend.score_batch, frames)
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), score in zip(batch, scores):
+                if not future.done():
+                    future.set_result(score)
+
+
+class AlarmBroadcaster:
+    """Fans store updates and incident batches out to SSE clients; a slow client holds one wakeup at most."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._queues: set[asyncio.Queue[int]] = set()
+
+    def notify_threadsafe(self, version: int) -> None:
+        self._loop.call_soon_threadsafe(self._notify, version)
+
+    def _notify(self, version: int) -> None:
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(version)
+
+    def subscribe(self) -> asyncio.Queue[int]:
+        queue: asyncio.Queue[int] = asyncio.Queue(maxsize=1)
+        self._queues.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[int]) -> None:
+        self._queues.discard(queue)
+
+
+def _decode_frame(frame: FrameIn) -> Frame:
+    with Image.open(io.BytesIO(base64.b64decode(frame.image_b64))) as source:
+        image = source.convert("RGB")
+    return Frame(key=frame.key, image=image)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    backend = create_backend(os.environ.get("VLM_SERVER_BACKEND") or INFERENCE_SERVER_BACKEND)
+    if RESULT_CACHE_ENABLED:
+        backend = CachedBackend(backend)
+        register_cache("server_results", lambda: backend.cache.hits, lambda: backend.cache.misses)
+    app.state.batcher = MicroBatcher(backend, INFERENCE_MAX_BATCH_SIZE, INFERENCE_MAX_WAIT_MS)
+    app.state.batcher.start()
+    get_registry().gauge(
+        "vlm_inference_queue_depth",
+        "Frames waiting for the micro-batcher.",
+        callback=lambda: {(): float(app.state.batcher.queue_depth)},
+    )
+
+    app.state.store = ResultStore()
+    app.state.broadcaster = AlarmBroadcaster(asyncio.get_running_loop())
+    app.state.store.subscribe(app.state.broadcaster.notify_threadsafe)
+    get_alarm_pipeline().attach(app.state.store)
+    app.state.incidents = get_incident_feed()
+    app.state.incidents.subscribe(app.state.broadcaster.notify_threadsafe)
+    worker = None
+    if LIVE_SCORING_ENABLED or os.environ.get("VLM_LIVE_SCORING") == "1":
+        # Locale-neutral keys, resolved per stream client like the dashboard does per session.
+        score = functools.partial(
+            score_cameras,
+            descriptions={level.label: level.label for level in AlarmLevel},
+            report_template=REPORT_TEMPLATE_KEY,
+            override_description=OVERRIDE_DESCRIPTION_KEY,
+            backend=backend,
+        )
+        worker = ScoringWorker(load_camera_frames, score, app.state.store)
+        await asyncio.to_thread(worker.start)
+    yield
+    if worker is not None:
+        await asyncio.to_thread(worker.stop)
+    # The feed outlives the app; it must not call into this app's closed event loop.
+    app.state.incidents.unsubscribe(app.state.broadcaster.notify_threadsafe)
+    await app.state.batcher.stop()
+
+
+app = FastAPI(title="PIA-SPACE VLM Inference", lifespan=lifespan)
+app.add_middleware(CORSMiddleware, allow_origins=LIVE_ALLOWED_ORIGINS, allow_methods=["GET"])
+
+
+@app.get("/healthz")
+async def healthz() -> dict[str, str | int]:
+    batcher: MicroBatcher = app.state.batcher
+    return {"model_version": batcher.backend.model_version, "queue_depth": batcher.queue_depth}
+
+
+@app.get("/metrics")
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(get_registry().render(), media_type=CONTENT_TYPE)
+
+
+@app.post("/v1/infer", response_model=InferResponse)
+async def infer(request: InferRequest) -> InferResponse:
+    if request.locale not in LOCALES:
+        raise HTTPException(status_code=422, detail=f"Unsupported locale {request.locale!r}.")
+    try:
+        frames = await asyncio.to_thread(lambda: [_decode_frame(frame) for frame in request.frames])
+    except (ValueError, OSError) as exc:
+        raise HTTPException(status_code=400, detail=f"Could not decode frame: {exc}") from exc
+
+    batcher: MicroBatcher = app.state.batcher
+    scores = await batcher.submit(frames)
+    texts = LOCALES[request.locale]
+    results = []
+    scored = build_results(scores, texts["risk_level_descriptions"], texts["report_template"])
+    for frame, result in zip(request.frames, scored):
+        fields = result.to_dict()
+        cctv_id = frame.cctv_id or frame.key
+        fields["report_markdown"] = render_report(result.report_markdown, request.locale, cctv_id, result)
+        results.append(ResultOut(**fields))
+    return InferResponse(model_version=batcher.backend.model_version, results=results)
+
+
+@app.get("/v1/alarms/stream")
+async def alarm_stream(lang: str | None = Query(None, alias=LOCALE_QUERY_PARAM)) -> StreamingResponse:
+    """Server-sent events: the current state of every camera, then one `alarm` event per change,
+    one `offline` event per camera that stops producing frames, and one `incident` event per
+    alarm open/close."""
+    store: ResultStore = app.state.store
+    incidents: IncidentFeed = app.state.incidents
+    broadcaster: AlarmBroadcaster = app.state.broadcaster
+    locale = stream_locale(lang)
+
+    async def events() -> AsyncIterator[str]:
+        queue = broadcaster.subscribe()
+        sent: dict[str, tuple[int, int, int]] = {}
+        # Incidents recorded before the client connected are not replayed.
+        sequence = incidents.sequence
+        try:
+            yield RETRY
+            while True:
+                text = state_events(store.snapshot(), sent, locale)
+                incident_text, sequence = incident_events(incidents, sequence)
+                if text or incident_text:
+                    yield text + incident_text
+                try:
+                    await asyncio.wait_for(queue.get(), LIVE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield KEEPALIVE
+        finally:
+            broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host="0.0.0.0", port=8000)
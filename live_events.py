@@ -0,0 +1,183 @@
+"""Server-sent alarm events for the live strip, streamed straight from a `ResultStore`.
+
+The dashboard serves its own scoring worker's store (`start_live_event_server`), so the
+strip shows exactly the results the tiles do; the inference service sends the same events
+on `/v1/alarms/stream` when it scores cameras itself. A client gets the current state of
+every camera, then one `alarm` event per change, with descriptions in its `?lang=` locale,
+one `offline` event per camera that stops producing frames, and one `incident` event per alarm open/close from the process's `IncidentFeed`.
+"""
+
+import json
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from alarm_events import IncidentFeed, event_payload
+from config import DEFAULT_LOCALE, LIVE_ALLOWED_ORIGINS, LIVE_KEEPALIVE_SECONDS, LOCALE_QUERY_PARAM, LOCALES
+from report_templates import resolve_description
+from scoring_worker import CameraSnapshot, ResultStore
+
+
+STREAM_PATH = "/v1/alarms/stream"
+RETRY = "retry: 2000\n\n"
+KEEPALIVE = ": keepalive\n\n"
+
+
+def stream_locale(requested: str | None) -> str:
+    return requested if requested in LOCALES else DEFAULT_LOCALE
+
+
+def format_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def alarm_deltas(
+    snapshots: dict[str, CameraSnapshot],
+    sent: dict[str, tuple[int, int, int]],
+    locale: str,
+) -> list[dict[str, str | int | float]]:
+    """`alarm` payloads for the cameras whose state differs from what `sent` records."""
+    deltas = []
+    for camera_id, snapshot in snapshots.items():
+        result = snapshot.result
+        state = (result.level, result.risk_score, result.description_id)
+        if sent.get(camera_id) == state:
+            continue
+        sent[camera_id] = state
+        deltas.append(
+            {
+                "camera_id": camera_id,
+                "level": result.alarm_level,
+                "score": result.risk_score,
+                "description": resolve_description(result.description, locale),
+                "ts": snapshot.updated_at,
+            }
+        )
+    return deltas
+
+
+def offline_deltas(snapshots: dict[str, CameraSnapshot], sent: dict[str, tuple[int, int, int]]) -> list[dict[str, str]]:
+    """`offline` payloads for the cameras `sent` records that have left the store, which forgets them."""
+    gone = [camera_id for camera_id in sent if camera_id not in snapshots]
+    for camera_id in gone:
+        del sent[camera_id]
+    return [{"camera_id": camera_id} for camera_id in gone]
+
+
+def state_events(snapshots: dict[str, CameraSnapshot], sent: dict[str, tuple[int, int, int]], locale: str) -> str:
+    """`alarm` and `offline` events taking a client from what `sent` records to `snapshots`."""
+    return "".join(
+        [
+            *(format_event("alarm", delta) for delta in alarm_deltas(snapshots, sent, locale)),
+            *(format_event("offline", delta) for delta in offline_deltas(snapshots, sent)),
+        ]
+    )
+
+
+def incident_events(feed: IncidentFeed, sequence: int) -> tuple[str, int]:
+    """`incident` events for what `feed` recorded after `sequence`, and the sequence they reach."""
+    events, sequence = feed.since(sequence)
+    return "".join(format_event("incident", event_payload(event)) for event in events), sequence
+
+
+def allowed_origin(origin: str | None) -> str | None:
+    """Value for Access-Control-Allow-Origin, or None when `origin` may not read the stream."""
+    if "*" in LIVE_ALLOWED_ORIGINS:
+        return "*"
+    return origin if origin in LIVE_ALLOWED_ORIGINS else None
+
+
+class _LiveEventHandler(BaseHTTPRequestHandler):
+    server: "LiveEventServer"
+
+    def do_GET(self) -> None:
+        path, _, query = self.path.partition("?")
+        if path != STREAM_PATH:
+            self.send_error(404)
+            return
+        locale = stream_locale(urllib.parse.parse_qs(query).get(LOCALE_QUERY_PARAM, [None])[0])
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        origin = allowed_origin(self.headers.get("Origin"))
+        if origin is not None:
+            self.send_header("Access-Control-Allow-Origin", origin)
+        self.end_headers()
+        server = self.server
+        sent: dict[str, tuple[int, int, int]] = {}
+        try:
+            self._send(RETRY)
+            changes = server.changes
+            # Incidents recorded before the client connected are not replayed.
+            sequence = server.incidents.sequence if server.incidents is not None else 0
+            while True:
+                sequence = self._send_updates(sent, locale, sequence)
+                latest = server.wait_for_change(changes, LIVE_KEEPALIVE_SECONDS)
+                while latest == changes:
+                    self._send(KEEPALIVE)
+                    latest = server.wait_for_change(changes, LIVE_KEEPALIVE_SECONDS)
+                changes = latest
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the browser closed the strip
+
+    def _send_updates(self, sent: dict[str, tuple[int, int, int]], locale: str, sequence: int) -> int:
+        text = state_events(self.server.store.snapshot(), sent, locale)
+        if self.server.incidents is not None:
+            incidents, sequence = incident_events(self.server.incidents, sequence)
+            text += incidents
+        if text:
+            self._send(text)
+        return sequence
+
+    def _send(self, text: str) -> None:
+        self.wfile.write(text.encode("utf-8"))
+        self.wfile.flush()
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class LiveEventServer(ThreadingHTTPServer):
+    # One thread per connected strip; they must not keep the process alive.
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], store: ResultStore, incidents: IncidentFeed | None = None) -> None:
+        super().__init__(address, _LiveEventHandler)
+        self.store = store
+        self.incidents = incidents
+        # Bumped on every store publish and incident batch; connections wait on it together.
+        self.changes = 0
+        self._condition = threading.Condition()
+        store.subscribe(self._changed)
+        if incidents is not None:
+            incidents.subscribe(self._changed)
+
+    def _changed(self, _: int) -> None:
+        with self._condition:
+            self.changes += 1
+            self._condition.notify_all()
+
+    def wait_for_change(self, since: int, timeout: float) -> int:
+        with self._condition:
+            self._condition.wait_for(lambda: self.changes > since, timeout)
+            return self.changes
+
+
+_server: LiveEventServer | None = None
+_server_lock = threading.Lock()
+
+
+def start_live_event_server(
+    store: ResultStore, host: str, port: int, incidents: IncidentFeed | None = None
+) -> LiveEventServer | None:
+    """Stream `store` (and `incidents`) on `STREAM_PATH` from a daemon thread once per process;
+    None if the port is taken."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = LiveEventServer((host, port), store, incidents)
+            except OSError:
+                return None
+            threading.Thread(target=_server.serve_forever, name="live-event-server", daemon=True).start()
+        return _server
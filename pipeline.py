@@ -0,0 +1,78 @@
+"""Camera frame loading and scoring shared by the dashboard and the inference service."""
+
+import os
+import time
+from collections.abc import Iterable
+
+from camera_registry import get_camera_registry
+from change_gate import get_change_gate
+from config import VIDEO_FIRST_FRAME_TIMEOUT_SECONDS
+from frame_cache import CameraFrame, load_camera_frame
+from inference import Frame, InferenceBackend, get_backend
+from metrics import CAMERA_RISK_SCORE, FRAME_LOAD_SECONDS, FRAMES_SCORED, STAGE_SECONDS
+from results import MockResult
+from rules import get_rules_engine
+from video_source import get_video_source, is_video_source
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@STAGE_SECONDS.time(stage="load_frames")
+def load_camera_frames(cctv_ids: Iterable[str] | None = None) -> dict[str, CameraFrame | None]:
+    """Current frames of `cctv_ids` (default: every registered camera); unknown ids are skipped.
+
+    Cameras without a frame (a missing image, or a video or stream that has produced
+    nothing yet) map to None: they are offline, and are not scored.
+    """
+    registry = get_camera_registry()
+    ids = registry.ids() if cctv_ids is None else cctv_ids
+    cameras = [registry.get(cctv_id) for cctv_id in ids if cctv_id in registry]
+    # Start every video decoder before waiting on any, and share one deadline across the
+    # pass, so dead streams cost at most one first-frame timeout together, not one each.
+    for camera in cameras:
+        if is_video_source(camera.source):
+            get_video_source(camera.source)
+    deadline = time.monotonic() + VIDEO_FIRST_FRAME_TIMEOUT_SECONDS
+
+    loaded: dict[str, CameraFrame | None] = {}
+    for camera in cameras:
+        with FRAME_LOAD_SECONDS.time(camera=camera.id):
+            frame = load_camera_frame(camera.source, timeout=max(0.0, deadline - time.monotonic()))
+        if frame is None:
+            CAMERA_RISK_SCORE.remove(camera=camera.id)
+        loaded[camera.id] = frame
+    return loaded
+
+
+def score_cameras(
+    cameras: dict[str, CameraFrame],
+    descriptions: dict[str, str],
+    report_template: str,
+    override_description: str,
+    backend: InferenceBackend | None = None,
+) -> dict[str, MockResult]:
+    backend = backend or get_backend()
+    cctv_ids = list(cameras)
+    frames = [
+        Frame(
+            key=f"{cameras[cctv_id].name}-{cctv_id}",
+            image=cameras[cctv_id].image,
+            path=None if cameras[cctv_id].is_video else cameras[cctv_id].source,
+        )
+        for cctv_id in cctv_ids
+    ]
+
+    def infer(changed: list[Frame]) -> list[MockResult]:
+        FRAMES_SCORED.inc(len(changed))
+        with STAGE_SECONDS.time(stage="inference"):
+            return backend.infer(changed, descriptions, report_template)
+
+    with STAGE_SECONDS.time(stage="score"):
+        scored = get_change_gate().run(cctv_ids, frames, infer)
+    results = get_rules_engine().current().apply(
+        dict(zip(cctv_ids, scored)), descriptions, report_template, override_description
+    )
+    for cctv_id, result in results.items():
+        CAMERA_RISK_SCORE.set(result.risk_score, camera=cctv_id)
+    return results
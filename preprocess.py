@@ -0,0 +1,147 @@
+"""Process-pool frame preprocessing writing model-ready tensors into shared memory."""
+
+import math
+import multiprocessing
+import os
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from PIL import Image
+
+from config import PREPROCESS_WORKERS
+
+
+def normalize_image(
+    image: Image.Image,
+    input_size: tuple[int, int],
+    mean: np.ndarray,
+    std: np.ndarray,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Resize to `input_size` and return a normalized float32 CHW array (written into `out` if given)."""
+    resized = image.convert("RGB").resize(input_size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+    array = np.asarray(resized, dtype=np.float32).transpose(2, 0, 1)
+    if out is None:
+        out = np.empty(array.shape, dtype=np.float32)
+    np.multiply(array, 1 / 255.0, out=out)
+    out -= mean
+    out /= std
+    return out
+
+
+def _prepare_into_shared(
+    shm_name: str,
+    shape: tuple[int, ...],
+    index: int,
+    path: str,
+    input_size: tuple[int, int],
+    mean: np.ndarray,
+    std: np.ndarray,
+) -> None:
+    # Pool workers share the parent's resource tracker, so attaching does not take ownership.
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        batch = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+        with Image.open(path) as source:
+            # JPEG sources decode at 1/2, 1/4 or 1/8 scale when that still covers the input size.
+            source.draft("RGB", input_size)
+            normalize_image(source, input_size, mean, std, out=batch[index])
+        del batch
+    finally:
+        shm.close()
+
+
+class SharedBatch:
+    """An `NCHW` float32 batch backed by shared memory; call `release()` when done with it."""
+
+    def __init__(self, count: int, input_size: tuple[int, int]) -> None:
+        self.shape = (count, 3, input_size[1], input_size[0])
+        nbytes = max(1, math.prod(self.shape) * np.dtype(np.float32).itemsize)
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self.array = np.ndarray(self.shape, dtype=np.float32, buffer=self._shm.buf)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def release(self) -> None:
+        del self.array
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedBatch":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
+
+
+class Preprocessor:
+    """Decodes, converts, resizes and normalizes frames for N cameras in parallel.
+
+    Frames given as file paths are prepared by worker processes, which write straight
+    into a shared-memory batch so no pixel arrays are pickled between processes.
+    Frames already decoded in this process (e.g. video samples) are normalized in place.
+    """
+
+    def __init__(
+        self,
+        input_size: tuple[int, int],
+        mean: Sequence[float],
+        std: Sequence[float],
+        workers: int = PREPROCESS_WORKERS,
+    ) -> None:
+        self.input_size = input_size
+        self.mean = np.asarray(mean, dtype=np.float32).reshape(3, 1, 1)
+        self.std = np.asarray(std, dtype=np.float32).reshape(3, 1, 1)
+        # "spawn" keeps workers independent of the decoder and scoring threads in this process.
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def prepare(self, sources: Sequence[str | Image.Image]) -> SharedBatch:
+        batch = SharedBatch(len(sources), self.input_size)
+        try:
+            futures: list[Future] = []
+            for index, source in enumerate(sources):
+                if isinstance(source, str):
+                    futures.append(
+                        self._pool.submit(
+                            _prepare_into_shared,
+                            batch.name,
+                            batch.shape,
+                            index,
+                            source,
+                            self.input_size,
+                            self.mean,
+                            self.std,
+                        )
+                    )
+                else:
+                    normalize_image(source, self.input_size, self.mean, self.std, out=batch.array[index])
+            for future in futures:
+                future.result()
+        except BaseException:
+            batch.release()
+            raise
+        return batch
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(cancel_futures=True)
+
+
+_preprocessors: dict[tuple, Preprocessor] = {}
+_preprocessors_lock = threading.Lock()
+
+
+def get_preprocessor(input_size: tuple[int, int], mean: Sequence[float], std: Sequence[float]) -> Preprocessor:
+    key = (tuple(input_size), tuple(mean), tuple(std))
+    with _preprocessors_lock:
+        preprocessor = _preprocessors.get(key)
+        if preprocessor is None:
+            preprocessor = _preprocessors[key] = Preprocessor(input_size, mean, std)
+        return preprocessor
@@ -0,0 +1,106 @@
+"""Report templates parsed once into literal segments and slots, with memoized rendering."""
+
+import functools
+import html
+import re
+from collections.abc import Callable, Hashable
+from string import Formatter
+
+from config import LOCALES
+from results import MockResult
+
+
+# Results scored for the dashboard hold these locale-neutral keys in place of text; the
+# level descriptions are keyed by level label.
+OVERRIDE_DESCRIPTION_KEY = "override"
+REPORT_TEMPLATE_KEY = "report"
+
+# List items are plain text with `**bold**` spans; in HTML they are escaped first, since
+# results may carry the model's own text, and only the bold spans become markup.
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+
+
+def _html_item(item: str) -> str:
+    return _BOLD.sub(r"<strong>\1</strong>", html.escape(str(item)))
+
+
+# Format specs for list-valued slots, e.g. "{observations:li}" renders one <li> per item;
+# each format gets the item's 1-based position and the item.
+LIST_FORMATS: dict[str, Callable[[int, str], str]] = {
+    "li": lambda _, item: f"<li>{_html_item(item)}</li>",
+    "-": lambda _, item: f"- {item}",
+    "1.": lambda number, item: f"{number}. {item}",
+}
+
+
+class CompiledTemplate:
+    """A `str.format`-style template split into `(literal, slot, spec)` parts at construction.
+
+    Slots take scalars, or tuples of items when the spec is one of `LIST_FORMATS`.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.parts: list[tuple[str, str | None, str]] = [
+            (literal, field, spec or "") for literal, field, spec, _ in Formatter().parse(source)
+        ]
+        self.slots = frozenset(field for _, field, _ in self.parts if field)
+
+    def render(self, values: dict[str, Hashable]) -> str:
+        out: list[str] = []
+        for literal, field, spec in self.parts:
+            out.append(literal)
+            if field is None:
+                continue
+            value = values[field]
+            if spec in LIST_FORMATS:
+                out.append("\n".join(LIST_FORMATS[spec](number, item) for number, item in enumerate(value, 1)))
+            else:
+                out.append(format(value, spec))
+        return "".join(out)
+
+
+@functools.lru_cache(maxsize=64)
+def compile_template(source: str) -> CompiledTemplate:
+    return CompiledTemplate(source)
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_cached(source: str, items: tuple[tuple[str, Hashable], ...]) -> str:
+    return compile_template(source).render(dict(items))
+
+
+def render_template(source: str, **values: Hashable) -> str:
+    """Render `source`, memoized on the template and every slot value (lists as tuples).
+
+    Values for names the template has no slot for are ignored, so callers can pass one
+    set of values to templates that use different subsets of them.
+    """
+    slots = compile_template(source).slots
+    return _render_cached(source, tuple(sorted((k, v) for k, v in values.items() if k in slots)))
+
+
+def resolve_description(key: str, locale: str) -> str:
+    texts = LOCALES[locale]
+    if key == OVERRIDE_DESCRIPTION_KEY:
+        return texts["override_description"]
+    # Results scored with real text (e.g. by the inference service) pass through unchanged.
+    return texts["risk_level_descriptions"].get(key, key)
+
+
+def render_report(template: str, locale: str, cctv_id: str, result: MockResult) -> str:
+    """Render a report template (`report_html`, `report_template`, ...) for one camera's result.
+
+    A result's own observations and actions fill both templates; without them, each template
+    gets its own defaults (the markdown one through its `markdown_*` slots).
+    """
+    texts = LOCALES[locale]
+    return render_template(
+        template,
+        cctv_id=cctv_id,
+        alarm_level=texts["level_labels"].get(result.alarm_level, result.alarm_level),
+        risk_score=result.risk_score,
+        observations=result.observations or texts["report_observations"],
+        actions=result.actions or texts["report_actions"],
+        markdown_observations=result.observations or texts["report_markdown_observations"],
+        markdown_actions=result.actions or texts["report_markdown_actions"],
+    )
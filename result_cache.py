@@ -0,0 +1,112 @@
+"""Content-addressed cache of model scores, keyed by frame hash plus model version."""
+
+import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+from PIL import Image
+
+from config import RESULT_CACHE_MAX_ENTRIES, RESULT_CACHE_TTL_SECONDS
+
+
+def exact_hash(image: Image.Image) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.mode}:{image.width}x{image.height}:".encode())
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def perceptual_hash(image: Image.Image, hash_size: int = 8) -> str:
+    """64-bit difference hash: identical for frames that differ only by noise or compression."""
+    small = image.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.BILINEAR, reducing_gap=2.0)
+    pixels = small.tobytes()
+    bits = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return f"{bits:0{hash_size * hash_size // 4}x}"
+
+
+FRAME_HASHERS: dict[str, Callable[[Image.Image], str]] = {
+    "exact": exact_hash,
+    "perceptual": perceptual_hash,
+}
+
+
+class FrameHasher:
+    """Memoizes frame hashes per image object, so frames shared via the frame cache hash once."""
+
+    def __init__(self, mode: str) -> None:
+        if mode not in FRAME_HASHERS:
+            raise ValueError(f"Unknown frame hash {mode!r}; expected one of {sorted(FRAME_HASHERS)}.")
+        self.mode = mode
+        self._hash = FRAME_HASHERS[mode]
+        # PIL images are unhashable, so entries are keyed by id() and dropped when the image dies.
+        self._memo: dict[int, tuple[weakref.ref, str]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, image: Image.Image) -> str:
+        image_id = id(image)
+        with self._lock:
+            entry = self._memo.get(image_id)
+        if entry is not None and entry[0]() is image:
+            return entry[1]
+
+        digest = f"{self.mode}:{self._hash(image)}"
+        ref = weakref.ref(image, lambda _, image_id=image_id: self._forget(image_id))
+        with self._lock:
+            self._memo[image_id] = (ref, digest)
+        return digest
+
+    def _forget(self, image_id: int) -> None:
+        with self._lock:
+            entry = self._memo.get(image_id)
+            if entry is not None and entry[0]() is None:
+                del self._memo[image_id]
+
+
+class ResultCache:
+    """Thread-safe TTL + LRU mapping from a content key to a model score."""
+
+    def __init__(
+        self,
+        max_entries: int = RESULT_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = RESULT_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> int | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, score: int) -> None:
+        with self._lock:
+            self._entries[key] = (score, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,165 @@
+"""Risk assessment result type shared by the dashboard and inference backends."""
+
+import bisect
+import functools
+import os
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+from enum import IntEnum
+
+import numpy as np
+
+from config import (
+    LEVEL_CSS_CLASSES,
+    LOCALES,
+    RISK_HIGH_THRESHOLD,
+    RISK_MEDIUM_THRESHOLD,
+    RISK_THRESHOLDS_BY_SITE,
+    SITE_ID,
+)
+
+
+class AlarmLevel(IntEnum):
+    """Alarm levels in increasing severity; `label` is the key used by configs and the UI."""
+
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.capitalize()
+
+    @classmethod
+    def from_label(cls, label: str) -> "AlarmLevel":
+        return cls[label.upper()]
+
+
+# Descriptions and report templates repeat across cameras and refreshes, so results keep
+# an index into this process-wide table instead of their own copy of the string.
+_texts: list[str] = []
+_text_ids: dict[str, int] = {}
+_texts_lock = threading.Lock()
+
+
+def intern_text(text: str) -> int:
+    text_id = _text_ids.get(text)
+    if text_id is None:
+        with _texts_lock:
+            text_id = _text_ids.get(text)
+            if text_id is None:
+                _texts.append(text)
+                text_id = _text_ids[text] = len(_texts) - 1
+    return text_id
+
+
+def text_by_id(text_id: int) -> str:
+    return _texts[text_id]
+
+
+@dataclass(frozen=True, slots=True)
+class MockResult:
+    level: AlarmLevel
+    risk_score: int
+    description_id: int
+    template_id: int
+    # Per-camera report sections from the model, if it produced any.
+    observation_ids: tuple[int, ...] = ()
+    action_ids: tuple[int, ...] = ()
+
+    @classmethod
+    def create(
+        cls,
+        alarm_level: AlarmLevel | str,
+        risk_score: int,
+        description: str,
+        report_markdown: str,
+        observations: tuple[str, ...] = (),
+        actions: tuple[str, ...] = (),
+    ) -> "MockResult":
+        if isinstance(alarm_level, str):
+            alarm_level = AlarmLevel.from_label(alarm_level)
+        return cls(
+            alarm_level,
+            risk_score,
+            intern_text(description),
+            intern_text(report_markdown),
+            tuple(map(intern_text, observations)),
+            tuple(map(intern_text, actions)),
+        )
+
+    @property
+    def alarm_level(self) -> str:
+        return self.level.label
+
+    @property
+    def description(self) -> str:
+        return text_by_id(self.description_id)
+
+    @property
+    def report_markdown(self) -> str:
+        # Only looked up when a report is actually displayed or serialized.
+        return text_by_id(self.template_id)
+
+    @property
+    def observations(self) -> tuple[str, ...]:
+        return tuple(map(text_by_id, self.observation_ids))
+
+    @property
+    def actions(self) -> tuple[str, ...]:
+        return tuple(map(text_by_id, self.action_ids))
+
+    def to_dict(self) -> dict[str, str | int]:
+        return {
+            "alarm_level": self.alarm_level,
+            "risk_score": self.risk_score,
+            "description": self.description,
+            "report_markdown": self.report_markdown,
+        }
+
+
+def risk_thresholds(site: str | None = None) -> tuple[int, int]:
+    """Lower score bounds of Medium and High for `site` (default: VLM_SITE, then SITE_ID)."""
+    site = site or os.environ.get("VLM_SITE") or SITE_ID
+    return RISK_THRESHOLDS_BY_SITE.get(site, (RISK_MEDIUM_THRESHOLD, RISK_HIGH_THRESHOLD))
+
+
+def level_from_score(score: int, thresholds: tuple[int, int] | None = None) -> AlarmLevel:
+    return AlarmLevel(bisect.bisect_right(thresholds or risk_thresholds(), score))
+
+
+def classify_scores(scores: Sequence[int] | np.ndarray, thresholds: tuple[int, int] | None = None) -> np.ndarray:
+    """Level codes (`AlarmLevel` values, uint8) for a whole array of scores in one pass."""
+    bounds = np.asarray(thresholds or risk_thresholds())
+    return np.searchsorted(bounds, np.asarray(scores), side="right").astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=None)
+def _level_table(values: tuple[str, ...]) -> np.ndarray:
+    return np.array(values, dtype=object)
+
+
+def level_labels(codes: np.ndarray, locale: str | None = None) -> np.ndarray:
+    """Labels for level codes: the level keys ("High", ...), or their `locale` translations."""
+    if locale is None:
+        return _level_table(tuple(level.label for level in AlarmLevel))[codes]
+    labels = LOCALES[locale]["level_labels"]
+    return _level_table(tuple(labels.get(level.label, level.label) for level in AlarmLevel))[codes]
+
+
+def level_css_classes(codes: np.ndarray) -> np.ndarray:
+    return _level_table(LEVEL_CSS_CLASSES)[codes]
+
+
+_LEVELS = tuple(AlarmLevel)
+
+
+def build_results(scores: Sequence[int], descriptions: dict[str, str], report_template: str) -> list[MockResult]:
+    """Results for a batch of scores, classified together by `classify_scores`."""
+    levels = [_LEVELS[code] for code in classify_scores(scores).tolist()]
+    return [
+        MockResult.create(level, int(score), descriptions[level.label], report_template)
+        for level, score in zip(levels, scores)
+    ]
+
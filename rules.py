@@ -0,0 +1,264 @@
+"""Per-camera and per-zone alarm rules loaded from a JSON / YAML file and hot-reloaded.
+
+    {
+      "default": {"thresholds": [60, 75]},
+      "zones": {
+        "loading-dock": {
+          "cameras": ["CCTV3", "CCTV4"],
+          "thresholds": [50, 70],
+          "suppress": [{"start": "22:00", "end": "06:00", "max_level": "Low", "days": ["sat", "sun"]}]
+        }
+      },
+      "cameras": {
+        "CCTV2": {"override": {"level": "Medium", "score": 68}}
+      }
+    }
+
+A zone covers the cameras it lists plus those the camera registry places in it. A camera's
+rule is the default, then its zone's fields, then its own entry's fields. All of
+them are merged once when the file is loaded, into a dict keyed by camera id, so applying
+the rules costs one lookup per camera per refresh however many cameras and zones there are.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+from camera_registry import get_camera_registry
+from config import RULES_PATH, RULES_RELOAD_SECONDS
+from results import AlarmLevel, MockResult, level_from_score, risk_thresholds
+
+
+RULE_FIELDS = ("thresholds", "override", "suppress")
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
+@dataclass(frozen=True)
+class SuppressWindow:
+    # Minutes after local midnight; a window with start > end runs past midnight.
+    start: int
+    end: int
+    max_level: AlarmLevel
+    # Weekdays (Monday = 0) the window applies on; empty means every day.
+    days: frozenset[int] = frozenset()
+
+    def active(self, moment: time.struct_time) -> bool:
+        if self.days and moment.tm_wday not in self.days:
+            return False
+        minute = moment.tm_hour * 60 + moment.tm_min
+        if self.start <= self.end:
+            return self.start <= minute < self.end
+        return minute >= self.start or minute < self.end
+
+
+@dataclass(frozen=True)
+class CameraRule:
+    # (Medium, High) lower score bounds; None keeps the site thresholds.
+    thresholds: tuple[int, int] | None = None
+    override_level: AlarmLevel | None = None
+    # None keeps the scored value; the description falls back to the caller's override text.
+    override_score: int | None = None
+    override_description: str | None = None
+    suppress: tuple[SuppressWindow, ...] = ()
+
+
+NO_RULE = CameraRule()
+
+
+def _parse_minutes(value: str, where: str) -> int:
+    try:
+        hours, minutes = (int(part) for part in value.split(":"))
+    except (AttributeError, ValueError):
+        raise ValueError(f"{where}: expected HH:MM, got {value!r}") from None
+    if not (0 <= hours <= 24 and 0 <= minutes < 60):
+        raise ValueError(f"{where}: {value!r} is not a time of day")
+    return hours * 60 + minutes
+
+
+def _parse_level(value: str, where: str) -> AlarmLevel:
+    try:
+        return AlarmLevel.from_label(value)
+    except (AttributeError, KeyError):
+        raise ValueError(f"{where}: unknown alarm level {value!r}") from None
+
+
+def _parse_window(raw: dict, where: str) -> SuppressWindow:
+    days = raw.get("days", ())
+    unknown = [day for day in days if day not in WEEKDAYS]
+    if unknown:
+        raise ValueError(f"{where}: unknown days {unknown}")
+    return SuppressWindow(
+        start=_parse_minutes(raw.get("start"), f"{where}.start"),
+        end=_parse_minutes(raw.get("end"), f"{where}.end"),
+        max_level=_parse_level(raw.get("max_level", "Low"), f"{where}.max_level"),
+        days=frozenset(WEEKDAYS.index(day) for day in days),
+    )
+
+
+def _compile_rule(fields: dict, where: str) -> CameraRule:
+    thresholds = fields.get("thresholds")
+    if thresholds is not None:
+        if len(thresholds) != 2 or not thresholds[0] <= thresholds[1]:
+            raise ValueError(f"{where}.thresholds: expected [medium, high] with medium <= high")
+        thresholds = (int(thresholds[0]), int(thresholds[1]))
+    override = fields.get("override") or {}
+    rule = CameraRule(
+        thresholds=thresholds,
+        override_level=_parse_level(override["level"], f"{where}.override.level") if override else None,
+        override_score=int(override["score"]) if "score" in override else None,
+        override_description=override.get("description"),
+        suppress=tuple(
+            _parse_window(window, f"{where}.suppress[{i}]") for i, window in enumerate(fields.get("suppress", ()))
+        ),
+    )
+    # Lets `apply` skip cameras whose rule changes nothing with an identity check.
+    return NO_RULE if rule == NO_RULE else rule
+
+
+def _rule_fields(raw: dict, where: str) -> dict:
+    unknown = set(raw) - set(RULE_FIELDS) - {"cameras"}
+    if unknown:
+        raise ValueError(f"{where}: unknown fields {sorted(unknown)}")
+    return {name: raw[name] for name in RULE_FIELDS if name in raw}
+
+
+class RuleSet:
+    """Compiled rules: one merged `CameraRule` per camera named in the file, plus the default."""
+
+    def __init__(self, default: CameraRule = NO_RULE, cameras: dict[str, CameraRule] | None = None) -> None:
+        self.default = default
+        self.cameras = cameras or {}
+
+    @classmethod
+    def compile(cls, data: dict, zones: dict[str, str] | None = None) -> "RuleSet":
+        """Compile parsed rules; `zones` maps camera ids to their registry zone."""
+        members: dict[str, list[str]] = {}
+        for cctv_id, zone in (zones or {}).items():
+            members.setdefault(zone, []).append(cctv_id)
+        default = _rule_fields(data.get("default", {}), "default")
+        merged: dict[str, dict] = {}
+        for zone, raw in data.get("zones", {}).items():
+            fields = _rule_fields(raw, f"zones.{zone}")
+            for cctv_id in [*members.get(zone, ()), *raw.get("cameras", ())]:
+                merged[cctv_id] = {**default, **fields}
+        for cctv_id, raw in data.get("cameras", {}).items():
+            merged[cctv_id] = {**merged.get(cctv_id, default), **_rule_fields(raw, f"cameras.{cctv_id}")}
+        return cls(
+            _compile_rule(default, "default"),
+            {cctv_id: _compile_rule(fields, f"cameras.{cctv_id}") for cctv_id, fields in merged.items()},
+        )
+
+    def rule(self, cctv_id: str) -> CameraRule:
+        return self.cameras.get(cctv_id, self.default)
+
+    def thresholds(self, cctv_id: str) -> tuple[int, int]:
+        """(Medium, High) bounds in force for a camera: its band, else the site thresholds."""
+        return self.rule(cctv_id).thresholds or risk_thresholds()
+
+    def apply(
+        self,
+        results: dict[str, MockResult],
+        descriptions: dict[str, str],
+        report_template: str,
+        override_description: str,
+        now: float | None = None,
+    ) -> dict[str, MockResult]:
+        """Results with each camera's rule applied; cameras without a rule keep their result object."""
+        moment = time.localtime(now)
+        applied = dict(results)
+        for cctv_id, result in results.items():
+            rule = self.rule(cctv_id)
+            if rule is NO_RULE:
+                continue
+            level, score, description = result.level, result.risk_score, None
+            if rule.override_level is not None:
+                level = rule.override_level
+                score = result.risk_score if rule.override_score is None else rule.override_score
+                description = rule.override_description or override_description
+            elif rule.thresholds is not None:
+                level = level_from_score(score, rule.thresholds)
+            for window in rule.suppress:
+                if level > window.max_level and window.active(moment):
+                    level = window.max_level
+            if level != result.level or score != result.risk_score or description is not None:
+                applied[cctv_id] = MockResult.create(
+                    level, score, description or descriptions[level.label], report_template
+                )
+        return applied
+
+
+def load_rules(path: str, zones: dict[str, str] | None = None) -> RuleSet:
+    with open(path, encoding="utf-8") as f:
+        if path.lower().endswith((".yaml", ".yml")):
+            import yaml  # optional: only needed for YAML rule files
+
+            data = yaml.safe_load(f) or {}
+        else:
+            data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a mapping at the top level")
+    return RuleSet.compile(data, zones)
+
+
+class RulesEngine:
+    """The compiled rules of `path`, recompiled when the file changes on disk.
+
+    The file is stat'ed at most every `check_seconds`. A file that fails to load leaves the
+    previous rules in force (see `last_error`); a missing file means no rules.
+    """
+
+    def __init__(
+        self, path: str, zones: dict[str, str] | None = None, check_seconds: float = RULES_RELOAD_SECONDS
+    ) -> None:
+        self.path = path
+        self.zones = zones
+        self.check_seconds = check_seconds
+        self.last_error: Exception | None = None
+        self._rules = RuleSet()
+        self._stamp: tuple[int, int] | None = None
+        self._checked_at = -math.inf
+        self._lock = threading.Lock()
+
+    def current(self) -> RuleSet:
+        if time.monotonic() - self._checked_at >= self.check_seconds:
+            with self._lock:
+                if time.monotonic() - self._checked_at >= self.check_seconds:
+                    self._reload()
+                    self._checked_at = time.monotonic()
+        return self._rules
+
+    def _reload(self) -> None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._rules, self._stamp, self.last_error = RuleSet(), None, None
+            return
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._stamp:
+            return
+        self._stamp = stamp
+        try:
+            self._rules = load_rules(self.path, self.zones)
+            self.last_error = None
+        except Exception as exc:  # a bad edit must not take the dashboard down
+            self.last_error = exc
+
+
+def rules_path() -> str:
+    return os.environ.get("VLM_RULES_PATH") or os.path.join(os.path.dirname(os.path.abspath(__file__)), RULES_PATH)
+
+
+_rules_engine: RulesEngine | None = None
+_rules_engine_lock = threading.Lock()
+
+
+def get_rules_engine() -> RulesEngine:
+    global _rules_engine
+    if _rules_engine is None:
+        with _rules_engine_lock:
+            if _rules_engine is None:
+                _rules_engine = RulesEngine(rules_path(), get_camera_registry().zone_map())
+    return _rules_engine
@@ -0,0 +1,217 @@
+"""Background scoring worker publishing per-camera results to a shared snapshot store."""
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+import numpy as np
+
+from config import SCORING_CHUNK_SIZE, SCORING_INTERVAL_SECONDS
+from frame_cache import CameraFrame
+from results import MockResult
+
+
+@dataclass(frozen=True)
+class CameraSnapshot:
+    result: MockResult
+    # The frame the result was computed from, so the view shows exactly what was scored.
+    frame: CameraFrame
+    # Wall-clock time of the publish, and the store version it was published at.
+    updated_at: float
+    version: int
+    # The same for the last publish that changed the result or the frame; views that only
+    # redraw on change key on `changed_version`.
+    changed_at: float
+    changed_version: int
+
+
+def _rank_by_severity(snapshots: dict[str, CameraSnapshot]) -> tuple[str, ...]:
+    camera_ids = list(snapshots)
+    # Level first, then score; the stable sort keeps publish order among equal cameras.
+    keys = np.fromiter(
+        (snapshot.result.level * 256 + snapshot.result.risk_score for snapshot in snapshots.values()),
+        dtype=np.int32,
+        count=len(camera_ids),
+    )
+    return tuple(camera_ids[i] for i in np.argsort(-keys, kind="stable"))
+
+
+class ResultStore:
+    """Latest result per camera; readers get an immutable snapshot without blocking the writer.
+
+    Offline cameras (no frame to score) have no snapshot; they are listed by `offline()`.
+    `level_version` moves only when a publish changes some camera's level (a first result
+    and going offline included), so views ordered by severity know when to re-sort.
+    """
+
+    def __init__(self) -> None:
+        self._snapshots: dict[str, CameraSnapshot] = {}
+        self._offline: frozenset[str] = frozenset()
+        self._ranked: tuple[str, ...] = ()
+        self._condition = threading.Condition()
+        self._listeners: list[Callable[[int], None]] = []
+        self.version = 0
+        self.level_version = 0
+
+    def subscribe(self, listener: Callable[[int], None]) -> None:
+        """Call `listener(version)` from the publishing thread after every publish."""
+        self._listeners.append(listener)
+
+    def publish(
+        self, results: dict[str, MockResult], frames: dict[str, CameraFrame], offline: Iterable[str] = ()
+    ) -> None:
+        """Store `results` and mark the `offline` cameras, dropping their last result."""
+        now = time.time()
+        offline = frozenset(offline)
+        with self._condition:
+            self.version += 1
+            snapshots = dict(self._snapshots)
+            levels_changed = False
+            for camera_id in offline:
+                levels_changed |= snapshots.pop(camera_id, None) is not None
+            for camera_id, result in results.items():
+                previous, frame = snapshots.get(camera_id), frames[camera_id]
+                levels_changed |= previous is None or previous.result.level != result.level
+                if previous is not None and previous.result == result and previous.frame.version == frame.version:
+                    changed_at, changed_version = previous.changed_at, previous.changed_version
+                else:
+                    changed_at, changed_version = now, self.version
+                snapshots[camera_id] = CameraSnapshot(result, frame, now, self.version, changed_at, changed_version)
+            if levels_changed:
+                self.level_version += 1
+            # Swap the whole mapping so concurrent readers never see a half-applied refresh.
+            self._snapshots = snapshots
+            self._offline = (self._offline - results.keys()) | offline
+            self._ranked = _rank_by_severity(snapshots)
+            version = self.version
+            self._condition.notify_all()
+        for listener in self._listeners:
+            listener(version)
+
+    def snapshot(self) -> dict[str, CameraSnapshot]:
+        return self._snapshots
+
+    def offline(self) -> frozenset[str]:
+        return self._offline
+
+    def ranked(self) -> tuple[str, ...]:
+        """Camera ids from most to least severe, rebuilt on every publish."""
+        return self._ranked
+
+    def wait_for_update(self, since_version: int, timeout: float | None = None) -> int:
+        """Block until the store moves past `since_version` (or timeout); return the current version."""
+        with self._condition:
+            self._condition.wait_for(lambda: self.version > since_version, timeout)
+            return self.version
+
+
+class ScoringWorker:
+    """Daemon thread loading frames and scoring every camera each `interval` seconds.
+
+    `load_frames(None)` loads every camera and `load_frames(ids)` only the given ones;
+    cameras it maps to None are published as offline instead of being scored. With
+    `camera_ids`, a pass goes through the fleet `chunk_size` cameras at a time, and the
+    cameras queued by `request` are scored between chunks, ahead of the rest.
+    """
+
+    def __init__(
+        self,
+        load_frames: Callable[[list[str] | None], dict[str, CameraFrame | None]],
+        score: Callable[[dict[str, CameraFrame]], dict[str, MockResult]],
+        store: ResultStore | None = None,
+        interval: float = SCORING_INTERVAL_SECONDS,
+        camera_ids: Callable[[], list[str]] | None = None,
+        chunk_size: int = SCORING_CHUNK_SIZE,
+    ) -> None:
+        self.load_frames = load_frames
+        self.score = score
+        self.store = store if store is not None else ResultStore()
+        self.interval = interval
+        self.camera_ids = camera_ids
+        self.chunk_size = chunk_size
+        self.last_error: Exception | None = None
+        self.last_duration = 0.0
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        # Requested camera ids in arrival order (a dict as an ordered set).
+        self._priority: dict[str, None] = {}
+        self._priority_lock = threading.Lock()
+
+    def run_once(self) -> None:
+        """Score every camera once."""
+        started = time.perf_counter()
+        if self.camera_ids is None:
+            self._score_and_publish(self.load_frames(None))
+        else:
+            camera_ids = self.camera_ids()
+            for start in range(0, len(camera_ids), self.chunk_size):
+                if self._stop.is_set():
+                    break
+                self.serve_requests()
+                self._score_and_publish(self.load_frames(camera_ids[start : start + self.chunk_size]))
+        self.last_duration = time.perf_counter() - started
+
+    def _score_and_publish(self, loaded: dict[str, CameraFrame | None]) -> None:
+        frames = {camera_id: frame for camera_id, frame in loaded.items() if frame is not None}
+        offline = [camera_id for camera_id, frame in loaded.items() if frame is None]
+        if frames or offline:
+            self.store.publish(self.score(frames) if frames else {}, frames, offline)
+
+    def request(self, camera_ids: Iterable[str]) -> None:
+        """Queue the cameras among `camera_ids` without a result (or offline mark) ahead of the pass.
+
+        Pages call this for the cameras they are about to show and render a placeholder until
+        the worker thread publishes them; nothing is loaded or scored on the caller's thread.
+        """
+        unknown = self._unknown(camera_ids)
+        if unknown:
+            with self._priority_lock:
+                self._priority.update(dict.fromkeys(unknown))
+            self._wake.set()
+
+    def serve_requests(self) -> None:
+        """Score the requested cameras that are still unknown."""
+        with self._priority_lock:
+            requested, self._priority = list(self._priority), {}
+        # The pass may have reached some of them since they were requested.
+        requested = self._unknown(requested)
+        for start in range(0, len(requested), self.chunk_size):
+            self._score_and_publish(self.load_frames(requested[start : start + self.chunk_size]))
+
+    def _unknown(self, camera_ids: Iterable[str]) -> list[str]:
+        # Neither scored nor known to be offline yet.
+        snapshots, offline = self.store.snapshot(), self.store.offline()
+        return [camera_id for camera_id in camera_ids if camera_id not in snapshots and camera_id not in offline]
+
+    def start(self) -> "ScoringWorker":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="scoring-worker", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5)
+
+    def _run_guarded(self, step: Callable[[], None]) -> None:
+        try:
+            step()
+            self.last_error = None
+        except Exception as exc:  # keep serving the last good snapshot
+            self.last_error = exc
+
+    def _run(self) -> None:
+        next_pass = time.monotonic()
+        while not self._stop.is_set():
+            # Cleared before serving, so a request arriving from here on cuts the wait short.
+            self._wake.clear()
+            self._run_guarded(self.serve_requests)
+            if time.monotonic() >= next_pass:
+                next_pass = time.monotonic() + self.interval
+                self._run_guarded(self.run_once)
+            else:
+                self._wake.wait(next_pass - time.monotonic())
@@ -0,0 +1,106 @@
+import json
+
+from alarm_events import AlarmEventPipeline, IncidentFeed
+from frame_cache import CameraFrame
+from results import AlarmLevel, MockResult
+from scoring_worker import ResultStore
+
+
+THRESHOLDS = (60, 75)
+
+
+def _pipeline(**kwargs) -> AlarmEventPipeline:
+    options = {"hysteresis": 5, "min_dwell": 10.0, "cooldown": 300.0}
+    options.update(kwargs)
+    return AlarmEventPipeline(lambda camera_id: THRESHOLDS, **options)
+
+
+def _observe(pipeline: AlarmEventPipeline, score: int, now: float) -> None:
+    level = AlarmLevel.HIGH if score >= 75 else AlarmLevel.MEDIUM if score >= 60 else AlarmLevel.LOW
+    pipeline.observe("CCTV1", level, score, now)
+
+
+def test_incident_opens_after_dwell_and_closes_below_hysteresis():
+    pipeline = _pipeline()
+    _observe(pipeline, 80, 0.0)
+    _observe(pipeline, 82, 5.0)
+    assert pipeline.drain() == []
+
+    _observe(pipeline, 85, 10.0)
+    (opened,) = pipeline.drain()
+    assert (opened.kind, opened.camera_id, opened.level, opened.opened_at) == ("open", "CCTV1", AlarmLevel.HIGH, 10.0)
+
+    # Within the hysteresis band below the High threshold: still High, however long it stays.
+    _observe(pipeline, 72, 20.0)
+    _observe(pipeline, 71, 40.0)
+    assert pipeline.drain() == []
+    assert pipeline.open_incidents() == {"CCTV1": 10.0}
+
+    _observe(pipeline, 65, 50.0)
+    _observe(pipeline, 64, 60.0)
+    (closed,) = pipeline.drain()
+    assert (closed.kind, closed.level, closed.opened_at, closed.peak_score) == ("close", AlarmLevel.MEDIUM, 10.0, 85)
+    assert pipeline.open_incidents() == {}
+
+
+def test_brief_spike_opens_nothing():
+    pipeline = _pipeline()
+    _observe(pipeline, 90, 0.0)
+    _observe(pipeline, 40, 5.0)
+    _observe(pipeline, 90, 8.0)
+    _observe(pipeline, 40, 12.0)
+    assert pipeline.drain() == []
+
+
+def test_reopening_within_cooldown_is_silent():
+    pipeline = _pipeline(min_dwell=0.0, hysteresis=0)
+    _observe(pipeline, 80, 0.0)
+    _observe(pipeline, 50, 10.0)
+    _observe(pipeline, 80, 20.0)
+    _observe(pipeline, 50, 30.0)
+    assert [event.kind for event in pipeline.drain()] == ["open", "close"]
+
+    _observe(pipeline, 80, 400.0)
+    assert [event.kind for event in pipeline.drain()] == ["open"]
+
+
+def test_attach_observes_only_the_cameras_a_publish_updated():
+    pipeline = _pipeline(min_dwell=0.0)
+    store = ResultStore()
+    pipeline.attach(store)
+    frame = CameraFrame(image=None, source="cam.jpg", version=1)
+    store.publish({"CCTV1": MockResult.create("High", 90, "", "")}, {"CCTV1": frame})
+    assert [event.kind for event in pipeline.drain()] == ["open"]
+
+    pipeline.observe("CCTV1", AlarmLevel.LOW, 10)
+    assert [event.kind for event in pipeline.drain()] == ["close"]
+    # Publishing another camera must not re-observe CCTV1's stale High result (which would
+    # reopen its incident, silently within the cooldown).
+    store.publish({"CCTV2": MockResult.create("Low", 10, "", "")}, {"CCTV2": frame})
+    assert pipeline.open_incidents() == {}
+
+
+def test_incident_feed_logs_and_numbers_events(tmp_path):
+    pipeline = _pipeline(min_dwell=0.0)
+    log_path = tmp_path / "events" / "alarm_events.jsonl"
+    feed = IncidentFeed(pipeline, str(log_path), keep=2)
+    sequences = []
+    feed.subscribe(sequences.append)
+
+    _observe(pipeline, 80, 0.0)
+    _observe(pipeline, 50, 10.0)
+    _observe(pipeline, 80, 400.0)
+    feed.record(pipeline.drain())
+
+    assert sequences == [3]
+    events, sequence = feed.since(0)
+    # Only the latest `keep` events are kept for streams.
+    assert [event.kind for event in events] == ["close", "open"]
+    assert sequence == 3
+    assert feed.since(3) == ([], 3)
+    lines = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert [(line["kind"], line["camera_id"], line["level"]) for line in lines] == [
+        ("open", "CCTV1", "High"),
+        ("close", "CCTV1", "Low"),
+        ("open", "CCTV1", "High"),
+    ]
@@ -0,0 +1,65 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+from camera_registry import Camera, CameraRegistry, load_registry
+
+
+def _registry() -> CameraRegistry:
+    return CameraRegistry(
+        [
+            Camera("CCTV1", "a.png", "assembly", ("indoor", "ppe")),
+            Camera("CCTV2", "b.png", "dock", ("outdoor",)),
+            Camera("CCTV3", "c.png", "assembly", ("indoor",)),
+            Camera("CCTV4", "d.png"),
+        ]
+    )
+
+
+def test_filter_by_zone_and_tags_keeps_registry_order():
+    registry = _registry()
+    assert registry.filter() == ["CCTV1", "CCTV2", "CCTV3", "CCTV4"]
+    assert registry.filter(zone="assembly") == ["CCTV1", "CCTV3"]
+    assert registry.filter(tags=["indoor"]) == ["CCTV1", "CCTV3"]
+    assert registry.filter(zone="assembly", tags=["indoor", "ppe"]) == ["CCTV1"]
+    assert registry.filter(tags=["unknown"]) == []
+    assert registry.zones() == ["assembly", "dock"]
+    assert registry.zone_map() == {"CCTV1": "assembly", "CCTV2": "dock", "CCTV3": "assembly"}
+
+
+def test_duplicate_ids_are_rejected():
+    with pytest.raises(ValueError):
+        CameraRegistry([Camera("CCTV1", "a.png"), Camera("CCTV1", "b.png")])
+
+
+def test_json_registry_resolves_relative_sources(tmp_path):
+    path = tmp_path / "cameras.json"
+    path.write_text(
+        json.dumps(
+            {
+                "cameras": [
+                    {"id": "CCTV1", "source": "frames/a.png", "tags": "indoor, ppe"},
+                    {"id": "CCTV2", "source": "rtsp://camera/stream", "zone": "dock"},
+                ]
+            }
+        )
+    )
+    registry = load_registry(str(path))
+    assert registry.get("CCTV1") == Camera("CCTV1", os.path.join(tmp_path, "frames/a.png"), None, ("indoor", "ppe"))
+    assert registry.get("CCTV2").source == "rtsp://camera/stream"
+
+
+def test_sqlite_registry(tmp_path):
+    path = tmp_path / "cameras.db"
+    with sqlite3.connect(path) as db:
+        db.execute("CREATE TABLE cameras (id TEXT, source TEXT, zone TEXT, tags TEXT)")
+        db.executemany(
+            "INSERT INTO cameras VALUES (?, ?, ?, ?)",
+            [("CCTV2", "/frames/b.png", "dock", "outdoor"), ("CCTV1", "/frames/a.png", None, "")],
+        )
+    registry = load_registry(str(path))
+    assert registry.ids() == ["CCTV2", "CCTV1"]
+    assert registry.get("CCTV2") == Camera("CCTV2", "/frames/b.png", "dock", ("outdoor",))
+    assert registry.get("CCTV1").tags == ()
@@ -0,0 +1,37 @@
+from PIL import Image
+
+from change_gate import ChangeGate
+from inference import Frame
+from results import MockResult
+
+
+def _frame(value: int) -> Frame:
+    return Frame(key=f"frame-{value}", image=Image.new("RGB", (64, 48), (value, value, value)))
+
+
+def _scorer(calls: list[list[str]]):
+    def score(frames: list[Frame]) -> list[MockResult]:
+        calls.append([frame.key for frame in frames])
+        return [MockResult.create("Low", len(calls), frame.key, "") for frame in frames]
+
+    return score
+
+
+def test_only_changed_cameras_are_scored():
+    gate = ChangeGate(threshold=0.05, method="pixel", size=(16, 12), max_skip_seconds=3600)
+    calls: list[list[str]] = []
+    first = gate.run(["CCTV1", "CCTV2"], [_frame(10), _frame(200)], _scorer(calls))
+    second = gate.run(["CCTV1", "CCTV2"], [_frame(12), _frame(100)], _scorer(calls))
+
+    assert calls == [["frame-10", "frame-200"], ["frame-100"]]
+    assert second[0] is first[0]
+    assert second[1].description == "frame-100"
+    assert (gate.forwarded, gate.skipped) == (3, 1)
+
+
+def test_unchanged_cameras_are_rescored_after_max_skip():
+    gate = ChangeGate(threshold=0.05, method="histogram", size=(16, 12), max_skip_seconds=0)
+    calls: list[list[str]] = []
+    gate.run(["CCTV1"], [_frame(10)], _scorer(calls))
+    gate.run(["CCTV1"], [_frame(10)], _scorer(calls))
+    assert calls == [["frame-10"], ["frame-10"]]
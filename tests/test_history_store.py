@@ -0,0 +1,86 @@
+import os
+
+import numpy as np
+
+from frame_cache import CameraFrame
+from history_store import HistoryStore
+from results import AlarmLevel, MockResult
+from scoring_worker import ResultStore
+
+
+def test_range_spans_flushed_and_pending_rows(tmp_path):
+    store = HistoryStore(str(tmp_path), flush_seconds=3600)
+    assert store.writable
+    store.append("CCTV1", 100.0, AlarmLevel.LOW, 10, "calm")
+    store.append("CCTV1", 101.0, AlarmLevel.HIGH, 90, "busy")
+    store.flush()
+    store.append("CCTV1", 102.0, AlarmLevel.MEDIUM, 65, "calm")
+
+    rows = store.range("CCTV1", 100.5, 102.0)
+    assert rows.ts_ms.tolist() == [101000, 102000]
+    assert rows.score.tolist() == [90, 65]
+    assert [store.description(i) for i in rows.description_id] == ["busy", "calm"]
+    assert len(store.range("CCTV2", 0, 200)) == 0
+    store.close()
+
+
+def test_range_of_flushed_rows_stays_on_the_memory_map(tmp_path):
+    store = HistoryStore(str(tmp_path), flush_seconds=3600)
+    for second in range(10):
+        store.append("CCTV1", 100.0 + second, AlarmLevel.LOW, second, "calm")
+    store.flush()
+    store.append("CCTV1", 200.0, AlarmLevel.HIGH, 90, "busy")
+    store.append("CCTV1", 201.0, AlarmLevel.HIGH, 91, "busy")
+
+    # Only flushed rows in range: a view of the mapped file, not a copy of it.
+    rows = store.range("CCTV1", 102.0, 104.0)
+    assert rows.score.tolist() == [2, 3, 4]
+    assert isinstance(rows.ts_ms, np.memmap)
+    # Only pending rows in range.
+    assert store.range("CCTV1", 150.0, 200.0).score.tolist() == [90]
+    # Both, and an empty range between them.
+    assert store.range("CCTV1", 109.0, 300.0).score.tolist() == [9, 90, 91]
+    assert len(store.range("CCTV1", 120.0, 130.0)) == 0
+    store.close()
+
+
+def test_rows_older_than_the_last_one_are_dropped(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    assert store.append("CCTV1", 200.0, AlarmLevel.LOW, 10, "calm")
+    assert not store.append("CCTV1", 199.0, AlarmLevel.LOW, 11, "calm")
+    assert store.range("CCTV1", 0, 300).score.tolist() == [10]
+    store.close()
+
+
+def test_second_writer_and_read_only_stores(tmp_path):
+    writer = HistoryStore(str(tmp_path))
+    writer.append("CCTV1", 100.0, AlarmLevel.LOW, 10, "calm")
+    writer.flush()
+
+    # The directory lock is held by `writer`.
+    other = HistoryStore(str(tmp_path))
+    assert not other.writable
+    assert not other.append("CCTV1", 101.0, AlarmLevel.LOW, 10, "calm")
+    assert other.cameras() == ["CCTV1"]
+    assert other.range("CCTV1", 0, 200).score.tolist() == [10]
+    other.close()
+    writer.close()
+    writer.close()  # idempotent
+
+    missing = tmp_path / "missing"
+    reader = HistoryStore(str(missing), read_only=True)
+    assert reader.cameras() == []
+    assert not os.path.exists(missing)
+
+
+def test_record_appends_only_the_cameras_of_the_publish(tmp_path):
+    history = HistoryStore(str(tmp_path))
+    results = ResultStore()
+    results.subscribe(lambda version: history.record(results.snapshot(), version))
+    frame = CameraFrame(image=None, source="cam.jpg", version=1)
+    results.publish({"CCTV1": MockResult.create("High", 90, "busy", "")}, {"CCTV1": frame})
+    results.publish({"CCTV2": MockResult.create("Low", 10, "calm", "")}, {"CCTV2": frame})
+
+    assert len(history.range("CCTV1", 0, 2**40)) == 1
+    assert len(history.range("CCTV2", 0, 2**40)) == 1
+    history.close()
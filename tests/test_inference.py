@@ -0,0 +1,115 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from PIL import Image
+
+from inference import CachedBackend, Frame, InferenceBackend, RemoteBackend
+from result_cache import ResultCache
+
+
+class CountingBackend(InferenceBackend):
+    def __init__(self, content_addressed: bool = True) -> None:
+        self.content_addressed = content_addressed
+        self.model_version = "v1"
+        self.batches: list[list[str]] = []
+
+    def score_batch(self, frames):
+        self.batches.append([frame.key for frame in frames])
+        return [sum(frame.image.getpixel((0, 0))) % 101 for frame in frames]
+
+
+def _frame(key: str, color: tuple[int, int, int]) -> Frame:
+    return Frame(key, Image.new("RGB", (8, 8), color))
+
+
+def test_cached_frames_are_not_scored_again():
+    backend = CountingBackend()
+    cached = CachedBackend(backend, ResultCache(), "exact")
+    frames = [_frame("a", (10, 0, 0)), _frame("b", (20, 0, 0))]
+    first = cached.score_batch(frames)
+    assert cached.score_batch(frames) == first
+    assert backend.batches == [["a", "b"]]
+    assert cached.cache.hits == 2
+
+
+def test_duplicate_frames_in_one_batch_are_scored_once():
+    backend = CountingBackend()
+    cached = CachedBackend(backend, ResultCache(), "exact")
+    scores = cached.score_batch([_frame("a", (10, 0, 0)), _frame("b", (10, 0, 0)), _frame("c", (30, 0, 0))])
+    assert backend.batches == [["a", "c"]]
+    assert scores[0] == scores[1] != scores[2]
+
+
+def test_frames_are_keyed_by_name_when_the_backend_is_not_content_addressed():
+    backend = CountingBackend(content_addressed=False)
+    cached = CachedBackend(backend, ResultCache(), "exact")
+    cached.score_batch([_frame("a", (10, 0, 0)), _frame("b", (10, 0, 0))])
+    cached.score_batch([_frame("a", (99, 0, 0))])
+    assert backend.batches == [["a", "b"]]
+
+
+def test_a_new_model_version_misses_the_cache():
+    backend = CountingBackend()
+    cached = CachedBackend(backend, ResultCache(), "exact")
+    frames = [_frame("a", (10, 0, 0))]
+    cached.score_batch(frames)
+    backend.model_version = "v2"
+    cached.score_batch(frames)
+    cached.score_batch(frames)
+    assert backend.batches == [["a"], ["a"]]
+
+
+def test_scores_are_cached_under_the_version_that_produced_them():
+    class LateVersionBackend(CountingBackend):
+        def score_batch(self, frames):
+            # Like a remote backend that only learns the model from its first response.
+            self.model_version = "v2"
+            return super().score_batch(frames)
+
+    backend = LateVersionBackend()
+    cached = CachedBackend(backend, ResultCache(), "exact")
+    frames = [_frame("a", (10, 0, 0))]
+    cached.score_batch(frames)
+    cached.score_batch(frames)
+    assert backend.batches == [["a"]]
+
+
+@pytest.fixture
+def inference_service():
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, body: dict) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            self._send({"model_version": "onnx:model", "queue_depth": 0})
+
+        def do_POST(self):
+            frames = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["frames"]
+            self._send({"model_version": "onnx:model", "results": [{"risk_score": 50} for _ in frames]})
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_remote_backend_takes_its_model_version_from_the_service(inference_service):
+    pytest.importorskip("requests")
+    backend = RemoteBackend(inference_service)
+    assert backend.model_version == "remote:onnx:model"
+    cached = CachedBackend(backend, ResultCache(), "exact")
+    frames = [_frame("a", (10, 0, 0))]
+    assert cached.score_batch(frames) == [50]
+    assert cached.score_batch(frames) == [50]
+    assert cached.cache.hits == 1
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+
+import pytest
+from PIL import Image
+
+pytest.importorskip("fastapi")
+
+from inference import Frame, InferenceBackend  # noqa: E402
+from inference_server import MicroBatcher  # noqa: E402
+
+
+class RecordingBackend(InferenceBackend):
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.batches: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def score_batch(self, frames):
+        with self._lock:
+            self.batches.append([frame.key for frame in frames])
+        if self.fail:
+            raise RuntimeError("model crashed")
+        return [int(frame.key) for frame in frames]
+
+
+def _frame(key: int) -> Frame:
+    return Frame(str(key), Image.new("RGB", (4, 4)))
+
+
+def _run(batcher: MicroBatcher, scenario):
+    async def main():
+        batcher.start()
+        try:
+            return await scenario()
+        finally:
+            await batcher.stop()
+
+    return asyncio.run(main())
+
+
+def test_concurrent_submits_share_one_full_batch():
+    backend = RecordingBackend()
+    batcher = MicroBatcher(backend, max_batch_size=4, max_wait_ms=5_000)
+
+    async def scenario():
+        return await asyncio.wait_for(asyncio.gather(*(batcher.submit([_frame(i)]) for i in range(4))), 2)
+
+    assert _run(batcher, scenario) == [[0], [1], [2], [3]]
+    assert backend.batches == [["0", "1", "2", "3"]]
+
+
+def test_a_lone_frame_is_flushed_after_the_wait():
+    backend = RecordingBackend()
+    batcher = MicroBatcher(backend, max_batch_size=8, max_wait_ms=50)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        scores = await asyncio.wait_for(batcher.submit([_frame(7)]), 2)
+        return scores, loop.time() - started
+
+    scores, elapsed = _run(batcher, scenario)
+    assert scores == [7]
+    assert elapsed >= 0.05
+    assert backend.batches == [["7"]]
+
+
+def test_a_backend_error_reaches_every_caller():
+    backend = RecordingBackend(fail=True)
+    batcher = MicroBatcher(backend, max_batch_size=3, max_wait_ms=5_000)
+
+    async def scenario():
+        submits = (batcher.submit([_frame(i)]) for i in range(3))
+        return await asyncio.wait_for(asyncio.gather(*submits, return_exceptions=True), 2)
+
+    outcomes = _run(batcher, scenario)
+    assert len(outcomes) == 3
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert backend.batches == [["0", "1", "2"]]
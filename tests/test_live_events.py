@@ -0,0 +1,45 @@
+import json
+
+from config import LOCALES
+from frame_cache import CameraFrame
+from live_events import state_events, stream_locale
+from results import MockResult
+from scoring_worker import ResultStore
+
+
+def _events(text: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in filter(None, text.split("\n\n")):
+        event, data = block.split("\n")
+        events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+def test_state_events_send_changes_and_offline_cameras_once():
+    store = ResultStore()
+    frame = CameraFrame(image=None, source="cam.jpg", version=1)
+    store.publish(
+        {"CCTV1": MockResult.create("High", 90, "High", ""), "CCTV2": MockResult.create("Low", 10, "Low", "")},
+        {"CCTV1": frame, "CCTV2": frame},
+    )
+    sent: dict[str, tuple[int, int, int]] = {}
+    first = _events(state_events(store.snapshot(), sent, "ko"))
+    assert [(event, data["camera_id"], data["level"]) for event, data in first] == [
+        ("alarm", "CCTV1", "High"),
+        ("alarm", "CCTV2", "Low"),
+    ]
+    assert first[0][1]["description"] == LOCALES["ko"]["risk_level_descriptions"]["High"]
+    assert state_events(store.snapshot(), sent, "ko") == ""
+
+    store.publish({}, {}, offline=["CCTV1"])
+    assert _events(state_events(store.snapshot(), sent, "ko")) == [("offline", {"camera_id": "CCTV1"})]
+    assert state_events(store.snapshot(), sent, "ko") == ""
+
+    # Back online: a full alarm again.
+    store.publish({"CCTV1": MockResult.create("Medium", 65, "Medium", "")}, {"CCTV1": frame})
+    assert [event for event, _ in _events(state_events(store.snapshot(), sent, "en"))] == ["alarm"]
+
+
+def test_stream_locale_falls_back_to_the_default():
+    assert stream_locale("ko") == "ko"
+    assert stream_locale("xx") == stream_locale(None)
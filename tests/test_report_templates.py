@@ -0,0 +1,69 @@
+import pytest
+
+from config import LOCALES
+from report_templates import (
+    OVERRIDE_DESCRIPTION_KEY,
+    compile_template,
+    render_report,
+    render_template,
+    resolve_description,
+)
+from results import MockResult
+
+
+def test_compiled_template_renders_scalars_and_lists():
+    template = compile_template("<h1>{title}</h1><ul>{items:li}</ul>\n{items:-} ({score:03d})")
+    assert template.slots == {"title", "items", "score"}
+    assert template.render({"title": "T", "items": ("a", "b"), "score": 7}) == (
+        "<h1>T</h1><ul><li>a</li>\n<li>b</li></ul>\n- a\n- b (007)"
+    )
+
+
+def test_ordered_list_format_numbers_items():
+    assert render_template("{steps:1.}", steps=("Stop", "Check")) == "1. Stop\n2. Check"
+
+
+def test_each_report_template_gets_its_own_default_lists():
+    texts = LOCALES["ko"]
+    report = render_report(texts["report_template"], "ko", "CCTV1", MockResult.create("High", 91, "High", ""))
+    assert f"- {texts['report_markdown_observations'][0]}" in report
+    assert f"4. {texts['report_markdown_actions'][3]}" in report
+    assert texts["report_observations"][0] not in report
+
+    # A result's own items fill both templates.
+    result = MockResult.create("High", 91, "High", "", observations=("Seen",), actions=("Act",))
+    markdown = render_report(LOCALES["en"]["report_template"], "en", "CCTV1", result)
+    assert "- Seen" in markdown and "1. Act" in markdown
+    assert "<li>Seen</li>" in render_report(LOCALES["en"]["report_html"], "en", "CCTV1", result)
+
+
+def test_html_items_are_escaped_except_bold_spans():
+    rendered = render_template("{items:li}", items=("**Stop** <script>x</script> & go",))
+    assert rendered == "<li><strong>Stop</strong> &lt;script&gt;x&lt;/script&gt; &amp; go</li>"
+    # Markdown lists keep the markup as written.
+    assert render_template("{items:-}", items=("**Stop**",)) == "- **Stop**"
+
+
+def test_values_without_a_slot_are_ignored():
+    assert render_template("{a}", a=1, b=2) == "1"
+
+
+@pytest.mark.parametrize("locale", list(LOCALES))
+def test_every_locale_renders_both_report_templates(locale):
+    texts = LOCALES[locale]
+    result = MockResult.create("High", 91, "High", "")
+    html_report = render_report(texts["report_html"], locale, "CCTV7", result)
+    markdown_report = render_report(texts["report_template"], locale, "CCTV7", result)
+    assert "CCTV7" in markdown_report
+    for report in (html_report, markdown_report):
+        assert "91" in report
+        assert texts["level_labels"]["High"] in report
+        assert "{" not in report
+    assert "<li>" in html_report and "**" not in html_report
+
+
+def test_resolve_description_maps_keys_and_passes_text_through():
+    texts = LOCALES["ko"]
+    assert resolve_description("High", "ko") == texts["risk_level_descriptions"]["High"]
+    assert resolve_description(OVERRIDE_DESCRIPTION_KEY, "ko") == texts["override_description"]
+    assert resolve_description("A forklift is reversing.", "ko") == "A forklift is reversing."
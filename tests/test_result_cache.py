@@ -0,0 +1,47 @@
+import time
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from result_cache import FrameHasher, ResultCache, exact_hash, perceptual_hash
+
+
+def _gradient(noise: int = 0, seed: int = 0) -> Image.Image:
+    rng = np.random.default_rng(seed)
+    pixels = np.tile(np.linspace(0, 200, 64, dtype=np.float32), (48, 1))
+    pixels += rng.integers(0, noise + 1, size=pixels.shape)
+    return Image.fromarray(pixels.astype(np.uint8)).convert("RGB")
+
+
+def test_perceptual_hash_ignores_noise_exact_hash_does_not():
+    clean, noisy = _gradient(), _gradient(noise=3, seed=1)
+    assert perceptual_hash(clean) == perceptual_hash(noisy)
+    assert exact_hash(clean) != exact_hash(noisy)
+    assert perceptual_hash(clean) != perceptual_hash(clean.transpose(Image.Transpose.FLIP_LEFT_RIGHT))
+
+
+def test_frame_hasher_memoizes_per_image_object():
+    hasher = FrameHasher("exact")
+    image = _gradient()
+    digest = hasher(image)
+    assert digest == f"exact:{exact_hash(image)}"
+    assert hasher(image) is digest
+    with pytest.raises(ValueError):
+        FrameHasher("md5")
+
+
+def test_result_cache_evicts_least_recently_used_and_expired_entries(monkeypatch):
+    cache = ResultCache(max_entries=2, ttl_seconds=10)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert cache.get("a") is None
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (3, 2)
@@ -0,0 +1,28 @@
+import numpy as np
+
+from config import LOCALES
+from results import AlarmLevel, build_results, classify_scores, level_css_classes, level_labels
+
+
+def test_classify_scores_uses_the_given_bounds():
+    scores = np.array([0, 59, 60, 74, 75, 100])
+    assert classify_scores(scores, (60, 75)).tolist() == [0, 0, 1, 1, 2, 2]
+    assert classify_scores(scores, (50, 60)).tolist() == [0, 1, 2, 2, 2, 2]
+
+
+def test_labels_and_css_classes_for_a_batch_of_codes():
+    codes = np.array([2, 0, 1, 2], dtype=np.uint8)
+    assert level_labels(codes).tolist() == ["High", "Low", "Medium", "High"]
+    ko = LOCALES["ko"]["level_labels"]
+    assert level_labels(codes, "ko").tolist() == [ko["High"], ko["Low"], ko["Medium"], ko["High"]]
+    assert level_css_classes(codes).tolist() == ["alarm-high", "alarm-low", "alarm-medium", "alarm-high"]
+
+
+def test_build_results_classifies_the_batch_together():
+    descriptions = {level.label: level.label.lower() for level in AlarmLevel}
+    results = build_results([10, 65, 90], descriptions, "report")
+    assert [(r.level, r.description) for r in results] == [
+        (AlarmLevel.LOW, "low"),
+        (AlarmLevel.MEDIUM, "medium"),
+        (AlarmLevel.HIGH, "high"),
+    ]
@@ -0,0 +1,95 @@
+import os
+import time
+
+import pytest
+
+from results import AlarmLevel, MockResult, level_from_score
+from rules import NO_RULE, RuleSet, RulesEngine
+
+
+DESCRIPTIONS = {level.label: level.label for level in AlarmLevel}
+RULES = {
+    "default": {"thresholds": [60, 75]},
+    "zones": {
+        "loading-dock": {
+            "cameras": ["CCTV3"],
+            "thresholds": [50, 70],
+            "suppress": [{"start": "22:00", "end": "06:00", "max_level": "Low", "days": ["sat", "sun"]}],
+        }
+    },
+    "cameras": {"CCTV2": {"override": {"level": "Medium", "score": 68}}},
+}
+# Local times: a Saturday night inside the suppression window, and a Monday night outside it.
+SATURDAY_NIGHT = time.mktime((2026, 10, 17, 23, 0, 0, 0, 0, -1))
+MONDAY_NIGHT = time.mktime((2026, 10, 19, 23, 0, 0, 0, 0, -1))
+
+
+def _apply(rules: RuleSet, scores: dict[str, int], now: float) -> dict[str, tuple[str, int, str]]:
+    results = {
+        cctv_id: MockResult.create(level_from_score(score, (60, 75)), score, "scored", "")
+        for cctv_id, score in scores.items()
+    }
+    applied = rules.apply(results, DESCRIPTIONS, "", "override", now)
+    return {cctv_id: (r.alarm_level, r.risk_score, r.description) for cctv_id, r in applied.items()}
+
+
+def test_camera_rule_merges_default_zone_and_camera_entry():
+    rules = RuleSet.compile(RULES, zones={"CCTV4": "loading-dock"})
+    assert rules.thresholds("CCTV1") == (60, 75)
+    # Listed in the zone, and placed in it by the registry.
+    assert rules.thresholds("CCTV3") == (50, 70)
+    assert rules.thresholds("CCTV4") == (50, 70)
+    assert rules.rule("CCTV2").override_level is AlarmLevel.MEDIUM
+    assert rules.rule("CCTV2").thresholds == (60, 75)
+
+
+def test_apply_overrides_rebands_and_suppresses():
+    rules = RuleSet.compile(RULES)
+    applied = _apply(rules, {"CCTV1": 72, "CCTV2": 10, "CCTV3": 72}, MONDAY_NIGHT)
+    assert applied == {
+        "CCTV1": ("Medium", 72, "scored"),
+        "CCTV2": ("Medium", 68, "override"),
+        "CCTV3": ("High", 72, "High"),
+    }
+    assert _apply(rules, {"CCTV3": 72}, SATURDAY_NIGHT) == {"CCTV3": ("Low", 72, "Low")}
+
+
+def test_cameras_without_rules_keep_their_result_object():
+    rules = RuleSet.compile({"cameras": {"CCTV2": {"thresholds": [10, 20]}}})
+    result = MockResult.create("High", 90, "scored", "")
+    assert rules.rule("CCTV1") is NO_RULE
+    assert rules.apply({"CCTV1": result}, DESCRIPTIONS, "", "override")["CCTV1"] is result
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"default": {"thresholds": [80, 70]}},
+        {"default": {"thresholds": [60, 75], "colour": "red"}},
+        {"cameras": {"CCTV1": {"override": {"level": "Severe"}}}},
+        {"default": {"suppress": [{"start": "25:00", "end": "06:00"}]}},
+        {"default": {"suppress": [{"start": "22:00", "end": "06:00", "days": ["someday"]}]}},
+    ],
+)
+def test_invalid_rules_are_rejected(data):
+    with pytest.raises(ValueError):
+        RuleSet.compile(data)
+
+
+def test_engine_reloads_changes_and_keeps_rules_after_a_bad_edit(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text('{"default": {"thresholds": [10, 20]}}')
+    engine = RulesEngine(str(path), check_seconds=0)
+    assert engine.current().thresholds("CCTV1") == (10, 20)
+
+    path.write_text('{"default": {"thresholds": [30, 40]}}')
+    assert engine.current().thresholds("CCTV1") == (30, 40)
+
+    path.write_text('{"default": {"thresholds": [30, 40]')
+    os.utime(path, ns=(0, 1))
+    assert engine.current().thresholds("CCTV1") == (30, 40)
+    assert isinstance(engine.last_error, ValueError)
+
+    path.unlink()
+    assert engine.current().rule("CCTV1") is NO_RULE
+    assert engine.last_error is None
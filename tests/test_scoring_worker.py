@@ -0,0 +1,93 @@
+from frame_cache import CameraFrame
+from results import MockResult
+from scoring_worker import ResultStore, ScoringWorker
+
+
+def _frame(version: int = 1) -> CameraFrame:
+    return CameraFrame(image=None, source="cam.jpg", version=version)
+
+
+def _result(level: str, score: int) -> MockResult:
+    return MockResult.create(level, score, level, "")
+
+
+def test_publish_tracks_changes_levels_and_offline_cameras():
+    store = ResultStore()
+    store.publish({"CCTV1": _result("Low", 10), "CCTV2": _result("High", 90)}, {"CCTV1": _frame(), "CCTV2": _frame()})
+    assert store.ranked() == ("CCTV2", "CCTV1")
+    assert store.level_version == 1
+
+    # Same result and frame: updated, but not changed; no level moved.
+    store.publish({"CCTV1": _result("Low", 10)}, {"CCTV1": _frame()})
+    snapshot = store.snapshot()["CCTV1"]
+    assert (snapshot.version, snapshot.changed_version) == (2, 1)
+    assert store.level_version == 1
+
+    # A new frame is a change even with the same result.
+    store.publish({"CCTV1": _result("Low", 10)}, {"CCTV1": _frame(2)})
+    assert store.snapshot()["CCTV1"].changed_version == 3
+    assert store.level_version == 1
+
+    store.publish({}, {}, offline=["CCTV2"])
+    assert "CCTV2" not in store.snapshot()
+    assert store.offline() == {"CCTV2"}
+    assert store.level_version == 2
+    assert store.ranked() == ("CCTV1",)
+
+    store.publish({"CCTV2": _result("Medium", 65)}, {"CCTV2": _frame()})
+    assert store.offline() == frozenset()
+    assert store.wait_for_update(0, timeout=0) == 5
+
+
+class _Fleet:
+    """Frames and scores for a fixed fleet, recording every load."""
+
+    def __init__(self, camera_ids: list[str], offline: tuple[str, ...] = ()) -> None:
+        self.camera_ids = camera_ids
+        self.offline = offline
+        self.loads: list[list[str]] = []
+
+    def load(self, ids: list[str] | None) -> dict[str, CameraFrame | None]:
+        ids = self.camera_ids if ids is None else ids
+        self.loads.append(list(ids))
+        return {camera_id: None if camera_id in self.offline else _frame() for camera_id in ids}
+
+    def score(self, frames: dict[str, CameraFrame]) -> dict[str, MockResult]:
+        return {camera_id: _result("Low", 10) for camera_id in frames}
+
+
+def test_pass_runs_in_chunks_and_serves_requests_between_them():
+    fleet = _Fleet([f"CCTV{i}" for i in range(1, 8)], offline=("CCTV7",))
+    worker = ScoringWorker(fleet.load, fleet.score, camera_ids=lambda: fleet.camera_ids, chunk_size=3)
+    worker.request(["CCTV6", "CCTV7"])
+    worker.run_once()
+
+    assert fleet.loads == [["CCTV6", "CCTV7"], ["CCTV1", "CCTV2", "CCTV3"], ["CCTV4", "CCTV5", "CCTV6"], ["CCTV7"]]
+    assert sorted(worker.store.snapshot()) == [f"CCTV{i}" for i in range(1, 7)]
+    assert worker.store.offline() == {"CCTV7"}
+
+
+def test_request_skips_cameras_already_known():
+    fleet = _Fleet(["CCTV1", "CCTV2", "CCTV3"], offline=("CCTV2",))
+    worker = ScoringWorker(fleet.load, fleet.score)
+    worker.run_once()
+    assert fleet.loads == [["CCTV1", "CCTV2", "CCTV3"]]
+
+    worker.request(["CCTV1", "CCTV2", "CCTV4"])
+    worker.serve_requests()
+    assert fleet.loads[1:] == [["CCTV4"]]
+    worker.serve_requests()
+    assert len(fleet.loads) == 2
+
+
+def test_requests_wake_the_running_worker():
+    fleet = _Fleet(["CCTV1"])
+    worker = ScoringWorker(fleet.load, fleet.score, interval=3600)
+    worker.start()
+    try:
+        version = worker.store.wait_for_update(0, timeout=5)
+        worker.request(["CCTV2"])
+        worker.store.wait_for_update(version, timeout=5)
+        assert "CCTV2" in worker.store.snapshot()
+    finally:
+        worker.stop()
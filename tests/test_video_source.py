@@ -0,0 +1,93 @@
+import io
+import struct
+import time
+
+import pytest
+from PIL import Image
+
+from frame_cache import load_camera_frame
+from video_source import VideoSource, open_video, sample_video
+
+
+decord = pytest.importorskip("decord")
+
+FRAME_COUNT = 6
+FPS = 10
+
+
+def _chunk(fourcc: bytes, data: bytes) -> bytes:
+    return fourcc + struct.pack("<I", len(data)) + data + b"\0" * (len(data) % 2)
+
+
+def _list(kind: bytes, data: bytes) -> bytes:
+    return _chunk(b"LIST", kind + data)
+
+
+def _write_mjpeg_avi(path, count: int = FRAME_COUNT, size: tuple[int, int] = (64, 48)) -> None:
+    """A minimal Motion-JPEG AVI: there is no video encoder to depend on here, only Pillow."""
+    width, height = size
+    frames = []
+    for i in range(count):
+        buffer = io.BytesIO()
+        Image.new("RGB", size, (i * 40 % 256, 80, 160)).save(buffer, format="JPEG")
+        frames.append(buffer.getvalue())
+    movi, index, offset = b"", b"", 4
+    for frame in frames:
+        chunk = _chunk(b"00dc", frame)
+        index += b"00dc" + struct.pack("<III", 0x10, offset, len(frame))
+        movi += chunk
+        offset += len(chunk)
+    biggest = max(map(len, frames))
+    avih = struct.pack("<14I", 1_000_000 // FPS, 0, 0, 0x10, count, 0, 1, biggest, width, height, 0, 0, 0, 0)
+    strh = b"vidsMJPG" + struct.pack("<IHHIIIIIIII4h", 0, 0, 0, 0, 1, FPS, 0, count, biggest, 0, 0, 0, 0, width, height)
+    strf = struct.pack("<IiiHH4sIiiII", 40, width, height, 1, 24, b"MJPG", width * height * 3, 0, 0, 0, 0)
+    hdrl = _list(b"hdrl", _chunk(b"avih", avih) + _list(b"strl", _chunk(b"strh", strh) + _chunk(b"strf", strf)))
+    body = b"AVI " + hdrl + _list(b"movi", movi) + _chunk(b"idx1", index)
+    path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+
+
+@pytest.fixture
+def video_path(tmp_path):
+    path = tmp_path / "camera.avi"
+    _write_mjpeg_avi(path)
+    return path
+
+
+def test_sample_video_reads_every_frame_of_a_local_file(video_path):
+    sampled = list(sample_video(open_video(str(video_path)), sample_fps=FPS, keyframes_only=False))
+    assert [index for index, _, _ in sampled] == list(range(FRAME_COUNT))
+    assert sampled[0][2].shape == (48, 64, 3)
+
+
+def test_sequence_keeps_increasing_when_the_file_loops(video_path):
+    source = VideoSource(str(video_path), sample_fps=FPS, buffer_size=64, realtime=False).start()
+    try:
+        deadline = time.monotonic() + 10
+        # Two full loops and then some.
+        while time.monotonic() < deadline:
+            latest = source.latest()
+            if latest is not None and latest.sequence > 2 * FRAME_COUNT:
+                break
+            time.sleep(0.01)
+    finally:
+        source.stop()
+    frames = source.recent()
+    assert source.error is None
+    # Indexes restart on every loop; sequence numbers never repeat.
+    assert len({frame.index for frame in frames}) < len(frames)
+    sequences = [frame.sequence for frame in frames]
+    assert sequences == sorted(set(sequences))
+
+
+def test_camera_frame_version_follows_the_sequence(video_path, monkeypatch):
+    source = VideoSource(str(video_path), sample_fps=FPS, realtime=False)
+    monkeypatch.setattr("frame_cache.get_video_source", lambda uri: source)
+    source.start()
+    try:
+        first = load_camera_frame(str(video_path), timeout=5)
+        time.sleep(0.2)
+        later = load_camera_frame(str(video_path), timeout=5)
+    finally:
+        source.stop()
+    assert first.is_video and first.version >= 1
+    assert later.version > first.version
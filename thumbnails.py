@@ -0,0 +1,101 @@
+"""Downscaled, pre-encoded CCTV thumbnails memoized per source file version."""
+
+import io
+import math
+import threading
+
+from PIL import Image, features
+
+from config import (
+    THUMBNAIL_BOX,
+    THUMBNAIL_CACHE_MAX_BYTES,
+    THUMBNAIL_FORMAT,
+    THUMBNAIL_QUALITY,
+)
+from frame_cache import CameraFrame, LRUByteCache
+from metrics import register_cache
+
+
+def _cover_size(size: tuple[int, int], box: tuple[int, int]) -> tuple[int, int]:
+    # The view crops with `object-fit: cover`, so the thumbnail must cover the box, not fit in it.
+    width, height = size
+    scale = min(1.0, max(box[0] / width, box[1] / height))
+    return max(1, math.ceil(width * scale)), max(1, math.ceil(height * scale))
+
+
+def _resolve_format(fmt: str) -> str:
+    fmt = fmt.upper()
+    if fmt == "WEBP" and not features.check("webp"):
+        return "JPEG"
+    return fmt
+
+
+def encode_thumbnail(path: str, box: tuple[int, int], fmt: str, quality: int) -> bytes:
+    with Image.open(path) as source:
+        target = _cover_size(source.size, box)
+        # JPEG sources decode straight at 1/2, 1/4 or 1/8 scale; a no-op for other formats.
+        source.draft("RGB", target)
+        image = source.convert("RGB")
+    return encode_image_thumbnail(image, box, fmt, quality)
+
+
+def encode_image_thumbnail(image: Image.Image, box: tuple[int, int], fmt: str, quality: int) -> bytes:
+    target = _cover_size(image.size, box)
+    if target != image.size:
+        # reducing_gap lets Pillow do a cheap integer reduce() before the final resample.
+        image = image.resize(target, Image.Resampling.BILINEAR, reducing_gap=2.0)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format=_resolve_format(fmt), quality=quality)
+    return buffer.getvalue()
+
+
+class ThumbnailCache:
+    """Encoded thumbnail bytes keyed by frame source/version and the encode settings.
+
+    Still images are keyed by (path, mtime, size) and re-read through the fast draft
+    path; video frames are encoded from the already decoded sample.
+    """
+
+    def __init__(
+        self,
+        box: tuple[int, int] = THUMBNAIL_BOX,
+        fmt: str = THUMBNAIL_FORMAT,
+        quality: int = THUMBNAIL_QUALITY,
+        max_bytes: int = THUMBNAIL_CACHE_MAX_BYTES,
+    ) -> None:
+        self.box = box
+        self.fmt = fmt
+        self.quality = quality
+        self._lru: LRUByteCache[bytes] = LRUByteCache(max_bytes)
+
+    @property
+    def stats(self) -> LRUByteCache[bytes]:
+        return self._lru
+
+    def get(self, frame: CameraFrame) -> bytes:
+        key = (frame.source, frame.version, self.box, self.fmt, self.quality)
+        data = self._lru.get(key)
+        if data is None:
+            if frame.is_video:
+                data = encode_image_thumbnail(frame.image, self.box, self.fmt, self.quality)
+            else:
+                data = encode_thumbnail(frame.source, self.box, self.fmt, self.quality)
+            self._lru.put(key, data, len(data))
+        return data
+
+
+_thumbnail_cache: ThumbnailCache | None = None
+_thumbnail_cache_lock = threading.Lock()
+
+
+def get_thumbnail_cache() -> ThumbnailCache:
+    global _thumbnail_cache
+    if _thumbnail_cache is None:
+        with _thumbnail_cache_lock:
+            if _thumbnail_cache is None:
+                _thumbnail_cache = ThumbnailCache()
+                register_cache(
+                    "thumbnails", lambda: _thumbnail_cache.stats.hits, lambda: _thumbnail_cache.stats.misses
+                )
+    return _thumbnail_cache
@@ -0,0 +1,177 @@
+"""Video file and stream camera sources decoded with decord into per-camera ring buffers."""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from PIL import Image
+
+from config import (
+    VIDEO_BUFFER_SIZE,
+    VIDEO_DECODE_HEIGHT,
+    VIDEO_DECODE_THREADS,
+    VIDEO_DECODE_WIDTH,
+    VIDEO_KEYFRAMES_ONLY,
+    VIDEO_RECONNECT_SECONDS,
+    VIDEO_SAMPLE_FPS,
+)
+
+
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mkv", ".mov", ".webm", ".ts")
+STREAM_SCHEMES = ("rtsp://", "rtsps://", "rtmp://", "http://", "https://")
+
+
+def is_stream_uri(source: str) -> bool:
+    return source.lower().startswith(STREAM_SCHEMES)
+
+
+def is_video_source(source: str) -> bool:
+    return is_stream_uri(source) or source.lower().endswith(VIDEO_EXTENSIONS)
+
+
+def open_video(uri: str) -> Any:
+    from decord import VideoReader, cpu
+
+    return VideoReader(
+        uri,
+        ctx=cpu(0),
+        width=VIDEO_DECODE_WIDTH,
+        height=VIDEO_DECODE_HEIGHT,
+        num_threads=VIDEO_DECODE_THREADS,
+    )
+
+
+def sample_video(reader: Any, sample_fps: float, keyframes_only: bool) -> Iterator[tuple[int, float, np.ndarray]]:
+    """Yield `(frame index, seconds, HWC array)` at `sample_fps`, or at keyframes only."""
+    fps = reader.get_avg_fps() or 25.0
+    if keyframes_only:
+        for index in reader.get_key_indices():
+            # Seeking to a keyframe needs no decode of the frames in between.
+            yield int(index), int(index) / fps, reader[int(index)].asnumpy()
+        return
+
+    step = max(1, round(fps / sample_fps))
+    index = 0
+    while True:
+        try:
+            array = reader.next().asnumpy()
+        except StopIteration:
+            return
+        yield index, index / fps, array
+        if step > 1:
+            reader.skip_frames(step - 1)
+        index += step
+
+
+@dataclass(frozen=True)
+class SampledFrame:
+    # Frame index within the video; restarts whenever a file loops or a stream reconnects.
+    index: int
+    # Per-source count of sampled frames, increasing across loops and reconnects.
+    sequence: int
+    # Position in the video (seconds) and wall-clock time it was decoded.
+    timestamp: float
+    captured_at: float
+    image: Image.Image
+
+
+class VideoSource:
+    """Background decoder sampling a video at `sample_fps` (or keyframes only).
+
+    Only the sampled frames are converted to images, so decode cost follows the
+    sampling rate rather than the source frame rate. Files are paced in real time
+    and looped so they behave like a live camera; streams reconnect on failure.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        sample_fps: float = VIDEO_SAMPLE_FPS,
+        keyframes_only: bool = VIDEO_KEYFRAMES_ONLY,
+        buffer_size: int = VIDEO_BUFFER_SIZE,
+        realtime: bool | None = None,
+        loop: bool = True,
+    ) -> None:
+        self.uri = uri
+        self.sample_fps = sample_fps
+        self.keyframes_only = keyframes_only
+        self.realtime = not is_stream_uri(uri) if realtime is None else realtime
+        self.loop = loop
+        self.error: Exception | None = None
+        self._buffer: deque[SampledFrame] = deque(maxlen=buffer_size)
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._has_frame = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "VideoSource":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"video-source:{self.uri}", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def latest(self, timeout: float = 0.0) -> SampledFrame | None:
+        if timeout > 0:
+            self._has_frame.wait(timeout)
+        with self._lock:
+            return self._buffer[-1] if self._buffer else None
+
+    def recent(self) -> list[SampledFrame]:
+        with self._lock:
+            return list(self._buffer)
+
+    def _play(self, reader: Any) -> None:
+        started = time.monotonic()
+        for index, timestamp, array in sample_video(reader, self.sample_fps, self.keyframes_only):
+            if self._stop.is_set():
+                return
+            if self.realtime:
+                self._stop.wait(max(0.0, started + timestamp - time.monotonic()))
+            image = Image.fromarray(array)
+            with self._lock:
+                self._sequence += 1
+                self._buffer.append(SampledFrame(index, self._sequence, timestamp, time.time(), image))
+            self._has_frame.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._play(open_video(self.uri))
+                self.error = None
+            except Exception as exc:  # decord raises its own DECORDError for unreadable sources
+                self.error = exc
+                self._stop.wait(VIDEO_RECONNECT_SECONDS)
+                continue
+            if not self.loop and not is_stream_uri(self.uri):
+                return
+
+
+_video_sources: dict[str, VideoSource] = {}
+_video_sources_lock = threading.Lock()
+
+
+def get_video_source(uri: str) -> VideoSource:
+    """Return the process-wide, already started source for `uri`."""
+    with _video_sources_lock:
+        source = _video_sources.get(uri)
+        if source is None:
+            source = _video_sources[uri] = VideoSource(uri).start()
+        return source
+
+
+def stop_video_sources() -> None:
+    with _video_sources_lock:
+        sources = list(_video_sources.values())
+        _video_sources.clear()
+    for source in sources:
+        source.stop()